@@ -24,6 +24,7 @@ from homeassistant.const import (
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import area_registry, device_registry, entity_registry
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
     DATA_SETUP,
@@ -51,6 +52,9 @@ LOG_SLOW_STARTUP_INTERVAL = 60
 SLOW_STARTUP_CHECK_INTERVAL = 1
 SIGNAL_BOOTSTRAP_INTEGRATONS = "bootstrap_integrations"
 
+STARTUP_REPORT_STORAGE_KEY = "core.startup_report"
+STARTUP_REPORT_STORAGE_VERSION = 1
+
 STAGE_1_TIMEOUT = 120
 STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
@@ -531,11 +535,16 @@ async def _async_set_up_integrations(
 
     stage_2_domains = domains_to_setup - logging_domains - debuggers - stage_1_domains
 
-    # Load the registries
+    # Load the registries, warming up the integrations meanwhile if enabled
     await asyncio.gather(
         device_registry.async_load(hass),
         entity_registry.async_load(hass),
         area_registry.async_load(hass),
+        *(
+            [loader.async_preload_integrations(hass, integration_cache.values())]
+            if hass.config.preload_integrations
+            else []
+        ),
     )
 
     # Start setup
@@ -582,3 +591,32 @@ async def _async_set_up_integrations(
             )
         },
     )
+    await _async_save_startup_report(hass)
+
+
+async def _async_save_startup_report(hass: core.HomeAssistant) -> None:
+    """Store the import and setup times of the integrations."""
+    integrations: dict[str, dict[str, Any]] = {}
+
+    def _report(domain: str) -> dict[str, Any]:
+        if domain not in integrations:
+            integrations[domain] = {"import": 0.0, "setup": None, "platforms": {}}
+        return integrations[domain]
+
+    for name, seconds in hass.data.get(loader.DATA_IMPORT_TIME, {}).items():
+        domain, _, platform = name.partition(".")
+        report = _report(domain)
+        report["import"] += seconds
+        if platform:
+            report["platforms"][platform] = round(seconds, 3)
+
+    for report in integrations.values():
+        report["import"] = round(report["import"], 3)
+
+    for domain, duration in hass.data.get(DATA_SETUP_TIME, {}).items():
+        _report(domain)["setup"] = round(duration.total_seconds(), 3)
+
+    store = Store(hass, STARTUP_REPORT_STORAGE_VERSION, STARTUP_REPORT_STORAGE_KEY)
+    await store.async_save(
+        {"created": dt_util.utcnow().isoformat(), "integrations": integrations}
+    )
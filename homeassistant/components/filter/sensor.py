@@ -1,10 +1,12 @@
 """Allows the creation of a sensor that filters state property."""
 from __future__ import annotations
 
+from array import array
 from collections import Counter, deque
 from copy import copy
 from datetime import timedelta
 from functools import partial
+from itertools import chain
 import logging
 from numbers import Number
 import statistics
@@ -40,6 +42,12 @@ import homeassistant.util.dt as dt_util
 
 from . import DOMAIN, PLATFORMS
 
+try:
+    import numpy
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError:  # pragma: no cover
+    numpy = None
+
 _LOGGER = logging.getLogger(__name__)
 
 FILTER_NAME_RANGE = "range"
@@ -240,7 +248,14 @@ class SensorFilter(SensorEntity):
             return
 
         self._state = temp_state.state
+        self._update_attributes(new_state)
+
+        if update_ha:
+            self.async_write_ha_state()
 
+    @callback
+    def _update_attributes(self, new_state):
+        """Take over the attributes of the first source states."""
         if self._icon is None:
             self._icon = new_state.attributes.get(ATTR_ICON, ICON)
 
@@ -258,9 +273,6 @@ class SensorFilter(SensorEntity):
                 ATTR_UNIT_OF_MEASUREMENT
             )
 
-        if update_ha:
-            self.async_write_ha_state()
-
     async def async_added_to_hass(self):
         """Register callbacks."""
 
@@ -321,9 +333,13 @@ class SensorFilter(SensorEntity):
             )
 
             # Replay history through the filter chain
-            for state in history_list:
-                if state.state not in [STATE_UNKNOWN, STATE_UNAVAILABLE, None]:
-                    self._update_filter_sensor_state(state, False)
+            self._replay_history(
+                [
+                    state
+                    for state in history_list
+                    if state.state not in [STATE_UNKNOWN, STATE_UNAVAILABLE, None]
+                ]
+            )
 
         self.async_on_remove(
             async_track_state_change_event(
@@ -331,6 +347,32 @@ class SensorFilter(SensorEntity):
             )
         )
 
+    @callback
+    def _replay_history(self, states):
+        """Replay the states through the filter chain as a batch of numbers."""
+        try:
+            values = [float(state.state) for state in states]
+        except ValueError:
+            # Replay one state at a time so states that are not numbers are
+            # handled like live states
+            for state in states:
+                self._update_filter_sensor_state(state, False)
+            return
+
+        timestamps = [state.last_updated.timestamp() for state in states]
+        indices = list(range(len(states)))
+        for filt in self._filters:
+            kept, values = filt.filter_batch(timestamps, values)
+            indices = [indices[idx] for idx in kept]
+            timestamps = [timestamps[idx] for idx in kept]
+
+        if not indices:
+            return
+
+        self._state = values[-1]
+        for idx in indices:
+            self._update_attributes(states[idx])
+
     @property
     def name(self):
         """Return the name of the sensor."""
@@ -380,9 +422,7 @@ class FilterState:
 
     def set_precision(self, precision):
         """Set precision of Number based states."""
-        if isinstance(self.state, Number):
-            value = round(float(self.state), precision)
-            self.state = int(value) if precision == 0 else value
+        self.state = _round(self.state, precision)
 
     def __str__(self):
         """Return state as the string representation of FilterState."""
@@ -393,6 +433,66 @@ class FilterState:
         return f"{self.timestamp} : {self.state}"
 
 
+def _round(value, precision):
+    """Round Number based values to precision."""
+    if isinstance(value, Number):
+        value = round(float(value), precision)
+        return int(value) if precision == 0 else value
+    return value
+
+
+class RingBuffer:
+    """Fixed size window of numbers stored in a compact array.
+
+    Once the buffer is full, appending a number overwrites the oldest one.
+    """
+
+    def __init__(self, maxlen: int):
+        """Initialize the buffer."""
+        self.maxlen = maxlen
+        self._data = array("d", bytes(8 * maxlen))
+        self._start = 0
+        self._len = 0
+
+    def __len__(self):
+        """Return the number of values in the buffer."""
+        return self._len
+
+    def __getitem__(self, index: int) -> float:
+        """Return the value at index, from the oldest to the newest."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("RingBuffer index out of range")
+        return self._data[(self._start + index) % self.maxlen]
+
+    def __iter__(self):
+        """Iterate from the oldest to the newest value."""
+        end = self._start + self._len
+        if end <= self.maxlen:
+            return iter(self._data[self._start : end])
+        return chain(self._data[self._start :], self._data[: end - self.maxlen])
+
+    def append(self, value: float) -> None:
+        """Add a value, overwriting the oldest value if the buffer is full."""
+        if not self.maxlen:
+            return
+        self._data[(self._start + self._len) % self.maxlen] = value
+        if self._len < self.maxlen:
+            self._len += 1
+        else:
+            self._start = (self._start + 1) % self.maxlen
+
+    def extend(self, values) -> None:
+        """Add the values in order."""
+        for value in values[-self.maxlen :] if self.maxlen else ():
+            self.append(value)
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._start = self._len = 0
+
+
 class Filter:
     """Filter skeleton."""
 
@@ -410,10 +510,10 @@ class Filter:
         :param entity: used for debugging only
         """
         if isinstance(window_size, int):
-            self.states: deque = deque(maxlen=window_size)
+            self.states = RingBuffer(window_size)
             self.window_unit = WINDOW_SIZE_UNIT_NUMBER_EVENTS
         else:
-            self.states = deque(maxlen=0)
+            self.states = RingBuffer(0)
             self.window_unit = WINDOW_SIZE_UNIT_TIME
         self.precision = precision
         self._name = name
@@ -421,6 +521,7 @@ class Filter:
         self._skip_processing = False
         self._window_size = window_size
         self._store_raw = False
+        self._store_states = True
         self._only_numbers = True
 
     @property
@@ -438,8 +539,11 @@ class Filter:
         """Return whether the current filter_state should be skipped."""
         return self._skip_processing
 
-    def _filter_state(self, new_state):
-        """Implement filter."""
+    def _filter_value(self, timestamp, value):
+        """Implement filter.
+
+        :param timestamp: POSIX timestamp of the value
+        """
         raise NotImplementedError()
 
     def filter_state(self, new_state):
@@ -448,15 +552,32 @@ class Filter:
         if self._only_numbers and not isinstance(fstate.state, Number):
             raise ValueError(f"State <{fstate.state}> is not a Number")
 
-        filtered = self._filter_state(fstate)
-        filtered.set_precision(self.precision)
-        if self._store_raw:
-            self.states.append(copy(FilterState(new_state)))
-        else:
-            self.states.append(copy(filtered))
-        new_state.state = filtered.state
+        filtered = _round(
+            self._filter_value(fstate.timestamp.timestamp(), fstate.state),
+            self.precision,
+        )
+        if self._store_states:
+            self.states.append(fstate.state if self._store_raw else filtered)
+        new_state.state = filtered
         return new_state
 
+    def filter_batch(self, timestamps, values):
+        """Filter a batch of numbers in the order they were recorded.
+
+        Return the positions of the values that are not skipped and their
+        filtered values.
+        """
+        kept = []
+        filtered_values = []
+        for idx, (timestamp, value) in enumerate(zip(timestamps, values)):
+            filtered = _round(self._filter_value(timestamp, value), self.precision)
+            if self._store_states:
+                self.states.append(value if self._store_raw else filtered)
+            if not self._skip_processing:
+                kept.append(idx)
+                filtered_values.append(filtered)
+        return kept, filtered_values
+
 
 @FILTERS.register(FILTER_NAME_RANGE)
 class RangeFilter(Filter, SensorEntity):
@@ -483,10 +604,10 @@ class RangeFilter(Filter, SensorEntity):
         self._upper_bound = upper_bound
         self._stats_internal: Counter = Counter()
 
-    def _filter_state(self, new_state):
+    def _filter_value(self, timestamp, value):
         """Implement the range filter."""
 
-        if self._upper_bound is not None and new_state.state > self._upper_bound:
+        if self._upper_bound is not None and value > self._upper_bound:
 
             self._stats_internal["erasures_up"] += 1
 
@@ -494,11 +615,11 @@ class RangeFilter(Filter, SensorEntity):
                 "Upper outlier nr. %s in %s: %s",
                 self._stats_internal["erasures_up"],
                 self._entity,
-                new_state,
+                value,
             )
-            new_state.state = self._upper_bound
+            value = self._upper_bound
 
-        elif self._lower_bound is not None and new_state.state < self._lower_bound:
+        elif self._lower_bound is not None and value < self._lower_bound:
 
             self._stats_internal["erasures_low"] += 1
 
@@ -506,11 +627,32 @@ class RangeFilter(Filter, SensorEntity):
                 "Lower outlier nr. %s in %s: %s",
                 self._stats_internal["erasures_low"],
                 self._entity,
-                new_state,
+                value,
             )
-            new_state.state = self._lower_bound
+            value = self._lower_bound
 
-        return new_state
+        return value
+
+    def filter_batch(self, timestamps, values):
+        """Filter a batch of numbers with NumPy if it is available."""
+        if numpy is None or not values:
+            return super().filter_batch(timestamps, values)
+
+        data = numpy.asarray(values, dtype=float)
+        upper = numpy.zeros(len(data), dtype=bool)
+        lower = numpy.zeros(len(data), dtype=bool)
+        if self._upper_bound is not None:
+            upper = data > self._upper_bound
+            data = numpy.where(upper, self._upper_bound, data)
+        if self._lower_bound is not None:
+            lower = ~upper & (data < self._lower_bound)
+            data = numpy.where(lower, self._lower_bound, data)
+        self._stats_internal["erasures_up"] += int(upper.sum())
+        self._stats_internal["erasures_low"] += int(lower.sum())
+
+        filtered_values = [_round(value, self.precision) for value in data.tolist()]
+        self.states.extend(filtered_values)
+        return list(range(len(filtered_values))), filtered_values
 
 
 @FILTERS.register(FILTER_NAME_OUTLIER)
@@ -530,13 +672,13 @@ class OutlierFilter(Filter, SensorEntity):
         self._stats_internal: Counter = Counter()
         self._store_raw = True
 
-    def _filter_state(self, new_state):
+    def _filter_value(self, timestamp, value):
         """Implement the outlier filter."""
 
-        median = statistics.median([s.state for s in self.states]) if self.states else 0
+        median = statistics.median(self.states) if self.states else 0
         if (
             len(self.states) == self.states.maxlen
-            and abs(new_state.state - median) > self._radius
+            and abs(value - median) > self._radius
         ):
 
             self._stats_internal["erasures"] += 1
@@ -545,10 +687,42 @@ class OutlierFilter(Filter, SensorEntity):
                 "Outlier nr. %s in %s: %s",
                 self._stats_internal["erasures"],
                 self._entity,
-                new_state,
+                value,
             )
-            new_state.state = median
-        return new_state
+            value = median
+        return value
+
+    def filter_batch(self, timestamps, values):
+        """Filter a batch of numbers with NumPy if it is available.
+
+        The medians of all the windows are computed at once over a sliding
+        window view of the previous and the new values.
+        """
+        window = self.states.maxlen
+        if numpy is None or not values or not window:
+            return super().filter_batch(timestamps, values)
+
+        previous = list(self.states)
+        data = numpy.asarray(previous + list(values), dtype=float)
+        raw = data[len(previous) :]
+        filtered = raw.copy()
+        # Values are only filtered once the window is full, the median of
+        # data[i - window:i] is used for the value at data[i]
+        first = max(window - len(previous), 0)
+        if first < len(raw):
+            medians = numpy.median(
+                sliding_window_view(data[:-1], window)[
+                    len(previous) + first - window :
+                ],
+                axis=1,
+            )
+            outliers = numpy.abs(raw[first:] - medians) > self._radius
+            filtered[first:] = numpy.where(outliers, medians, raw[first:])
+            self._stats_internal["erasures"] += int(outliers.sum())
+
+        self.states.extend(raw.tolist())
+        filtered_values = [_round(value, self.precision) for value in filtered.tolist()]
+        return list(range(len(filtered_values))), filtered_values
 
 
 @FILTERS.register(FILTER_NAME_LOWPASS)
@@ -560,19 +734,15 @@ class LowPassFilter(Filter, SensorEntity):
         super().__init__(FILTER_NAME_LOWPASS, window_size, precision, entity)
         self._time_constant = time_constant
 
-    def _filter_state(self, new_state):
+    def _filter_value(self, timestamp, value):
         """Implement the low pass filter."""
 
         if not self.states:
-            return new_state
+            return value
 
         new_weight = 1.0 / self._time_constant
         prev_weight = 1.0 - new_weight
-        new_state.state = (
-            prev_weight * self.states[-1].state + new_weight * new_state.state
-        )
-
-        return new_state
+        return prev_weight * self.states[-1] + new_weight * value
 
 
 @FILTERS.register(FILTER_NAME_TIME_SMA)
@@ -590,35 +760,34 @@ class TimeSMAFilter(Filter, SensorEntity):
         :param type: type of algorithm used to connect discrete values
         """
         super().__init__(FILTER_NAME_TIME_SMA, window_size, precision, entity)
-        self._time_window = window_size
+        self._time_window = window_size.total_seconds()
         self.last_leak = None
+        # (timestamp, value) tuples of the values in the window
         self.queue = deque()
 
     def _leak(self, left_boundary):
         """Remove timeouted elements."""
         while self.queue:
-            if self.queue[0].timestamp + self._time_window <= left_boundary:
+            if self.queue[0][0] + self._time_window <= left_boundary:
                 self.last_leak = self.queue.popleft()
             else:
                 return
 
-    def _filter_state(self, new_state):
+    def _filter_value(self, timestamp, value):
         """Implement the Simple Moving Average filter."""
 
-        self._leak(new_state.timestamp)
-        self.queue.append(copy(new_state))
+        self._leak(timestamp)
+        self.queue.append((timestamp, value))
 
         moving_sum = 0
-        start = new_state.timestamp - self._time_window
-        prev_state = self.last_leak or self.queue[0]
-        for state in self.queue:
-            moving_sum += (state.timestamp - start).total_seconds() * prev_state.state
-            start = state.timestamp
-            prev_state = state
+        start = timestamp - self._time_window
+        prev_value = (self.last_leak or self.queue[0])[1]
+        for state_timestamp, state_value in self.queue:
+            moving_sum += (state_timestamp - start) * prev_value
+            start = state_timestamp
+            prev_value = state_value
 
-        new_state.state = moving_sum / self._time_window.total_seconds()
-
-        return new_state
+        return moving_sum / self._time_window
 
 
 @FILTERS.register(FILTER_NAME_THROTTLE)
@@ -632,16 +801,15 @@ class ThrottleFilter(Filter, SensorEntity):
         """Initialize Filter."""
         super().__init__(FILTER_NAME_THROTTLE, window_size, precision, entity)
         self._only_numbers = False
+        self._store_states = False
+        self._received = 0
 
-    def _filter_state(self, new_state):
+    def _filter_value(self, timestamp, value):
         """Implement the throttle filter."""
-        if not self.states or len(self.states) == self.states.maxlen:
-            self.states.clear()
-            self._skip_processing = False
-        else:
-            self._skip_processing = True
+        self._skip_processing = self._received % max(self.window_size, 1) != 0
+        self._received += 1
 
-        return new_state
+        return value
 
 
 @FILTERS.register(FILTER_NAME_TIME_THROTTLE)
@@ -654,17 +822,18 @@ class TimeThrottleFilter(Filter, SensorEntity):
     def __init__(self, window_size, precision, entity):
         """Initialize Filter."""
         super().__init__(FILTER_NAME_TIME_THROTTLE, window_size, precision, entity)
-        self._time_window = window_size
+        self._time_window = window_size.total_seconds()
         self._last_emitted_at = None
         self._only_numbers = False
+        self._store_states = False
 
-    def _filter_state(self, new_state):
+    def _filter_value(self, timestamp, value):
         """Implement the filter."""
-        window_start = new_state.timestamp - self._time_window
-        if not self._last_emitted_at or self._last_emitted_at <= window_start:
-            self._last_emitted_at = new_state.timestamp
+        window_start = timestamp - self._time_window
+        if self._last_emitted_at is None or self._last_emitted_at <= window_start:
+            self._last_emitted_at = timestamp
             self._skip_processing = False
         else:
             self._skip_processing = True
 
-        return new_state
+        return value
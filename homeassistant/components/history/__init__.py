@@ -1,14 +1,18 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Iterable
 from datetime import datetime as dt, timedelta
 from http import HTTPStatus
+import json
 import logging
+import threading
 import time
-from typing import cast
+from typing import Any, cast
 
 from aiohttp import web
+from aiohttp.hdrs import CONTENT_TYPE
 from sqlalchemy import not_, or_
 import voluptuous as vol
 
@@ -20,7 +24,13 @@ from homeassistant.components.recorder.statistics import (
     statistics_during_period,
 )
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.const import CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_INCLUDE
+from homeassistant.const import (
+    CONF_DOMAINS,
+    CONF_ENTITIES,
+    CONF_EXCLUDE,
+    CONF_INCLUDE,
+    CONTENT_TYPE_JSON,
+)
 from homeassistant.core import HomeAssistant
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.deprecation import deprecated_class, deprecated_function
@@ -28,6 +38,7 @@ from homeassistant.helpers.entityfilter import (
     CONF_ENTITY_GLOBS,
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
 )
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -37,6 +48,10 @@ _LOGGER = logging.getLogger(__name__)
 DOMAIN = "history"
 CONF_ORDER = "use_include_order"
 
+# Number of json fragments per chunk and chunks buffered while streaming
+STREAM_CHUNK_SIZE = 1000
+STREAM_QUEUE_SIZE = 4
+
 GLOB_TO_SQL_CHARS = {
     42: "%",  # *
     46: "_",  # .
@@ -120,6 +135,7 @@ class LazyState(history_models.LazyState):
         vol.Optional("end_time"): str,
         vol.Optional("statistic_ids"): [str],
         vol.Required("period"): vol.Any("hour", "5minute"),
+        vol.Optional("compact", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -154,6 +170,7 @@ async def ws_get_statistics_during_period(
         end_time,
         msg.get("statistic_ids"),
         msg.get("period"),
+        msg["compact"],
     )
     connection.send_result(msg["id"], statistics)
 
@@ -191,7 +208,7 @@ class HistoryPeriodView(HomeAssistantView):
 
     async def get(
         self, request: web.Request, datetime: str | None = None
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Return history over a period of time."""
         datetime_ = None
         if datetime:
@@ -200,6 +217,9 @@ class HistoryPeriodView(HomeAssistantView):
             if datetime_ is None:
                 return self.json_message("Invalid datetime", HTTPStatus.BAD_REQUEST)
 
+        compact = "compact" in request.query
+        empty_result: dict | list = {} if compact else []
+
         now = dt_util.utcnow()
 
         one_day = timedelta(days=1)
@@ -209,7 +229,7 @@ class HistoryPeriodView(HomeAssistantView):
             start_time = now - one_day
 
         if start_time > now:
-            return self.json([])
+            return self.json(empty_result)
 
         end_time_str = request.query.get("end_time")
         if end_time_str:
@@ -238,7 +258,21 @@ class HistoryPeriodView(HomeAssistantView):
             and entity_ids
             and not _entities_may_have_state_changes_after(hass, entity_ids, start_time)
         ):
-            return self.json([])
+            return self.json(empty_result)
+
+        # The reordering for use_include_order needs the complete result
+        if "stream" in request.query and not (self.filters and self.use_include_order):
+            return await self._async_stream_significant_states_json(
+                request,
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                compact,
+            )
 
         return cast(
             web.Response,
@@ -251,6 +285,7 @@ class HistoryPeriodView(HomeAssistantView):
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
+                compact,
             ),
         )
 
@@ -263,6 +298,7 @@ class HistoryPeriodView(HomeAssistantView):
         include_start_time_state,
         significant_changes_only,
         minimal_response,
+        compact,
     ):
         """Fetch significant stats from the database as json."""
         timer_start = time.perf_counter()
@@ -298,8 +334,123 @@ class HistoryPeriodView(HomeAssistantView):
             sorted_result.extend(result)
             result = sorted_result
 
+        if compact:
+            return self.json(
+                {
+                    state_list[0].entity_id: history.states_to_columns(state_list)
+                    for state_list in result
+                }
+            )
+
         return self.json(result)
 
+    async def _async_stream_significant_states_json(
+        self, request: web.Request, hass: HomeAssistant, *args: Any
+    ) -> web.StreamResponse:
+        """Stream significant states from the database as json.
+
+        The json is produced in the executor and handed to the event loop
+        through a bounded queue, so a slow client throttles the database
+        reads instead of buffering the response in memory.
+        """
+        response = web.StreamResponse(headers={CONTENT_TYPE: CONTENT_TYPE_JSON})
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(STREAM_QUEUE_SIZE)
+        cancel = threading.Event()
+
+        def _put(chunk: bytes | None) -> None:
+            asyncio.run_coroutine_threadsafe(queue.put(chunk), hass.loop).result()
+
+        def _produce() -> None:
+            try:
+                for chunk in self._iter_significant_states_json(hass, *args):
+                    if cancel.is_set():
+                        return
+                    _put(chunk)
+            finally:
+                _put(None)
+
+        producer = hass.async_add_executor_job(_produce)
+        try:
+            while (chunk := await queue.get()) is not None:
+                await response.write(chunk)
+        except BaseException:
+            cancel.set()
+            while await queue.get() is not None:
+                pass
+            raise
+
+        try:
+            await producer
+        except Exception:  # pylint: disable=broad-except
+            # The status has already been sent, the client will be left with
+            # an incomplete json document
+            _LOGGER.exception("Error streaming history")
+            return response
+
+        await response.write_eof()
+        return response
+
+    def _iter_significant_states_json(
+        self,
+        hass: HomeAssistant,
+        start_time: dt,
+        end_time: dt | None,
+        entity_ids: list[str] | None,
+        include_start_time_state: bool,
+        significant_changes_only: bool,
+        minimal_response: bool,
+        compact: bool,
+    ) -> Iterable[bytes]:
+        """Fetch significant states from the database as chunks of json."""
+        timer_start = time.perf_counter()
+        state_count = 0
+        separator = ""
+
+        yield b"{" if compact else b"["
+        with session_scope(hass=hass) as session:
+            for entity_id, states in history.stream_significant_states_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                self.filters,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+            ):
+                if compact:
+                    columns = history.states_to_columns(states)
+                    state_count += len(columns[history.COMPACT_STATE])
+                    yield (
+                        f"{separator}{json.dumps(entity_id)}:"
+                        f"{json.dumps(columns, cls=JSONEncoder, allow_nan=False)}"
+                    ).encode("UTF-8")
+                    separator = ","
+                    continue
+
+                parts = [separator, "["]
+                separator = ","
+                state_separator = ""
+                for state in states:
+                    parts.append(state_separator)
+                    parts.append(json.dumps(state, cls=JSONEncoder, allow_nan=False))
+                    state_separator = ","
+                    state_count += 1
+                    if len(parts) >= STREAM_CHUNK_SIZE:
+                        yield "".join(parts).encode("UTF-8")
+                        parts = []
+                parts.append("]")
+                yield "".join(parts).encode("UTF-8")
+        yield b"}" if compact else b"]"
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            elapsed = time.perf_counter() - timer_start
+            _LOGGER.debug("Streamed %d states in %fs", state_count, elapsed)
+
 
 def sqlalchemy_filter_from_include_exclude_conf(conf):
     """Build a sql filter from config."""
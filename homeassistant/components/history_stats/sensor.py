@@ -121,6 +121,16 @@ class HistoryStatsSensor(SensorEntity):
         self.value = None
         self.count = None
 
+        # Running accumulator of the tracked entity history. The cache is
+        # seeded once from the recorder and then kept up to date with the
+        # state_changed events, it holds whether the entity matched at
+        # _history_start and the (timestamp, match) transitions after it
+        self._history_start = None
+        self._history_initial = False
+        self._history_changes = []
+        # Transitions seen while the cache is not seeded
+        self._pending_changes = []
+
     async def async_added_to_hass(self):
         """Create listeners when the entity is added."""
 
@@ -133,10 +143,16 @@ class HistoryStatsSensor(SensorEntity):
                 """Force the component to refresh."""
                 self.async_schedule_update_ha_state(True)
 
+            @callback
+            def state_changed(event):
+                """Record the state change and refresh."""
+                self._async_record_state_change(event)
+                force_refresh()
+
             force_refresh()
             self.async_on_remove(
                 async_track_state_change_event(
-                    self.hass, [self._entity_id], force_refresh
+                    self.hass, [self._entity_id], state_changed
                 )
             )
 
@@ -218,30 +234,110 @@ class HistoryStatsSensor(SensorEntity):
             # Don't compute anything as the value cannot have changed
             return
 
-        await self.hass.async_add_executor_job(
-            self._update, start, end, now_timestamp, start_timestamp, end_timestamp
-        )
+        if self._history_start is None or start_timestamp < self._history_start:
+            # The window starts before the cached history, seed it again
+            seed = await self.hass.async_add_executor_job(self._load_history, start)
+            if seed is None:
+                self._pending_changes = [
+                    change
+                    for change in self._pending_changes
+                    if change[0] > start_timestamp
+                ]
+                return
+            self._seed_history(start_timestamp, *seed)
+        elif start_timestamp > self._history_start:
+            self._prune_history(start_timestamp)
+
+        self._calculate(start_timestamp, end_timestamp, now_timestamp, end.timestamp())
+
+    @callback
+    def _async_record_state_change(self, event):
+        """Add a live state change to the cached history."""
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            timestamp = event.time_fired.timestamp()
+            match = False
+        else:
+            timestamp = new_state.last_changed.timestamp()
+            match = new_state.state in self._entity_states
+
+        if self._history_start is None:
+            self._pending_changes.append((timestamp, match))
+        else:
+            self._add_change(timestamp, match)
+
+    def _add_change(self, timestamp, match):
+        """Append a transition to the cached history if the match changed."""
+        if self._history_changes:
+            last_time, last_match = self._history_changes[-1]
+        else:
+            last_time, last_match = self._history_start, self._history_initial
+        if timestamp < last_time or match == last_match:
+            return
+        self._history_changes.append((timestamp, match))
 
-    def _update(self, start, end, now_timestamp, start_timestamp, end_timestamp):
-        # Get history between start and end
+    def _load_history(self, start):
+        """Get the history of the entity from start until now.
+
+        Return None if the recorder has no history for the entity.
+        """
         history_list = history.state_changes_during_period(
-            self.hass, start, end, str(self._entity_id)
+            self.hass, start, None, str(self._entity_id)
         )
 
         if self._entity_id not in history_list:
-            return
+            return None
 
         # Get the first state
-        last_state = history.get_state(self.hass, start, self._entity_id)
-        last_state = last_state is not None and last_state in self._entity_states
+        first_state = history.get_state(self.hass, start, self._entity_id)
+        initial = first_state is not None and first_state.state in self._entity_states
+        changes = [
+            (item.last_changed.timestamp(), item.state in self._entity_states)
+            for item in history_list.get(self._entity_id)
+        ]
+        return initial, changes
+
+    @callback
+    def _seed_history(self, start_timestamp, initial, changes):
+        """Replace the cached history with the history from the recorder."""
+        self._history_start = start_timestamp
+        self._history_initial = initial
+        self._history_changes = []
+        for timestamp, match in changes:
+            self._add_change(timestamp, match)
+
+        # Merge the changes the recorder had not committed yet
+        pending, self._pending_changes = self._pending_changes, []
+        for timestamp, match in pending:
+            self._add_change(timestamp, match)
+        current = self.hass.states.get(self._entity_id)
+        if current is not None:
+            self._add_change(
+                current.last_changed.timestamp(), current.state in self._entity_states
+            )
+
+    def _prune_history(self, start_timestamp):
+        """Drop the cached transitions before the start of the window."""
+        changes = self._history_changes
+        index = 0
+        while index < len(changes) and changes[index][0] <= start_timestamp:
+            self._history_initial = changes[index][1]
+            index += 1
+        del changes[:index]
+        self._history_start = start_timestamp
+
+    def _calculate(self, start_timestamp, end_timestamp, now_timestamp, end_time):
+        """Calculate the value and count from the cached history."""
+        last_state = self._history_initial
         last_time = start_timestamp
         elapsed = 0
-        count = 0
+        # Matching at the start of the period counts as a transition
+        count = 1 if last_state else 0
 
         # Make calculations
-        for item in history_list.get(self._entity_id):
-            current_state = item.state in self._entity_states
-            current_time = item.last_changed.timestamp()
+        for current_time, current_state in self._history_changes:
+            if current_time >= end_time:
+                break
 
             if last_state:
                 elapsed += current_time - last_time
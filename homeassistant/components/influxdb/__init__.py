@@ -4,15 +4,18 @@ from __future__ import annotations
 from collections.abc import Callable
 from contextlib import suppress
 from dataclasses import dataclass
+from datetime import datetime, timezone
+import gzip
 import logging
 import math
+import os
 import queue
 import threading
 import time
 from typing import Any
 
 from influxdb import InfluxDBClient, exceptions
-from influxdb_client import InfluxDBClient as InfluxDBClientV2
+from influxdb_client import InfluxDBClient as InfluxDBClientV2, WriteService
 from influxdb_client.client.write_api import ASYNCHRONOUS, SYNCHRONOUS
 from influxdb_client.rest import ApiException
 import requests.exceptions
@@ -31,7 +34,11 @@ from homeassistant.const import (
     STATE_UNKNOWN,
 )
 from homeassistant.core import callback
-from homeassistant.helpers import event as event_helper, state as state_helper
+from homeassistant.helpers import (
+    discovery,
+    event as event_helper,
+    state as state_helper,
+)
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
 from homeassistant.helpers.entityfilter import (
@@ -55,6 +62,7 @@ from .const import (
     CONF_COMPONENT_CONFIG_GLOB,
     CONF_DB_NAME,
     CONF_DEFAULT_MEASUREMENT,
+    CONF_HIGH_THROUGHPUT,
     CONF_HOST,
     CONF_IGNORE_ATTRIBUTES,
     CONF_MEASUREMENT_ATTR,
@@ -65,6 +73,7 @@ from .const import (
     CONF_PORT,
     CONF_PRECISION,
     CONF_RETRY_COUNT,
+    CONF_SPOOL_SIZE,
     CONF_SSL,
     CONF_SSL_CA_CERT,
     CONF_TAGS,
@@ -76,9 +85,11 @@ from .const import (
     DEFAULT_API_VERSION,
     DEFAULT_HOST_V2,
     DEFAULT_MEASUREMENT_ATTR,
+    DEFAULT_SPOOL_SIZE,
     DEFAULT_SSL_V2,
     DOMAIN,
     EVENT_NEW_STATE,
+    GZIP_COMPRESS_LEVEL,
     INFLUX_CONF_FIELDS,
     INFLUX_CONF_MEASUREMENT,
     INFLUX_CONF_ORG,
@@ -86,6 +97,7 @@ from .const import (
     INFLUX_CONF_TAGS,
     INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
+    MAX_BATCH_BUFFER_SIZE,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
     RE_DECIMAL,
@@ -94,15 +106,24 @@ from .const import (
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_DIRECTORY,
+    SPOOL_FULL_MESSAGE,
+    SPOOLED_MESSAGE,
+    TARGET_WRITE_LATENCY,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
+    WRITE_BATCH_ERROR,
     WRITE_ERROR,
     WROTE_MESSAGE,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+PRECISION_DIVISORS = {"ns": 1, "us": 10 ** 3, "ms": 10 ** 6, "s": 10 ** 9}
+LINE_PROTOCOL_CONTENT_TYPE = "text/plain; charset=utf-8"
+
 
 def create_influx_url(conf: dict) -> dict:
     """Build URL used from config inputs and default when necessary."""
@@ -161,6 +182,8 @@ _CUSTOMIZE_ENTITY_SCHEMA = vol.Schema(
 _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {
         vol.Optional(CONF_RETRY_COUNT, default=0): cv.positive_int,
+        vol.Optional(CONF_HIGH_THROUGHPUT, default=False): cv.boolean,
+        vol.Optional(CONF_SPOOL_SIZE, default=DEFAULT_SPOOL_SIZE): cv.positive_int,
         vol.Optional(CONF_DEFAULT_MEASUREMENT): cv.string,
         vol.Optional(CONF_MEASUREMENT_ATTR, default=DEFAULT_MEASUREMENT_ATTR): vol.In(
             ["unit_of_measurement", "domain__device_class", "entity_id"]
@@ -317,6 +340,58 @@ def _generate_event_to_json(conf: dict) -> Callable[[dict], str]:
     return event_to_json
 
 
+def _escape_key(key: Any) -> str:
+    """Escape a measurement, tag key, tag value or field key for line protocol."""
+    return (
+        str(key)
+        .replace("\\", "\\\\")
+        .replace(" ", "\\ ")
+        .replace(",", "\\,")
+        .replace("=", "\\=")
+        .replace("\n", "\\n")
+    )
+
+
+def _field_value(value: Any) -> str:
+    """Format a field value for line protocol."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return f"{value}i"
+    if isinstance(value, float):
+        return repr(value)
+    escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'.replace("\n", "\\n")
+
+
+def json_to_line_protocol(json: dict, precision: str | None) -> str | None:
+    """Encode a point built by event_to_json as a line of line protocol."""
+    # Infinity and NaN are not valid floats in InfluxDB
+    fields = [
+        f"{_escape_key(field)}={_field_value(value)}"
+        for field, value in json[INFLUX_CONF_FIELDS].items()
+        if not isinstance(value, float) or math.isfinite(value)
+    ]
+    if not fields:
+        return None
+
+    key = ",".join(
+        [_escape_key(json[INFLUX_CONF_MEASUREMENT])]
+        + [
+            f"{_escape_key(tag)}={_escape_key(value)}"
+            for tag, value in sorted(json[INFLUX_CONF_TAGS].items())
+            if value not in (None, "")
+        ]
+    )
+    delta = json[INFLUX_CONF_TIME] - EPOCH
+    nanoseconds = (
+        delta.days * 86400 + delta.seconds
+    ) * 10 ** 9 + delta.microseconds * 1000
+    timestamp = nanoseconds // PRECISION_DIVISORS[precision or "ns"]
+
+    return f"{key} {','.join(fields)} {timestamp}"
+
+
 @dataclass
 class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
@@ -325,6 +400,7 @@ class InfluxClient:
     write: Callable[[str], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
+    write_batch: Callable[[bytes], None]
 
 
 def get_influx_connection(conf, test_write=False, test_read=False):  # noqa: C901
@@ -363,6 +439,30 @@ def get_influx_connection(conf, test_write=False, test_read=False):  # noqa: C90
                     raise ValueError(WRITE_ERROR % (json, exc)) from exc
                 raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
 
+        write_service = WriteService(influx.api_client)
+
+        def write_batch_v2(body):
+            """Write gzip compressed line protocol to V2 influx."""
+            kwargs = {}
+            if precision is not None:
+                kwargs["precision"] = precision
+
+            try:
+                write_service.post_write(
+                    org=conf[CONF_ORG],
+                    bucket=bucket,
+                    body=body,
+                    content_encoding="gzip",
+                    content_type=LINE_PROTOCOL_CONTENT_TYPE,
+                    **kwargs,
+                )
+            except (urllib3.exceptions.HTTPError, OSError) as exc:
+                raise ConnectionError(CONNECTION_ERROR % exc) from exc
+            except ApiException as exc:
+                if exc.status == CODE_INVALID_INPUTS:
+                    raise ValueError(WRITE_BATCH_ERROR % exc) from exc
+                raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
+
         def query_v2(query, _=None):
             """Query V2 influx."""
             try:
@@ -393,7 +493,7 @@ def get_influx_connection(conf, test_write=False, test_read=False):  # noqa: C90
             else:
                 buckets = []
 
-        return InfluxClient(buckets, write_v2, query_v2, close_v2)
+        return InfluxClient(buckets, write_v2, query_v2, close_v2, write_batch_v2)
 
     # Else it's a V1 client
     if CONF_SSL_CA_CERT in conf and conf[CONF_VERIFY_SSL]:
@@ -439,6 +539,35 @@ def get_influx_connection(conf, test_write=False, test_read=False):  # noqa: C90
                 raise ValueError(WRITE_ERROR % (json, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
+    def write_batch_v1(body):
+        """Write gzip compressed line protocol to V1 influx."""
+        params = {"db": conf[CONF_DB_NAME]}
+        if precision is not None:
+            params["precision"] = precision
+
+        try:
+            influx.request(
+                url="write",
+                method="POST",
+                params=params,
+                data=body,
+                expected_response_code=204,
+                headers={
+                    "Content-Type": LINE_PROTOCOL_CONTENT_TYPE,
+                    "Content-Encoding": "gzip",
+                },
+            )
+        except (
+            requests.exceptions.RequestException,
+            exceptions.InfluxDBServerError,
+            OSError,
+        ) as exc:
+            raise ConnectionError(CONNECTION_ERROR % exc) from exc
+        except exceptions.InfluxDBClientError as exc:
+            if exc.code == CODE_INVALID_INPUTS:
+                raise ValueError(WRITE_BATCH_ERROR % exc) from exc
+            raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
+
     def query_v1(query, database=None):
         """Query V1 influx."""
         try:
@@ -465,7 +594,7 @@ def get_influx_connection(conf, test_write=False, test_read=False):  # noqa: C90
     if test_read:
         databases = [db["name"] for db in query_v1(TEST_QUERY_V1)]
 
-    return InfluxClient(databases, write_v1, query_v1, close_v1)
+    return InfluxClient(databases, write_v1, query_v1, close_v1, write_batch_v1)
 
 
 def setup(hass, config):
@@ -480,7 +609,18 @@ def setup(hass, config):
 
     event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    if conf[CONF_HIGH_THROUGHPUT]:
+        spool = InfluxSpool(
+            hass.config.path(SPOOL_DIRECTORY), conf[CONF_SPOOL_SIZE] * 1024 * 1024
+        )
+        instance = hass.data[DOMAIN] = InfluxBatchThread(
+            hass, influx, event_to_json, max_tries, conf.get(CONF_PRECISION), spool
+        )
+        discovery.load_platform(hass, "sensor", DOMAIN, {}, config)
+    else:
+        instance = hass.data[DOMAIN] = InfluxThread(
+            hass, influx, event_to_json, max_tries
+        )
     instance.start()
 
     def shutdown(event):
@@ -505,6 +645,8 @@ class InfluxThread(threading.Thread):
         self.event_to_json = event_to_json
         self.max_tries = max_tries
         self.write_errors = 0
+        self.dropped_events = 0
+        self.batch_size = BATCH_BUFFER_SIZE
         self.shutdown = False
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
@@ -529,7 +671,7 @@ class InfluxThread(threading.Thread):
         dropped = 0
 
         with suppress(queue.Empty):
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
+            while len(json) < self.batch_size and not self.shutdown:
                 timeout = None if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
@@ -548,6 +690,7 @@ class InfluxThread(threading.Thread):
                         dropped += 1
 
         if dropped:
+            self.dropped_events += dropped
             _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
 
         return count, json
@@ -587,3 +730,154 @@ class InfluxThread(threading.Thread):
     def block_till_done(self):
         """Block till all events processed."""
         self.queue.join()
+
+
+class InfluxSpool:
+    """A bounded on-disk buffer of batches which could not be written yet.
+
+    Each batch is stored as a file of gzip compressed line protocol, named after
+    its sequence number and number of events.
+    """
+
+    def __init__(self, path: str, max_size: int) -> None:
+        """Initialize the spool and pick up batches left by an earlier run."""
+        self.path = path
+        self.max_size = max_size
+        self.size = 0
+        self.events = 0
+        self._batches: list[tuple[str, int, int]] = []
+        self._next_sequence = 0
+
+        if not os.path.isdir(path):
+            return
+        for name in sorted(os.listdir(path)):
+            with suppress(ValueError, OSError):
+                sequence, events = map(int, name.split(".", 1)[0].split("-"))
+                self._append(name, events, os.path.getsize(os.path.join(path, name)))
+                self._next_sequence = sequence + 1
+
+    def __len__(self) -> int:
+        """Return the number of spooled batches."""
+        return len(self._batches)
+
+    def _append(self, name: str, events: int, size: int) -> None:
+        """Track a spooled batch."""
+        self._batches.append((name, events, size))
+        self.size += size
+        self.events += events
+
+    def add(self, body: bytes, events: int) -> int:
+        """Spool a batch, return the number of events dropped to make room."""
+        os.makedirs(self.path, exist_ok=True)
+        name = f"{self._next_sequence:012d}-{events}.lp.gz"
+        self._next_sequence += 1
+        with open(os.path.join(self.path, name), "wb") as spool_file:
+            spool_file.write(body)
+        self._append(name, events, len(body))
+
+        dropped = 0
+        while self.size > self.max_size and self._batches:
+            dropped += self._batches[0][1]
+            self.remove_oldest()
+        return dropped
+
+    def oldest(self) -> tuple[bytes, int]:
+        """Return the body and number of events of the oldest batch."""
+        name, events, _ = self._batches[0]
+        with open(os.path.join(self.path, name), "rb") as spool_file:
+            return spool_file.read(), events
+
+    def remove_oldest(self) -> None:
+        """Remove the oldest batch."""
+        name, events, size = self._batches.pop(0)
+        self.size -= size
+        self.events -= events
+        with suppress(FileNotFoundError):
+            os.remove(os.path.join(self.path, name))
+
+
+class InfluxBatchThread(InfluxThread):
+    """An event handler writing gzip compressed line protocol in adaptive batches.
+
+    The batch size grows while writes are fast and shrinks when they are slow.
+    Batches which can't be written are spooled to disk instead of blocking the
+    queue and are written first once InfluxDB is reachable again.
+    """
+
+    def __init__(self, hass, influx, event_to_json, max_tries, precision, spool):
+        """Initialize the listener."""
+
+        def event_to_line(event):
+            """Convert event into a line of line protocol."""
+            if json := event_to_json(event):
+                return json_to_line_protocol(json, precision)
+            return None
+
+        super().__init__(hass, influx, event_to_line, max_tries)
+        self.spool = spool
+        self.write_latency: float | None = None
+        self._retry_at = 0.0
+
+    def write_to_influxdb(self, json):
+        """Write a batch of lines to influxdb, spool it if that's not possible."""
+        body = gzip.compress(
+            ("\n".join(json) + "\n").encode("utf-8"), compresslevel=GZIP_COMPRESS_LEVEL
+        )
+        if self.spool:
+            self._spool(body, len(json))
+            self._write_spool()
+            return
+
+        try:
+            self._write_batch(body, len(json))
+        except ConnectionError as err:
+            self._spool(body, len(json), err)
+        except ValueError as err:
+            _LOGGER.error(err)
+
+    def _write_batch(self, body, events):
+        """Write a batch and adapt the batch size to the write latency."""
+        start = time.monotonic()
+        self.influx.write_batch(body)
+        self.write_latency = latency = time.monotonic() - start
+
+        if latency > TARGET_WRITE_LATENCY:
+            self.batch_size = max(BATCH_BUFFER_SIZE, self.batch_size // 2)
+        elif events >= self.batch_size:
+            self.batch_size = min(MAX_BATCH_BUFFER_SIZE, self.batch_size * 2)
+
+        if self.write_errors:
+            _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
+            self.write_errors = 0
+        _LOGGER.debug(WROTE_MESSAGE, events)
+
+    def _spool(self, body, events, err=None):
+        """Spool a batch until it can be written."""
+        if err is not None:
+            _LOGGER.error(SPOOLED_MESSAGE, err, events)
+            self._retry_at = time.monotonic() + RETRY_DELAY
+        try:
+            dropped = self.spool.add(body, events)
+        except OSError as err:
+            _LOGGER.error("Could not spool batch to disk: %s", err)
+            dropped = events
+        if dropped:
+            self.dropped_events += dropped
+            self.write_errors += dropped
+            _LOGGER.warning(SPOOL_FULL_MESSAGE, dropped)
+
+    def _write_spool(self):
+        """Write spooled batches, oldest first."""
+        if time.monotonic() < self._retry_at:
+            return
+
+        while self.spool:
+            body, events = self.spool.oldest()
+            try:
+                self._write_batch(body, events)
+            except ConnectionError:
+                self._retry_at = time.monotonic() + RETRY_DELAY
+                return
+            except ValueError as err:
+                _LOGGER.error(err)
+            self.spool.remove_oldest()
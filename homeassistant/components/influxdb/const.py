@@ -32,6 +32,8 @@ CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
 CONF_SSL_CA_CERT = "ssl_ca_cert"
+CONF_HIGH_THROUGHPUT = "high_throughput"
+CONF_SPOOL_SIZE = "spool_size"
 
 CONF_LANGUAGE = "language"
 CONF_QUERIES = "queries"
@@ -59,6 +61,7 @@ DEFAULT_RANGE_START = "-15m"
 DEFAULT_RANGE_STOP = "now()"
 DEFAULT_FUNCTION_FLUX = "|> limit(n: 1)"
 DEFAULT_MEASUREMENT_ATTR = "unit_of_measurement"
+DEFAULT_SPOOL_SIZE = 10  # MiB
 
 INFLUX_CONF_MEASUREMENT = "measurement"
 INFLUX_CONF_TAGS = "tags"
@@ -78,6 +81,10 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+MAX_BATCH_BUFFER_SIZE = 5000
+TARGET_WRITE_LATENCY = 0.5  # seconds
+GZIP_COMPRESS_LEVEL = 6
+SPOOL_DIRECTORY = ".influxdb_spool"
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -113,6 +120,7 @@ NO_DATABASE_ERROR = (
     "Check the name is correct and the user has access to it."
 )
 WRITE_ERROR = "Could not write '%s' to influx due to '%s'."
+WRITE_BATCH_ERROR = "Could not write batch to influx due to '%s'."
 QUERY_ERROR = (
     "Could not execute query '%s' due to '%s'. Check the syntax of your query."
 )
@@ -120,6 +128,8 @@ RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
 WROTE_MESSAGE = "Wrote %d events."
+SPOOLED_MESSAGE = "%s Spooled %d events to disk until InfluxDB is reachable again."
+SPOOL_FULL_MESSAGE = "InfluxDB spool is full, dropped %d events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
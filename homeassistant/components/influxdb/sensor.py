@@ -1,6 +1,8 @@
 """InfluxDB component which allows you to get data from an Influx database."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 import datetime
 import logging
 from typing import Final
@@ -9,21 +11,32 @@ import voluptuous as vol
 
 from homeassistant.components.sensor import (
     PLATFORM_SCHEMA as SENSOR_PLATFORM_SCHEMA,
+    STATE_CLASS_MEASUREMENT,
+    STATE_CLASS_TOTAL_INCREASING,
     SensorEntity,
+    SensorEntityDescription,
 )
 from homeassistant.const import (
     CONF_API_VERSION,
     CONF_NAME,
     CONF_UNIT_OF_MEASUREMENT,
     CONF_VALUE_TEMPLATE,
+    ENTITY_CATEGORY_DIAGNOSTIC,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNKNOWN,
+    TIME_MILLISECONDS,
 )
 from homeassistant.exceptions import PlatformNotReady, TemplateError
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import StateType
 from homeassistant.util import Throttle
 
-from . import create_influx_url, get_influx_connection, validate_version_specific_config
+from . import (
+    InfluxBatchThread,
+    create_influx_url,
+    get_influx_connection,
+    validate_version_specific_config,
+)
 from .const import (
     API_VERSION_2,
     COMPONENT_CONFIG_SCHEMA_CONNECTION,
@@ -46,6 +59,7 @@ from .const import (
     DEFAULT_GROUP_FUNCTION,
     DEFAULT_RANGE_START,
     DEFAULT_RANGE_STOP,
+    DOMAIN,
     INFLUX_CONF_VALUE,
     INFLUX_CONF_VALUE_V2,
     LANGUAGE_FLUX,
@@ -148,8 +162,60 @@ PLATFORM_SCHEMA = vol.All(
 )
 
 
+@dataclass
+class InfluxMetricRequiredKeysMixin:
+    """Mixin for required keys."""
+
+    value_fn: Callable[[InfluxBatchThread], StateType]
+
+
+@dataclass
+class InfluxMetricSensorEntityDescription(
+    SensorEntityDescription, InfluxMetricRequiredKeysMixin
+):
+    """Describes a metric of the InfluxDB writer."""
+
+
+METRIC_SENSORS: tuple[InfluxMetricSensorEntityDescription, ...] = (
+    InfluxMetricSensorEntityDescription(
+        key="queue_depth",
+        name="InfluxDB queue depth",
+        icon="mdi:tray-full",
+        native_unit_of_measurement="events",
+        state_class=STATE_CLASS_MEASUREMENT,
+        value_fn=lambda writer: writer.queue.qsize(),
+    ),
+    InfluxMetricSensorEntityDescription(
+        key="dropped_events",
+        name="InfluxDB dropped events",
+        icon="mdi:tray-remove",
+        native_unit_of_measurement="events",
+        state_class=STATE_CLASS_TOTAL_INCREASING,
+        value_fn=lambda writer: writer.dropped_events,
+    ),
+    InfluxMetricSensorEntityDescription(
+        key="write_latency",
+        name="InfluxDB write latency",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=TIME_MILLISECONDS,
+        state_class=STATE_CLASS_MEASUREMENT,
+        value_fn=lambda writer: None
+        if writer.write_latency is None
+        else round(writer.write_latency * 1000, 1),
+    ),
+)
+
+
 def setup_platform(hass, config, add_entities, discovery_info=None):
     """Set up the InfluxDB component."""
+    if discovery_info is not None:
+        writer = hass.data[DOMAIN]
+        add_entities(
+            [InfluxMetricSensor(writer, description) for description in METRIC_SENSORS],
+            update_before_add=True,
+        )
+        return
+
     try:
         influx = get_influx_connection(config, test_read=True)
     except ConnectionError as exc:
@@ -342,3 +408,23 @@ class InfluxQLSensorData:
             if len(points) > 1:
                 _LOGGER.warning(QUERY_MULTIPLE_RESULTS_MESSAGE, self.query)
             self.value = points[0].get(INFLUX_CONF_VALUE)
+
+
+class InfluxMetricSensor(SensorEntity):
+    """Representation of a metric of the InfluxDB writer."""
+
+    entity_description: InfluxMetricSensorEntityDescription
+    _attr_entity_category = ENTITY_CATEGORY_DIAGNOSTIC
+
+    def __init__(
+        self,
+        writer: InfluxBatchThread,
+        description: InfluxMetricSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._writer = writer
+
+    def update(self) -> None:
+        """Get the latest value of the metric."""
+        self._attr_native_value = self.entity_description.value_fn(self._writer)
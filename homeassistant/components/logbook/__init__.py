@@ -1,6 +1,7 @@
 """Event parser and human readable log generator."""
 from contextlib import suppress
 from datetime import timedelta
+from functools import partial
 from http import HTTPStatus
 from itertools import groupby
 import json
@@ -11,12 +12,15 @@ from sqlalchemy.orm import aliased
 from sqlalchemy.sql.expression import literal
 import voluptuous as vol
 
+from homeassistant.components import websocket_api
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.history import sqlalchemy_filter_from_include_exclude_conf
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder.models import (
     Events,
+    StateAttributes,
     States,
+    process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import session_scope
@@ -60,9 +64,20 @@ DOMAIN = "logbook"
 
 GROUP_BY_MINUTES = 15
 
+DEFAULT_PAGE_SIZE = 1000
+MAX_PAGE_SIZE = 10000
+
+DATA_FILTERS = "logbook_filters"
+
 EMPTY_JSON_OBJECT = "{}"
 UNIT_OF_MEASUREMENT_JSON = '"unit_of_measurement":'
 
+# States recorded before the state_attributes table was added
+# still have their attributes in the states table
+SHARED_ATTRIBUTES = sqlalchemy.func.coalesce(
+    StateAttributes.shared_attrs, States.attributes
+)
+
 HA_DOMAIN_ENTITY_ID = f"{HA_DOMAIN}."
 
 CONFIG_SCHEMA = vol.Schema(
@@ -86,6 +101,7 @@ ALL_EVENT_TYPES = [
 ]
 
 EVENT_COLUMNS = [
+    Events.event_id,
     Events.event_type,
     Events.event_data,
     Events.time_fired,
@@ -159,7 +175,9 @@ async def async_setup(hass, config):
         filters = None
         entities_filter = None
 
+    hass.data[DATA_FILTERS] = (filters, entities_filter)
     hass.http.register_view(LogbookView(conf, filters, entities_filter))
+    hass.components.websocket_api.async_register_command(ws_get_events)
 
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
 
@@ -238,24 +256,129 @@ class LogbookView(HomeAssistantView):
                 "Can't combine entity with context_id", HTTPStatus.BAD_REQUEST
             )
 
+        page_size = request.query.get("page_size")
+        if page_size is not None:
+            try:
+                page_size = int(page_size)
+            except ValueError:
+                page_size = 0
+            if not 0 < page_size <= MAX_PAGE_SIZE:
+                return self.json_message("Invalid page_size", HTTPStatus.BAD_REQUEST)
+
+        cursor = request.query.get("cursor")
+        if cursor is not None:
+            cursor = _parse_cursor(cursor)
+            if cursor is None:
+                return self.json_message("Invalid cursor", HTTPStatus.BAD_REQUEST)
+
         def json_events():
             """Fetch events and generate JSON."""
-            return self.json(
-                _get_events(
-                    hass,
-                    start_day,
-                    end_day,
-                    entity_ids,
-                    self.filters,
-                    self.entities_filter,
-                    entity_matches_only,
-                    context_id,
+            if page_size is None:
+                return self.json(
+                    _get_events(
+                        hass,
+                        start_day,
+                        end_day,
+                        entity_ids,
+                        self.filters,
+                        self.entities_filter,
+                        entity_matches_only,
+                        context_id,
+                    )
                 )
+
+            events, next_cursor = _get_events_page(
+                hass,
+                start_day,
+                end_day,
+                entity_ids,
+                self.filters,
+                self.entities_filter,
+                entity_matches_only,
+                context_id,
+                page_size,
+                cursor,
+            )
+            return self.json(
+                {"events": events, "next_cursor": _format_cursor(next_cursor)}
             )
 
         return await hass.async_add_executor_job(json_events)
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "logbook/get_events",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Exclusive("entity_ids", "filter"): cv.entity_ids,
+        vol.Exclusive("context_id", "filter"): str,
+        vol.Optional("page_size", default=DEFAULT_PAGE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PAGE_SIZE)
+        ),
+    }
+)
+@websocket_api.async_response
+async def ws_get_events(hass, connection, msg):
+    """Stream the logbook events of a period one page at a time.
+
+    The result is sent first, followed by an event message per page. All
+    but the last page are marked as partial.
+    """
+    start_time = dt_util.parse_datetime(msg["start_time"])
+    if start_time is None:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    if "end_time" in msg:
+        end_time = dt_util.parse_datetime(msg["end_time"])
+        if end_time is None:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+    else:
+        end_time = dt_util.utcnow()
+
+    stopped = False
+
+    @callback
+    def stop_stream():
+        """Stop sending pages."""
+        nonlocal stopped
+        stopped = True
+
+    connection.subscriptions[msg["id"]] = stop_stream
+    connection.send_result(msg["id"])
+
+    filters, entities_filter = hass.data[DATA_FILTERS]
+    cursor = None
+    while not stopped:
+        events, cursor = await hass.async_add_executor_job(
+            partial(
+                _get_events_page,
+                hass,
+                dt_util.as_utc(start_time),
+                dt_util.as_utc(end_time),
+                msg.get("entity_ids"),
+                filters,
+                entities_filter,
+                context_id=msg.get("context_id"),
+                page_size=msg["page_size"],
+                cursor=cursor,
+            )
+        )
+        if stopped:
+            return
+        connection.send_message(
+            websocket_api.event_message(
+                msg["id"], {"events": events, "partial": cursor is not None}
+            )
+        )
+        if cursor is None:
+            break
+
+    connection.subscriptions.pop(msg["id"], None)
+
+
 def humanify(hass, events, entity_attr_cache, context_lookup):
     """Generate a converted list of events into Entry objects.
 
@@ -421,69 +544,231 @@ def _get_events(
     context_id=None,
 ):
     """Get events for a period of time."""
+    events = []
+    cursor = None
+    while True:
+        page, cursor = _get_events_page(
+            hass,
+            start_day,
+            end_day,
+            entity_ids,
+            filters,
+            entities_filter,
+            entity_matches_only,
+            context_id,
+            DEFAULT_PAGE_SIZE,
+            cursor,
+        )
+        events.extend(page)
+        if cursor is None:
+            return events
+
+
+def _get_events_page(
+    hass,
+    start_day,
+    end_day,
+    entity_ids=None,
+    filters=None,
+    entities_filter=None,
+    entity_matches_only=False,
+    context_id=None,
+    page_size=DEFAULT_PAGE_SIZE,
+    cursor=None,
+):
+    """Get a page of the events for a period of time.
+
+    Events are ordered by (time_fired, event_id) and the page starts after
+    the event at cursor. The page is extended to the end of the
+    GROUP_BY_MINUTES group of its last event, so the events of a group are
+    always humanified together.
+
+    Return the events and the cursor of the next page, None if there are
+    no more events.
+    """
     assert not (
         entity_ids and context_id
     ), "can't pass in both entity_ids and context_id"
 
     entity_attr_cache = EntityAttributeCache(hass)
-    context_lookup = {None: None}
-
-    def yield_events(query):
-        """Yield Events that are not filtered away."""
-        for row in query.yield_per(1000):
-            event = LazyEventPartialState(row)
-            context_lookup.setdefault(event.context_id, event)
-            if event.event_type == EVENT_CALL_SERVICE:
-                continue
-            if event.event_type == EVENT_STATE_CHANGED or _keep_event(
-                hass, event, entities_filter
-            ):
-                yield event
 
     if entity_ids is not None:
         entities_filter = generate_filter([], entity_ids, [], [])
 
     with session_scope(hass=hass) as session:
-        old_state = aliased(States, name="old_state")
 
-        if entity_ids is not None:
-            query = _generate_events_query_without_states(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
-            query = _apply_event_types_filter(
-                hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
+        def logbook_query(*criteria):
+            """Return the ordered logbook query with extra criteria."""
+            return _generate_logbook_query(
+                hass,
+                session,
+                start_day,
+                end_day,
+                entity_ids,
+                filters,
+                entity_matches_only,
+                context_id,
+                criteria,
             )
-            if entity_matches_only:
-                # When entity_matches_only is provided, contexts and events that do not
-                # contain the entity_ids are not included in the logbook response.
-                query = _apply_event_entity_id_matchers(query, entity_ids)
-
-            query = query.union_all(
-                _generate_states_query(
-                    session, start_day, end_day, old_state, entity_ids
-                )
+
+        keyset = () if cursor is None else (_after_event_criteria(*cursor),)
+        rows = logbook_query(*keyset).limit(page_size + 1).all()
+        has_more = len(rows) > page_size
+        if has_more:
+            del rows[page_size:]
+            last_row = rows[-1]
+            rows.extend(
+                logbook_query(
+                    _after_event_criteria(last_row.time_fired, last_row.event_id),
+                    Events.time_fired < _group_end(last_row.time_fired),
+                ).all()
             )
-        else:
-            query = _generate_events_query(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
-            query = _apply_events_types_and_states_filter(
-                hass, query, old_state
-            ).filter(
-                (States.last_updated == States.last_changed)
-                | (Events.event_type != EVENT_STATE_CHANGED)
+
+        if not rows:
+            return [], None
+
+        events = [LazyEventPartialState(row) for row in rows]
+        context_lookup = _get_context_lookup(logbook_query, rows, events)
+
+        def keep_events():
+            """Yield Events that are not filtered away."""
+            for event in events:
+                if event.event_type == EVENT_CALL_SERVICE:
+                    continue
+                if event.event_type == EVENT_STATE_CHANGED or _keep_event(
+                    hass, event, entities_filter
+                ):
+                    yield event
+
+        entries = list(humanify(hass, keep_events(), entity_attr_cache, context_lookup))
+
+    if not has_more:
+        return entries, None
+    return entries, (rows[-1].time_fired, rows[-1].event_id)
+
+
+def _generate_logbook_query(
+    hass,
+    session,
+    start_day,
+    end_day,
+    entity_ids,
+    filters,
+    entity_matches_only,
+    context_id,
+    criteria,
+):
+    """Generate the logbook query ordered by time_fired and event_id.
+
+    The criteria are applied to the events and the states queries.
+    """
+    old_state = aliased(States, name="old_state")
+
+    if entity_ids is not None:
+        query = _generate_events_query_without_states(session)
+        query = _apply_event_time_filter(query, start_day, end_day)
+        query = _apply_event_types_filter(
+            hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
+        )
+        if entity_matches_only:
+            # When entity_matches_only is provided, contexts and events that do not
+            # contain the entity_ids are not included in the logbook response.
+            query = _apply_event_entity_id_matchers(query, entity_ids)
+
+        query = query.filter(*criteria).union_all(
+            _generate_states_query(
+                session, start_day, end_day, old_state, entity_ids
+            ).filter(*criteria)
+        )
+    else:
+        query = _generate_events_query(session)
+        query = _apply_event_time_filter(query, start_day, end_day)
+        query = _apply_events_types_and_states_filter(hass, query, old_state).filter(
+            (States.last_updated == States.last_changed)
+            | (Events.event_type != EVENT_STATE_CHANGED)
+        )
+        if filters:
+            query = query.filter(
+                filters.entity_filter() | (Events.event_type != EVENT_STATE_CHANGED)
             )
-            if filters:
-                query = query.filter(
-                    filters.entity_filter() | (Events.event_type != EVENT_STATE_CHANGED)
-                )
 
-            if context_id is not None:
-                query = query.filter(Events.context_id == context_id)
+        if context_id is not None:
+            query = query.filter(Events.context_id == context_id)
+
+        query = query.filter(*criteria)
+
+    return query.order_by(Events.time_fired, Events.event_id)
+
+
+def _get_context_lookup(logbook_query, rows, events):
+    """Look up the first event of the contexts of the events.
+
+    Contexts are resolved with the same query as the events so the result
+    is the same as looking them up over all events of the period.
+    """
+    context_lookup = {None: None}
+    context_ids = set()
+    for event in events:
+        context_ids.add(event.context_id)
+        context_ids.add(event.context_parent_id)
+    context_ids.discard(None)
+    if not context_ids:
+        return context_lookup
+
+    first_event_ids = {}
+    for row in logbook_query(
+        Events.context_id.in_(context_ids),
+        Events.time_fired <= rows[-1].time_fired,
+    ):
+        if row.context_id not in context_lookup:
+            context_lookup[row.context_id] = LazyEventPartialState(row)
+            first_event_ids[row.context_id] = row.event_id
+
+    # The first event of a context must be the same object as the event of
+    # the page, humanify uses it to detect the event that started a context
+    for row, event in zip(rows, events):
+        if first_event_ids.get(event.context_id) == row.event_id:
+            context_lookup[event.context_id] = event
 
-        query = query.order_by(Events.time_fired)
+    return context_lookup
 
-        return list(
-            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+
+def _after_event_criteria(time_fired, event_id):
+    """Match the events ordered after the event."""
+    return (Events.time_fired > time_fired) | (
+        (Events.time_fired == time_fired) & (Events.event_id > event_id)
+    )
+
+
+def _group_end(time_fired):
+    """Return the end of the GROUP_BY_MINUTES group of a time."""
+    return (
+        time_fired.replace(
+            minute=time_fired.minute - time_fired.minute % GROUP_BY_MINUTES,
+            second=0,
+            microsecond=0,
         )
+        + timedelta(minutes=GROUP_BY_MINUTES)
+    )
+
+
+def _format_cursor(cursor):
+    """Format a page cursor for the API."""
+    if cursor is None:
+        return None
+    time_fired, event_id = cursor
+    # Formatted without an offset, a "+" in an URL query is decoded as space
+    time_fired = process_timestamp(time_fired).replace(tzinfo=None)
+    return f"{time_fired.isoformat()}Z,{event_id}"
+
+
+def _parse_cursor(cursor):
+    """Parse a page cursor from the API, return None if it's invalid."""
+    time_fired, _, event_id = cursor.rpartition(",")
+    time_fired = dt_util.parse_datetime(time_fired)
+    if time_fired is None or not event_id.isdigit():
+        return None
+    return dt_util.as_utc(time_fired), int(event_id)
 
 
 def _generate_events_query(session):
@@ -492,7 +777,7 @@ def _generate_events_query(session):
         States.state,
         States.entity_id,
         States.domain,
-        States.attributes,
+        SHARED_ATTRIBUTES.label("attributes"),
     )
 
 
@@ -510,6 +795,9 @@ def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
     return (
         _generate_events_query(session)
         .outerjoin(Events, (States.event_id == Events.event_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
         .filter(_missing_state_matcher(old_state))
         .filter(_continuous_entity_matcher())
@@ -524,6 +812,9 @@ def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
 def _apply_events_types_and_states_filter(hass, query, old_state):
     events_query = (
         query.outerjoin(States, (Events.event_id == States.event_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
         .filter(
             (Events.event_type != EVENT_STATE_CHANGED)
@@ -554,7 +845,7 @@ def _continuous_entity_matcher():
     #
     return sqlalchemy.or_(
         sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS)),
-        sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON)),
+        sqlalchemy.not_(SHARED_ATTRIBUTES.contains(UNIT_OF_MEASUREMENT_JSON)),
     )
 
 
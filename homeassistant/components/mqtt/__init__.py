@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from functools import lru_cache, partial, wraps
+from functools import partial, wraps
 import inspect
 from itertools import groupby
 import logging
@@ -544,7 +544,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
@@ -562,12 +561,16 @@ class MQTT:
         """Initialize Home Assistant MQTT client."""
         # We don't import on the top because some integrations
         # should be able to optionally rely on MQTT.
-        import paho.mqtt.client as mqtt  # pylint: disable=import-outside-toplevel
+        # pylint: disable=import-outside-toplevel
+        import paho.mqtt.client as mqtt
+        from paho.mqtt.matcher import MQTTMatcher
 
         self.hass = hass
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: list[Subscription] = []
+        # Topic trie mapping each subscribed topic filter to its subscriptions
+        self._matcher = MQTTMatcher()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -743,11 +746,12 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        try:
+            self._matcher[topic].append(subscription)
+        except KeyError:
+            self._matcher[topic] = [subscription]
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -760,12 +764,15 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
+            topic_subscriptions = self._matcher[topic]
+            topic_subscriptions.remove(subscription)
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if topic_subscriptions:
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
+            del self._matcher[topic]
+
             # Only unsubscribe if currently connected.
             if self.connected:
                 self.hass.async_create_task(self._async_unsubscribe(topic))
@@ -853,13 +860,17 @@ class MQTT:
         """Message received callback."""
         self.hass.add_job(self._mqtt_handle_message, msg)
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+    def _matching_subscriptions(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic.
+
+        The result is copied out of the topic trie so callbacks are free to
+        subscribe or unsubscribe while the message is dispatched.
+        """
+        return [
+            subscription
+            for subscriptions in self._matcher.iter_match(topic)
+            for subscription in subscriptions
+        ]
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
@@ -971,16 +982,6 @@ def _raise_on_error(result_code: int | None) -> None:
         )
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
-
-
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/debug_info", vol.Required("device_id"): str}
 )
@@ -6,7 +6,8 @@ import logging
 
 import voluptuous as vol
 
-from homeassistant.components.recorder.models import States
+from homeassistant.components.recorder.history import query_states
+from homeassistant.components.recorder.models import LazyState, States
 from homeassistant.components.recorder.util import execute, session_scope
 from homeassistant.const import (
     ATTR_TEMPERATURE,
@@ -313,14 +314,14 @@ class Plant(Entity):
         _LOGGER.debug("Initializing values for %s from the database", self._name)
         with session_scope(hass=self.hass) as session:
             query = (
-                session.query(States)
+                query_states(session)
                 .filter(
                     (States.entity_id == entity_id.lower())
                     and (States.last_updated > start_date)
                 )
                 .order_by(States.last_updated.asc())
             )
-            states = execute(query, to_native=True, validate_entity_ids=False)
+            states = [LazyState(row) for row in execute(query)]
 
             for state in states:
                 # filter out all None, NaN and "unknown" states
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 from collections.abc import Callable
 import concurrent.futures
 from datetime import datetime, timedelta
@@ -12,7 +13,15 @@ import threading
 import time
 from typing import Any, NamedTuple
 
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, func, select
+from sqlalchemy import (
+    bindparam,
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    func,
+    select,
+    text,
+)
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.orm.session import Session
@@ -56,6 +65,7 @@ from .models import (
     Base,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
@@ -112,12 +122,27 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 1
+DEFAULT_BULK_INSERT = False
 KEEPALIVE_TIME = 30
 
+# Dialects that accept explicit primary keys for the
+# events and states tables, which bulk inserts rely on
+BULK_INSERT_DIALECTS = ("sqlite", "mysql", "postgresql")
+
 # Controls how often we clean up
 # States and Events objects
 EXPIRE_AFTER_COMMITS = 120
 
+# The number of shared attributes ids to keep in memory
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
+
+FIND_SHARED_ATTRIBUTES = (
+    select(StateAttributes.attributes_id)
+    .where(StateAttributes.hash == bindparam("hash"))
+    .where(StateAttributes.shared_attrs == bindparam("shared_attrs"))
+    .limit(1)
+)
+
 CONF_AUTO_PURGE = "auto_purge"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
@@ -126,6 +151,7 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_INSERT = "bulk_insert"
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
@@ -154,6 +180,9 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
+                    vol.Optional(
+                        CONF_BULK_INSERT, default=DEFAULT_BULK_INSERT
+                    ): cv.boolean,
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -242,6 +271,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     auto_purge = conf[CONF_AUTO_PURGE]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
+    bulk_insert = conf[CONF_BULK_INSERT]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
@@ -259,6 +289,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_t=exclude_t,
+        bulk_insert=bulk_insert,
     )
     instance.async_initialize()
     instance.start()
@@ -379,6 +410,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_t: list[str],
+        bulk_insert: bool = DEFAULT_BULK_INSERT,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -387,6 +419,7 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.keep_days = keep_days
         self.commit_interval = commit_interval
+        self.bulk_insert = bulk_insert
         self.queue: Any = queue.SimpleQueue()
         self.recording_start = dt_util.utcnow()
         self.db_url = uri
@@ -406,6 +439,19 @@ class Recorder(threading.Thread):
         self._keepalive_count = 0
         self._old_states: dict[str, States] = {}
         self._pending_expunge: list[States] = []
+        # Ids of recently used shared attributes keyed by their json,
+        # least recently used first
+        self._state_attributes_ids: OrderedDict[str, int] = OrderedDict()
+        self._pending_state_attributes: dict[str, StateAttributes] = {}
+        # Bulk insert mode buffers plain rows instead of ORM objects
+        # and assigns their primary keys itself
+        self._old_state_ids: dict[str, int] = {}
+        self._pending_events: list[dict[str, Any]] = []
+        self._pending_states: list[dict[str, Any]] = []
+        self._pending_attributes_rows: dict[str, dict[str, Any]] = {}
+        self._next_event_id: int | None = None
+        self._next_state_id: int | None = None
+        self._next_attributes_id: int | None = None
         self.event_session = None
         self.get_session = None
         self._completed_first_database_setup = None
@@ -414,6 +460,8 @@ class Recorder(threading.Thread):
         self.migration_in_progress = False
         self._queue_watcher = None
         self._db_supports_row_number = True
+        # Timing of the last completed statistics compile
+        self.last_statistics_run: dict[str, Any] | None = None
 
         self.enabled = True
 
@@ -751,6 +799,9 @@ class Recorder(threading.Thread):
 
     def _run_purge(self, purge_before, repack, apply_filter):
         """Purge the database."""
+        # Pending states may refer to old states or shared attributes
+        # that are about to be purged
+        self._commit_event_session_or_retry()
         if purge.purge_old_data(self, purge_before, repack, apply_filter):
             # We always need to do the db cleanups after a purge
             # is finished to ensure the WAL checkpoint and other
@@ -762,6 +813,7 @@ class Recorder(threading.Thread):
 
     def _run_purge_entities(self, entity_filter):
         """Purge entities from the database."""
+        self._commit_event_session_or_retry()
         if purge.purge_entity_data(self, entity_filter):
             return
         # Schedule a new purge task if this one didn't finish
@@ -814,6 +866,18 @@ class Recorder(threading.Thread):
         if not self.enabled:
             return
 
+        if self.bulk_insert:
+            self._buffer_event_rows(event)
+        else:
+            self._add_event_to_session(event)
+
+        # If they do not have a commit interval
+        # than we commit right away
+        if not self.commit_interval:
+            self._commit_event_session_or_retry()
+
+    def _add_event_to_session(self, event):
+        """Add the database objects of an event to the event session."""
         try:
             if event.event_type == EVENT_STATE_CHANGED:
                 dbevent = Events.from_event(event, event_data="{}")
@@ -828,6 +892,7 @@ class Recorder(threading.Thread):
         if event.event_type == EVENT_STATE_CHANGED:
             try:
                 dbstate = States.from_event(event)
+                shared_attrs = StateAttributes.shared_attrs_from_event(event)
                 has_new_state = event.data.get("new_state")
                 if dbstate.entity_id in self._old_states:
                     old_state = self._old_states.pop(dbstate.entity_id)
@@ -837,6 +902,7 @@ class Recorder(threading.Thread):
                         dbstate.old_state = old_state
                 if not has_new_state:
                     dbstate.state = None
+                self._set_state_attributes(dbstate, shared_attrs)
                 dbstate.event = dbevent
                 dbstate.created = event.time_fired
                 self.event_session.add(dbstate)
@@ -849,10 +915,156 @@ class Recorder(threading.Thread):
                     event.data.get("new_state"),
                 )
 
-        # If they do not have a commit interval
-        # than we commit right away
-        if not self.commit_interval:
-            self._commit_event_session_or_retry()
+    def _set_state_attributes(self, dbstate, shared_attrs):
+        """Link a state to new or already stored shared attributes."""
+        pending_attributes = self._pending_state_attributes.get(shared_attrs)
+        if pending_attributes is not None:
+            dbstate.state_attributes = pending_attributes
+            return
+
+        attributes_id = self._find_state_attributes_id(shared_attrs)
+        if attributes_id is not None:
+            dbstate.attributes_id = attributes_id
+            return
+
+        dbstate_attributes = StateAttributes(
+            hash=StateAttributes.hash_shared_attrs(shared_attrs),
+            shared_attrs=shared_attrs,
+        )
+        dbstate.state_attributes = dbstate_attributes
+        self._pending_state_attributes[shared_attrs] = dbstate_attributes
+
+    def _find_state_attributes_id(self, shared_attrs):
+        """Return the id of stored shared attributes, or None if there are none."""
+        state_attributes_ids = self._state_attributes_ids
+        attributes_id = state_attributes_ids.get(shared_attrs)
+        if attributes_id is not None:
+            state_attributes_ids.move_to_end(shared_attrs)
+            return attributes_id
+
+        # Pending states must not be flushed before the commit
+        with self.event_session.no_autoflush:
+            row = self.event_session.execute(
+                FIND_SHARED_ATTRIBUTES,
+                {
+                    "hash": StateAttributes.hash_shared_attrs(shared_attrs),
+                    "shared_attrs": shared_attrs,
+                },
+            ).first()
+        if row is None:
+            return None
+        self._cache_state_attributes_id(shared_attrs, row.attributes_id)
+        return row.attributes_id
+
+    def _cache_state_attributes_id(self, shared_attrs, attributes_id):
+        """Remember the id of stored shared attributes."""
+        state_attributes_ids = self._state_attributes_ids
+        state_attributes_ids[shared_attrs] = attributes_id
+        state_attributes_ids.move_to_end(shared_attrs)
+        if len(state_attributes_ids) > STATE_ATTRIBUTES_ID_CACHE_SIZE:
+            state_attributes_ids.popitem(last=False)
+
+    def _buffer_event_rows(self, event):
+        """Buffer the rows of an event for the next bulk insert."""
+        if self._next_event_id is None:
+            self._load_next_row_ids()
+
+        try:
+            if event.event_type == EVENT_STATE_CHANGED:
+                event_row = Events.row_from_event(event, event_data="{}")
+            else:
+                event_row = Events.row_from_event(event)
+        except (TypeError, ValueError):
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+            return
+
+        event_id = event_row["event_id"] = self._next_event_id
+        self._next_event_id += 1
+        event_row["created"] = event.time_fired
+        self._pending_events.append(event_row)
+
+        if event.event_type != EVENT_STATE_CHANGED:
+            return
+
+        try:
+            state_row = States.row_from_event(event)
+            shared_attrs = StateAttributes.shared_attrs_from_event(event)
+        except (TypeError, ValueError):
+            _LOGGER.warning(
+                "State is not JSON serializable: %s",
+                event.data.get("new_state"),
+            )
+            return
+
+        entity_id = state_row["entity_id"]
+        state_id = state_row["state_id"] = self._next_state_id
+        self._next_state_id += 1
+        state_row["event_id"] = event_id
+        state_row["old_state_id"] = self._old_state_ids.pop(entity_id, None)
+        state_row["attributes_id"] = self._buffer_state_attributes_row(shared_attrs)
+        state_row["created"] = event.time_fired
+        if event.data.get("new_state"):
+            self._old_state_ids[entity_id] = state_id
+        else:
+            state_row["state"] = None
+        self._pending_states.append(state_row)
+
+    def _buffer_state_attributes_row(self, shared_attrs):
+        """Return the id of shared attributes, buffering a new row if needed."""
+        attributes_row = self._pending_attributes_rows.get(shared_attrs)
+        if attributes_row is not None:
+            return attributes_row["attributes_id"]
+
+        attributes_id = self._find_state_attributes_id(shared_attrs)
+        if attributes_id is not None:
+            return attributes_id
+
+        attributes_id = self._next_attributes_id
+        self._next_attributes_id += 1
+        self._pending_attributes_rows[shared_attrs] = {
+            "attributes_id": attributes_id,
+            "hash": StateAttributes.hash_shared_attrs(shared_attrs),
+            "shared_attrs": shared_attrs,
+        }
+        return attributes_id
+
+    def _load_next_row_ids(self):
+        """Load the next free primary keys of the tables written in bulk."""
+        session = self.event_session
+        last_event_id = session.query(func.max(Events.event_id)).scalar()
+        last_state_id = session.query(func.max(States.state_id)).scalar()
+        last_attributes_id = session.query(
+            func.max(StateAttributes.attributes_id)
+        ).scalar()
+        self._next_event_id = (last_event_id or 0) + 1
+        self._next_state_id = (last_state_id or 0) + 1
+        self._next_attributes_id = (last_attributes_id or 0) + 1
+
+    def _insert_pending_rows(self):
+        """Write the buffered rows with one executemany per table."""
+        session = self.event_session
+        session.execute(Events.__table__.insert(), self._pending_events)
+        if self._pending_attributes_rows:
+            session.execute(
+                StateAttributes.__table__.insert(),
+                list(self._pending_attributes_rows.values()),
+            )
+        if self._pending_states:
+            session.execute(States.__table__.insert(), self._pending_states)
+        if self.engine.dialect.name == "postgresql":
+            # Explicit primary keys do not advance the sequences
+            for table, column, next_id in (
+                ("events", "event_id", self._next_event_id),
+                ("states", "state_id", self._next_state_id),
+                ("state_attributes", "attributes_id", self._next_attributes_id),
+            ):
+                session.execute(
+                    text(
+                        f"SELECT setval(pg_get_serial_sequence('{table}', "
+                        f"'{column}'), :last_id)"
+                    ),
+                    {"last_id": next_id - 1},
+                )
 
     def _handle_database_error(self, err):
         """Handle a database error that may result in moving away the corrupt db."""
@@ -866,7 +1078,11 @@ class Recorder(threading.Thread):
 
     def _commit_event_session_or_retry(self):
         """Commit the event session if there is work to do."""
-        if not self.event_session.new and not self.event_session.dirty:
+        if (
+            not self.event_session.new
+            and not self.event_session.dirty
+            and not self._pending_events
+        ):
             return
         tries = 1
         while tries <= self.db_max_retries:
@@ -883,12 +1099,19 @@ class Recorder(threading.Thread):
                 if tries == self.db_max_retries:
                     raise
 
+                if self._pending_events:
+                    # Rollback so the buffered rows can be inserted again
+                    self.event_session.rollback()
+
                 tries += 1
                 time.sleep(self.db_retry_wait)
 
     def _commit_event_session(self):
         self._commits_without_expire += 1
 
+        if self._pending_events:
+            self._insert_pending_rows()
+
         if self._pending_expunge:
             self.event_session.flush()
             for dbstate in self._pending_expunge:
@@ -898,6 +1121,21 @@ class Recorder(threading.Thread):
                     self.event_session.expunge(dbstate)
             self._pending_expunge = []
         self.event_session.commit()
+        self._pending_events = []
+        self._pending_states = []
+
+        # The shared attributes now have an id
+        for shared_attrs, dbstate_attributes in self._pending_state_attributes.items():
+            if dbstate_attributes.attributes_id is not None:
+                self._cache_state_attributes_id(
+                    shared_attrs, dbstate_attributes.attributes_id
+                )
+        self._pending_state_attributes = {}
+        for shared_attrs, attributes_row in self._pending_attributes_rows.items():
+            self._cache_state_attributes_id(
+                shared_attrs, attributes_row["attributes_id"]
+            )
+        self._pending_attributes_rows = {}
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -917,6 +1155,15 @@ class Recorder(threading.Thread):
     def _close_event_session(self):
         """Close the event session."""
         self._old_states = {}
+        self._old_state_ids = {}
+        self._state_attributes_ids = OrderedDict()
+        self._pending_state_attributes = {}
+        self._pending_events = []
+        self._pending_states = []
+        self._pending_attributes_rows = {}
+        self._next_event_id = None
+        self._next_state_id = None
+        self._next_attributes_id = None
 
         if not self.event_session:
             return
@@ -994,6 +1241,13 @@ class Recorder(threading.Thread):
 
         self.engine = create_engine(self.db_url, **kwargs)
 
+        if self.bulk_insert and self.engine.dialect.name not in BULK_INSERT_DIALECTS:
+            _LOGGER.warning(
+                "Bulk insert is not supported for %s databases, disabling it",
+                self.engine.dialect.name,
+            )
+            self.bulk_insert = False
+
         sqlalchemy_event.listen(self.engine, "connect", setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
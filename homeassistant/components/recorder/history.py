@@ -2,20 +2,25 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from datetime import datetime
 from itertools import groupby
 import logging
 import time
+from typing import Any
 
 from sqlalchemy import and_, bindparam, func
 from sqlalchemy.ext import baked
+from sqlalchemy.orm.session import Session
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder.models import (
+    StateAttributes,
     States,
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import execute, session_scope
-from homeassistant.core import split_entity_id
+from homeassistant.core import HomeAssistant, split_entity_id
 import homeassistant.util.dt as dt_util
 
 from .models import LazyState
@@ -27,6 +32,11 @@ _LOGGER = logging.getLogger(__name__)
 STATE_KEY = "state"
 LAST_CHANGED_KEY = "last_changed"
 
+COMPACT_STATE = "s"
+COMPACT_ATTRIBUTES = "a"
+COMPACT_LAST_CHANGED = "lc"
+COMPACT_LAST_UPDATED = "lu"
+
 SIGNIFICANT_DOMAINS = (
     "climate",
     "device_tracker",
@@ -47,12 +57,22 @@ QUERY_STATES = [
     States.domain,
     States.entity_id,
     States.state,
-    States.attributes,
+    # States recorded before the state_attributes table was added
+    # still have their attributes in the states table
+    func.coalesce(StateAttributes.shared_attrs, States.attributes).label("attributes"),
     States.last_changed,
     States.last_updated,
 ]
 
 HISTORY_BAKERY = "recorder_history_bakery"
+HISTORY_YIELD_PER = 1000
+
+
+def query_states(session):
+    """Return a query of QUERY_STATES with the shared attributes joined."""
+    return session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
 
 
 def async_setup(hass):
@@ -91,10 +111,38 @@ def get_significant_states_with_session(
     """
     timer_start = time.perf_counter()
 
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+    baked_query = _significant_states_baked_query(
+        hass, end_time, entity_ids, filters, significant_changes_only
+    )
+
+    states = execute(
+        baked_query(session).params(
+            start_time=start_time, end_time=end_time, entity_ids=entity_ids
+        )
+    )
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states took %fs", elapsed)
+
+    return _sorted_states_to_dict(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
     )
 
+
+def _significant_states_baked_query(
+    hass, end_time, entity_ids, filters, significant_changes_only
+):
+    """Return the baked query for the significant states during a period."""
+    baked_query = hass.data[HISTORY_BAKERY](query_states)
+
     if significant_changes_only:
         baked_query += lambda q: q.filter(
             (
@@ -120,34 +168,62 @@ def get_significant_states_with_session(
 
     baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
 
-    states = execute(
-        baked_query(session).params(
-            start_time=start_time, end_time=end_time, entity_ids=entity_ids
-        )
+    return baked_query
+
+
+def stream_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    filters: Any = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+) -> Iterator[tuple[str, Iterator[LazyState | dict[str, Any]]]]:
+    """Yield (entity_id, states) tuples for the UTC period start_time - end_time.
+
+    Takes the same arguments as get_significant_states_with_session, but the
+    rows are fetched in batches of HISTORY_YIELD_PER, using a server-side
+    cursor where the database supports it, and the states of each entity are
+    returned as an iterator. Only the start time states and the current batch
+    of rows are held in memory, regardless of the length of the period.
+
+    Entities are yielded ordered by entity_id, followed by the entities that
+    only have a state at the start time. The states iterator of an entity must
+    be consumed before advancing to the next entity.
+    """
+    baked_query = _significant_states_baked_query(
+        hass, end_time, entity_ids, filters, significant_changes_only
     )
 
-    if _LOGGER.isEnabledFor(logging.DEBUG):
-        elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("get_significant_states took %fs", elapsed)
+    initial_states: dict[str, list[LazyState | dict[str, Any]]] = {}
+    if include_start_time_state:
+        for state in _get_start_time_states(
+            hass, session, start_time, entity_ids, filters
+        ):
+            initial_states.setdefault(state.entity_id, []).append(state)
 
-    return _sorted_states_to_dict(
-        hass,
-        session,
-        states,
-        start_time,
-        entity_ids,
-        filters,
-        include_start_time_state,
-        minimal_response,
+    states = (
+        baked_query(session)
+        .params(start_time=start_time, end_time=end_time, entity_ids=entity_ids)
+        .with_post_criteria(lambda q: q.yield_per(HISTORY_YIELD_PER))
     )
 
+    for ent_id, group in groupby(states, lambda state: state.entity_id):
+        yield ent_id, _entity_states(
+            ent_id, group, initial_states.pop(ent_id, []), minimal_response
+        )
+
+    for ent_id, ent_states in initial_states.items():
+        yield ent_id, iter(ent_states)
+
 
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](query_states)
 
         baked_query += lambda q: q.filter(
             (States.last_changed == States.last_updated)
@@ -160,7 +236,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -181,13 +259,13 @@ def get_last_state_changes(hass, number_of_states, entity_id):
     start_time = dt_util.utcnow()
 
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](query_states)
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -247,7 +325,7 @@ def _get_states_with_session(
 
     # We have more than one entity to look at so we need to do a query on states
     # since the last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = query_states(session)
 
     if entity_ids:
         # We got an include-list of entities, accelerate the query by filtering already
@@ -312,9 +390,7 @@ def _get_states_with_session(
 def _get_single_entity_states_with_session(hass, session, utc_point_in_time, entity_id):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](query_states)
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
         States.entity_id == bindparam("entity_id"),
@@ -359,63 +435,134 @@ def _sorted_states_to_dict(
     # Get the states at the start time
     timer_start = time.perf_counter()
     if include_start_time_state:
-        run = recorder.run_information_from_instance(hass, start_time)
-        for state in _get_states_with_session(
-            hass, session, start_time, entity_ids, run=run, filters=filters
+        for state in _get_start_time_states(
+            hass, session, start_time, entity_ids, filters
         ):
-            state.last_changed = start_time
-            state.last_updated = start_time
             result[state.entity_id].append(state)
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         elapsed = time.perf_counter() - timer_start
         _LOGGER.debug("getting %d first datapoints took %fs", len(result), elapsed)
 
-    # Called in a tight loop so cache the function
-    # here
-    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
-
     # Append all changes to it
     for ent_id, group in groupby(states, lambda state: state.entity_id):
-        domain = split_entity_id(ent_id)[0]
-        ent_results = result[ent_id]
-        if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
-            ent_results.extend(LazyState(db_state) for db_state in group)
+        result[ent_id] = list(
+            _entity_states(ent_id, group, result[ent_id], minimal_response)
+        )
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _get_start_time_states(hass, session, start_time, entity_ids, filters):
+    """Return the states at the start time as synthetic zero data points."""
+    run = recorder.run_information_from_instance(hass, start_time)
+    states = _get_states_with_session(
+        hass, session, start_time, entity_ids, run=run, filters=filters
+    )
+    for state in states:
+        state.last_changed = start_time
+        state.last_updated = start_time
+    return states
+
 
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            ent_results.append(LazyState(next(group)))
+def _entity_states(ent_id, group, initial_states, minimal_response):
+    """Yield the states of a single entity.
 
-        prev_state = ent_results[-1]
-        initial_state_count = len(ent_results)
+    initial_states are yielded first, followed by the rows in group.
+    """
+    yield from initial_states
 
+    domain = split_entity_id(ent_id)[0]
+    if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
         for db_state in group:
-            # With minimal response we do not care about attribute
-            # changes so we can filter out duplicate states
-            if db_state.state == prev_state.state:
-                continue
-
-            ent_results.append(
-                {
-                    STATE_KEY: db_state.state,
-                    LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
-                        db_state.last_changed
-                    ),
-                }
-            )
-            prev_state = db_state
+            yield LazyState(db_state)
+        return
+
+    # With minimal response we only provide a native
+    # State for the first and last response. All the states
+    # in-between only provide the "state" and the
+    # "last_changed".
+    if initial_states:
+        prev_state = initial_states[-1]
+    else:
+        prev_state = next(group)
+        yield LazyState(prev_state)
 
-        if prev_state and len(ent_results) != initial_state_count:
-            # There was at least one state change
-            # replace the last minimal state with
-            # a full state
-            ent_results[-1] = LazyState(prev_state)
+    # Called in a tight loop so cache the function
+    # here
+    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
 
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
+    # The last minimal state is held back so it can be
+    # replaced with a full state once the group is exhausted
+    minimal_state = None
+    for db_state in group:
+        # With minimal response we do not care about attribute
+        # changes so we can filter out duplicate states
+        if db_state.state == prev_state.state:
+            continue
+
+        if minimal_state is not None:
+            yield minimal_state
+        minimal_state = {
+            STATE_KEY: db_state.state,
+            LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
+                db_state.last_changed
+            ),
+        }
+        prev_state = db_state
+
+    if minimal_state is not None:
+        # There was at least one state change
+        # replace the last minimal state with
+        # a full state
+        yield LazyState(prev_state)
+
+
+def states_to_columns(
+    states: Iterable[LazyState | dict[str, Any]]
+) -> dict[str, list[Any]]:
+    """Convert the states of a single entity to the compact columnar format.
+
+    The state and last_changed, as a UNIX timestamp, of every state are sent in
+    the s and lc columns. The lu and a columns hold [index, value] pairs and
+    are only sent where last_updated differs from last_changed and where the
+    attributes differ from the previous state with attributes.
+    """
+    state_column = []
+    last_changed_column = []
+    last_updated_column = []
+    attributes_column = []
+    prev_attributes = object()
+
+    for idx, state in enumerate(states):
+        if isinstance(state, dict):
+            # A minimal response state without attributes
+            state_column.append(state[STATE_KEY])
+            last_changed_column.append(
+                datetime.fromisoformat(state[LAST_CHANGED_KEY]).timestamp()
+            )
+            continue
+
+        state_column.append(state.state)
+        last_changed = state.last_changed.timestamp()
+        last_changed_column.append(last_changed)
+        last_updated = state.last_updated.timestamp()
+        if last_updated != last_changed:
+            last_updated_column.append([idx, last_updated])
+        # Compare the undecoded attributes so they are only decoded
+        # when they are sent
+        raw_attributes = state.raw_attributes
+        if raw_attributes != prev_attributes:
+            attributes_column.append([idx, state.attributes])
+            prev_attributes = raw_attributes
+
+    return {
+        COMPACT_STATE: state_column,
+        COMPACT_LAST_CHANGED: last_changed_column,
+        COMPACT_LAST_UPDATED: last_updated_column,
+        COMPACT_ATTRIBUTES: attributes_column,
+    }
 
 
 def get_state(hass, utc_point_in_time, entity_id, run=None):
@@ -579,6 +579,11 @@ def _apply_update(instance, session, new_version, old_version):  # noqa: C901
                         sum=last_statistic.sum,
                     )
                 )
+    elif new_version == 23:
+        # The state_attributes table is created by create_all, attributes of
+        # states recorded before this version stay in the states table
+        _add_columns(connection, "states", ["attributes_id INTEGER"])
+        _create_index(connection, "states", "ix_states_attributes_id")
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
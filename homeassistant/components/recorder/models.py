@@ -3,11 +3,12 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime, timedelta
-import json
 import logging
-from typing import TypedDict, overload
+from typing import Any, TypedDict, overload
+import zlib
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -34,14 +35,14 @@ from homeassistant.const import (
     MAX_LENGTH_STATE_STATE,
 )
 from homeassistant.core import Context, Event, EventOrigin, State, split_entity_id
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import json_dumps, json_loads
 import homeassistant.util.dt as dt_util
 
 # SQLAlchemy Schema
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 22
+SCHEMA_VERSION = 23
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,6 +50,7 @@ DB_TIMEZONE = "+00:00"
 
 TABLE_EVENTS = "events"
 TABLE_STATES = "states"
+TABLE_STATE_ATTRIBUTES = "state_attributes"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
 TABLE_STATISTICS = "statistics"
@@ -58,6 +60,7 @@ TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
 
 ALL_TABLES = [
     TABLE_STATES,
+    TABLE_STATE_ATTRIBUTES,
     TABLE_EVENTS,
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
@@ -110,16 +113,20 @@ class Events(Base):  # type: ignore
     @staticmethod
     def from_event(event, event_data=None):
         """Create an event database object from a native event."""
-        return Events(
-            event_type=event.event_type,
-            event_data=event_data
-            or json.dumps(event.data, cls=JSONEncoder, separators=(",", ":")),
-            origin=str(event.origin.value),
-            time_fired=event.time_fired,
-            context_id=event.context.id,
-            context_user_id=event.context.user_id,
-            context_parent_id=event.context.parent_id,
-        )
+        return Events(**Events.row_from_event(event, event_data))
+
+    @staticmethod
+    def row_from_event(event, event_data=None) -> dict[str, Any]:
+        """Create the column values of an event row from a native event."""
+        return {
+            "event_type": event.event_type,
+            "event_data": event_data or json_dumps(event.data),
+            "origin": str(event.origin.value),
+            "time_fired": event.time_fired,
+            "context_id": event.context.id,
+            "context_user_id": event.context.user_id,
+            "context_parent_id": event.context.parent_id,
+        }
 
     def to_native(self, validate_entity_id=True):
         """Convert to a native HA Event."""
@@ -131,13 +138,13 @@ class Events(Base):  # type: ignore
         try:
             return Event(
                 self.event_type,
-                json.loads(self.event_data),
+                json_loads(self.event_data),
                 EventOrigin(self.origin),
                 process_timestamp(self.time_fired),
                 context=context,
             )
         except ValueError:
-            # When json.loads fails
+            # When json_loads fails
             _LOGGER.exception("Error converting to event: %s", self)
             return None
 
@@ -156,6 +163,7 @@ class States(Base):  # type: ignore
     domain = Column(String(MAX_LENGTH_STATE_DOMAIN))
     entity_id = Column(String(MAX_LENGTH_STATE_ENTITY_ID))
     state = Column(String(MAX_LENGTH_STATE_STATE))
+    # Only set for states recorded before the state_attributes table was added
     attributes = Column(Text().with_variant(mysql.LONGTEXT, "mysql"))
     event_id = Column(
         Integer, ForeignKey("events.event_id", ondelete="CASCADE"), index=True
@@ -164,8 +172,12 @@ class States(Base):  # type: ignore
     last_updated = Column(DATETIME_TYPE, default=dt_util.utcnow, index=True)
     created = Column(DATETIME_TYPE, default=dt_util.utcnow)
     old_state_id = Column(Integer, ForeignKey("states.state_id"), index=True)
+    attributes_id = Column(
+        Integer, ForeignKey("state_attributes.attributes_id"), index=True
+    )
     event = relationship("Events", uselist=False)
     old_state = relationship("States", remote_side=[state_id])
+    state_attributes = relationship("StateAttributes")
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -181,36 +193,44 @@ class States(Base):  # type: ignore
     @staticmethod
     def from_event(event):
         """Create object from a state_changed event."""
+        return States(**States.row_from_event(event))
+
+    @staticmethod
+    def row_from_event(event) -> dict[str, Any]:
+        """Create the column values of a state row from a state_changed event."""
         entity_id = event.data["entity_id"]
         state = event.data.get("new_state")
 
-        dbstate = States(entity_id=entity_id)
-
         # State got deleted
         if state is None:
-            dbstate.state = ""
-            dbstate.domain = split_entity_id(entity_id)[0]
-            dbstate.attributes = "{}"
-            dbstate.last_changed = event.time_fired
-            dbstate.last_updated = event.time_fired
-        else:
-            dbstate.domain = state.domain
-            dbstate.state = state.state
-            dbstate.attributes = json.dumps(
-                dict(state.attributes), cls=JSONEncoder, separators=(",", ":")
-            )
-            dbstate.last_changed = state.last_changed
-            dbstate.last_updated = state.last_updated
+            return {
+                "entity_id": entity_id,
+                "domain": split_entity_id(entity_id)[0],
+                "state": "",
+                "last_changed": event.time_fired,
+                "last_updated": event.time_fired,
+            }
 
-        return dbstate
+        return {
+            "entity_id": entity_id,
+            "domain": state.domain,
+            "state": state.state,
+            "last_changed": state.last_changed,
+            "last_updated": state.last_updated,
+        }
 
     def to_native(self, validate_entity_id=True):
         """Convert to an HA state object."""
+        attributes = self.attributes
+        if attributes is None:
+            attributes = (
+                self.state_attributes.shared_attrs if self.state_attributes else "{}"
+            )
         try:
             return State(
                 self.entity_id,
                 self.state,
-                json.loads(self.attributes),
+                json_loads(attributes),
                 process_timestamp(self.last_changed),
                 process_timestamp(self.last_updated),
                 # Join the events table on event_id to get the context instead
@@ -219,11 +239,66 @@ class States(Base):  # type: ignore
                 validate_entity_id=validate_entity_id,
             )
         except ValueError:
-            # When json.loads fails
+            # When json_loads fails
             _LOGGER.exception("Error converting row to state: %s", self)
             return None
 
 
+class StateAttributes(Base):  # type: ignore
+    """State attribute change history, shared between states."""
+
+    __table_args__ = (
+        {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+    __tablename__ = TABLE_STATE_ATTRIBUTES
+    attributes_id = Column(Integer, Identity(), primary_key=True)
+    hash = Column(BigInteger, index=True)
+    shared_attrs = Column(Text().with_variant(mysql.LONGTEXT, "mysql"))
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StateAttributes("
+            f"id={self.attributes_id}, hash='{self.hash}', attributes='{self.shared_attrs}'"
+            f")>"
+        )
+
+    @staticmethod
+    def from_event(event):
+        """Create object from a state_changed event."""
+        shared_attrs = StateAttributes.shared_attrs_from_event(event)
+        return StateAttributes(
+            hash=StateAttributes.hash_shared_attrs(shared_attrs),
+            shared_attrs=shared_attrs,
+        )
+
+    @staticmethod
+    def shared_attrs_from_event(event) -> str:
+        """Create the shared attributes json from a state_changed event."""
+        state = event.data.get("new_state")
+        # State got deleted
+        if state is None:
+            return "{}"
+        return json_dumps(dict(state.attributes))
+
+    @staticmethod
+    def hash_shared_attrs(shared_attrs: str) -> int:
+        """Return the hash of the shared attributes json.
+
+        The hash is only used to look up the attributes, it may collide.
+        """
+        return zlib.crc32(shared_attrs.encode("utf-8"))
+
+    def to_native(self):
+        """Convert to a state attributes dictionary."""
+        try:
+            return json_loads(self.shared_attrs)
+        except ValueError:
+            # When json_loads fails
+            _LOGGER.exception("Error converting row to state attributes: %s", self)
+            return {}
+
+
 class StatisticResult(TypedDict):
     """Statistic result data class.
 
@@ -495,15 +570,17 @@ class LazyState(State):
         self._last_changed = None
         self._last_updated = None
         self._context = None
+        self._as_dict_json = None
+        self._attributes_cache = None
 
     @property  # type: ignore
     def attributes(self):
         """State attributes."""
         if not self._attributes:
             try:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = json_loads(self._row.attributes)
             except ValueError:
-                # When json.loads fails
+                # When json_loads fails
                 _LOGGER.exception("Error converting row to state: %s", self._row)
                 self._attributes = {}
         return self._attributes
@@ -513,6 +590,11 @@ class LazyState(State):
         """Set attributes."""
         self._attributes = value
 
+    @property
+    def raw_attributes(self):
+        """State attributes as stored in the database, without decoding them."""
+        return self._row.attributes
+
     @property  # type: ignore
     def context(self):
         """State context."""
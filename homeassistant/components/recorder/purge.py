@@ -10,7 +10,7 @@ from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import distinct
 
 from .const import MAX_ROWS_TO_PURGE
-from .models import Events, RecorderRuns, States
+from .models import Events, RecorderRuns, StateAttributes, States
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
 
@@ -85,6 +85,13 @@ def _select_state_ids_to_purge(
 
 def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int]) -> None:
     """Disconnect states and delete by state id."""
+    attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.query(distinct(States.attributes_id)).filter(
+            States.state_id.in_(state_ids)
+        )
+        if attributes_id is not None
+    }
 
     # Update old_state_id to NULL before deleting to ensure
     # the delete does not fail due to a foreign key constraint
@@ -107,6 +114,46 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
     # Evict eny entries in the old_states cache referring to a purged state
     _evict_purged_states_from_old_states_cache(instance, state_ids)
 
+    if attributes_ids:
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
+
+
+def _purge_unused_attributes_ids(
+    instance: Recorder, session: Session, attributes_ids: set[int]
+) -> None:
+    """Delete the shared attributes no longer referred to by any state."""
+    used_attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.query(distinct(States.attributes_id)).filter(
+            States.attributes_id.in_(attributes_ids)
+        )
+    }
+    unused_attributes_ids = attributes_ids - used_attributes_ids
+    if not unused_attributes_ids:
+        return
+
+    deleted_rows = (
+        session.query(StateAttributes)
+        .filter(StateAttributes.attributes_id.in_(unused_attributes_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s attribute states", deleted_rows)
+
+    # Evict any purged attributes from the state attributes cache
+    _evict_purged_attributes_from_attributes_cache(instance, unused_attributes_ids)
+
+
+def _evict_purged_attributes_from_attributes_cache(
+    instance: Recorder, purged_attributes_ids: set[int]
+) -> None:
+    """Evict purged attributes from the state attributes cache."""
+    state_attributes_ids = (
+        instance._state_attributes_ids  # pylint: disable=protected-access
+    )
+    for shared_attrs, attributes_id in list(state_attributes_ids.items()):
+        if attributes_id in purged_attributes_ids:
+            del state_attributes_ids[shared_attrs]
+
 
 def _evict_purged_states_from_old_states_cache(
     instance: Recorder, purged_state_ids: set[int]
@@ -124,6 +171,14 @@ def _evict_purged_states_from_old_states_cache(
     for purged_state_id in purged_state_ids.intersection(old_state_reversed):
         old_states.pop(old_state_reversed[purged_state_id], None)
 
+    # Evict any purged state from the bulk insert old state ids cache
+    old_state_ids = instance._old_state_ids  # pylint: disable=protected-access
+    old_state_ids_reversed = {
+        state_id: entity_id for entity_id, state_id in old_state_ids.items()
+    }
+    for purged_state_id in purged_state_ids.intersection(old_state_ids_reversed):
+        old_state_ids.pop(old_state_ids_reversed[purged_state_id], None)
+
 
 def _purge_event_ids(session: Session, event_ids: list[int]) -> None:
     """Delete by event id."""
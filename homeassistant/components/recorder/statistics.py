@@ -7,6 +7,7 @@ import dataclasses
 from datetime import datetime, timedelta
 from itertools import chain, groupby
 import logging
+import time
 from typing import TYPE_CHECKING, Any, Literal
 
 from sqlalchemy import bindparam, func
@@ -379,12 +380,16 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
             return True
 
     _LOGGER.debug("Compiling statistics for %s-%s", start, end)
+    compile_start = time.monotonic()
+    platform_durations: dict[str, float] = {}
     platform_stats: list[StatisticResult] = []
     # Collect statistics from all platforms implementing support
     for domain, platform in instance.hass.data[DOMAIN].items():
         if not hasattr(platform, "compile_statistics"):
             continue
+        platform_start = time.monotonic()
         platform_stat = platform.compile_statistics(instance.hass, start, end)
+        platform_durations[domain] = time.monotonic() - platform_start
         _LOGGER.debug(
             "Statistics for %s during %s-%s: %s", domain, start, end, platform_stat
         )
@@ -410,6 +415,20 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
 
         session.add(StatisticsRuns(start=start))
 
+    duration = time.monotonic() - compile_start
+    instance.last_statistics_run = {
+        "start": start,
+        "duration": duration,
+        "platforms": platform_durations,
+        "statistics": len(platform_stats),
+    }
+    _LOGGER.debug(
+        "Compiled %s statistics for %s-%s in %.3fs",
+        len(platform_stats),
+        start,
+        end,
+        duration,
+    )
     return True
 
 
@@ -590,11 +609,14 @@ def statistics_during_period(
     end_time: datetime | None = None,
     statistic_ids: list[str] | None = None,
     period: Literal["hour"] | Literal["5minute"] = "hour",
-) -> dict[str, list[dict[str, str]]]:
+    compact: bool = False,
+) -> dict[str, Any]:
     """Return statistics during UTC period start_time - end_time for the statistic_ids.
 
     If end_time is omitted, returns statistics newer than or equal to start_time.
     If statistic_ids is omitted, returns statistics for all statistics ids.
+    If compact is set, the statistics are returned in the compact columnar format,
+    see _statistics_to_columns.
     """
     metadata = None
     with session_scope(hass=hass) as session:
@@ -629,7 +651,15 @@ def statistics_during_period(
             return {}
         # Return statistics combined with metadata
         return _sorted_statistics_to_dict(
-            hass, session, stats, statistic_ids, metadata, True, table, start_time
+            hass,
+            session,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            start_time,
+            compact,
         )
 
 
@@ -678,6 +708,52 @@ def get_last_statistics(
         )
 
 
+def get_latest_short_term_statistics(
+    hass: HomeAssistant, session: scoped_session, statistic_ids: list[str]
+) -> dict[str, list[dict]]:
+    """Return the latest short term statistics for a list of statistic_ids.
+
+    This is equivalent to calling get_last_statistics with number_of_stats set to 1
+    for each statistic_id, but fetches the statistics with a single query.
+    """
+    metadata = get_metadata_with_session(hass, session, statistic_ids, None)
+    if not metadata:
+        return {}
+
+    most_recent_statistic_ids = (
+        session.query(func.max(StatisticsShortTerm.id).label("max_id"))
+        .filter(
+            StatisticsShortTerm.metadata_id.in_(
+                [metadata_id for metadata_id, _ in metadata.values()]
+            )
+        )
+        .group_by(StatisticsShortTerm.metadata_id)
+        .subquery()
+    )
+    query = (
+        session.query(*QUERY_STATISTICS_SHORT_TERM)
+        .join(
+            most_recent_statistic_ids,
+            StatisticsShortTerm.id == most_recent_statistic_ids.c.max_id,
+        )
+        .order_by(StatisticsShortTerm.metadata_id)
+    )
+    stats = execute(query)
+    if not stats:
+        return {}
+
+    return _sorted_statistics_to_dict(
+        hass,
+        session,
+        stats,
+        statistic_ids,
+        metadata,
+        False,
+        StatisticsShortTerm,
+        None,
+    )
+
+
 def _statistics_at_time(
     session: scoped_session,
     metadata_ids: set[int],
@@ -719,7 +795,8 @@ def _sorted_statistics_to_dict(
     convert_units: bool,
     table: type[Statistics | StatisticsShortTerm],
     start_time: datetime | None,
-) -> dict[str, list[dict]]:
+    compact: bool = False,
+) -> dict[str, Any]:
     """Convert SQL results into JSON friendly data structure."""
     result: dict = defaultdict(list)
     units = hass.config.units
@@ -759,8 +836,12 @@ def _sorted_statistics_to_dict(
             convert = UNIT_CONVERSIONS.get(unit, lambda x, units: x)  # type: ignore
         else:
             convert = no_conversion
+        db_states = chain(stats_at_start_time.get(meta_id, ()), group)
+        if compact:
+            result[meta_id] = _statistics_to_columns(db_states, convert, units)
+            continue
         ent_results = result[meta_id]
-        for db_state in chain(stats_at_start_time.get(meta_id, ()), group):
+        for db_state in db_states:
             start = process_timestamp(db_state.start)
             end = start + table.duration
             ent_results.append(
@@ -783,6 +864,43 @@ def _sorted_statistics_to_dict(
     return {metadata[key]["statistic_id"]: val for key, val in result.items() if val}
 
 
+def _statistics_to_columns(
+    db_states: Iterable, convert: Callable[[Any, Any], float | None], units: Any
+) -> dict[str, list]:
+    """Convert the statistics of a single statistic_id to the compact format.
+
+    Every statistic is sent as a column, timestamps are sent as UNIX timestamps
+    and columns without any value are left out. The end of a period is not
+    sent, it is implied by the requested period.
+    """
+    columns: dict[str, list] = {
+        "start": [],
+        "mean": [],
+        "min": [],
+        "max": [],
+        "last_reset": [],
+        "state": [],
+        "sum": [],
+    }
+    for db_state in db_states:
+        columns["start"].append(process_timestamp(db_state.start).timestamp())
+        columns["mean"].append(convert(db_state.mean, units))
+        columns["min"].append(convert(db_state.min, units))
+        columns["max"].append(convert(db_state.max, units))
+        last_reset = process_timestamp(db_state.last_reset)
+        columns["last_reset"].append(
+            None if last_reset is None else last_reset.timestamp()
+        )
+        columns["state"].append(convert(db_state.state, units))
+        columns["sum"].append(convert(db_state.sum, units))
+
+    return {
+        key: column
+        for key, column in columns.items()
+        if any(value is not None for value in column)
+    }
+
+
 def validate_statistics(hass: HomeAssistant) -> dict[str, list[ValidationIssue]]:
     """Validate statistics."""
     platform_validation: dict[str, list[ValidationIssue]] = {}
@@ -16,6 +16,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_validate_statistics)
     websocket_api.async_register_command(hass, ws_clear_statistics)
     websocket_api.async_register_command(hass, ws_update_statistics_metadata)
+    websocket_api.async_register_command(hass, ws_last_statistics_run)
 
 
 @websocket_api.websocket_command(
@@ -72,3 +73,16 @@ def ws_update_statistics_metadata(
         msg["statistic_id"], msg["unit_of_measurement"]
     )
     connection.send_result(msg["id"])
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/last_statistics_run",
+    }
+)
+@callback
+def ws_last_statistics_run(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return timing of the last statistics compile."""
+    connection.send_result(msg["id"], hass.data[DATA_INSTANCE].last_statistics_run)
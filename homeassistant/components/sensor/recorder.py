@@ -415,9 +415,18 @@ def _compile_statistics(  # noqa: C901
         hass, session, [i.entity_id for i in sensor_states], None
     )
 
+    # Sensors which have not been updated since before the start of the period kept
+    # their current state during the whole period, only query history for the others
+    changed_states = [i for i in sensor_states if i.last_updated >= start]
+    _LOGGER.debug(
+        "Compiling statistics for %s changed and %s unchanged sensors",
+        len(changed_states),
+        len(sensor_states) - len(changed_states),
+    )
+
     # Get history between start and end
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        i.entity_id for i in changed_states if "sum" in wanted_statistics[i.entity_id]
     ]
     history_list = {}
     if entities_full_history:
@@ -431,7 +440,7 @@ def _compile_statistics(  # noqa: C901
         )
     entities_significant_history = [
         i.entity_id
-        for i in sensor_states
+        for i in changed_states
         if "sum" not in wanted_statistics[i.entity_id]
     ]
     if entities_significant_history:
@@ -449,6 +458,16 @@ def _compile_statistics(  # noqa: C901
         if _state.entity_id not in history_list:
             history_list[_state.entity_id] = (_state,)
 
+    # Get the last compiled sums, unchanged sensors carry them forward
+    last_stats = {}
+    entities_with_sum = [
+        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+    ]
+    if entities_with_sum:
+        last_stats = statistics.get_latest_short_term_statistics(
+            hass, session, entities_with_sum
+        )
+
     for _state in sensor_states:  # pylint: disable=too-many-nested-blocks
         entity_id = _state.entity_id
         if entity_id not in history_list:
@@ -505,7 +524,6 @@ def _compile_statistics(  # noqa: C901
             last_reset = old_last_reset = None
             new_state = old_state = None
             _sum = 0.0
-            last_stats = statistics.get_last_statistics(hass, 1, entity_id, False)
             if entity_id in last_stats:
                 # We have compiled history for this sensor before, use that as a starting point
                 last_reset = old_last_reset = last_stats[entity_id][0]["last_reset"]
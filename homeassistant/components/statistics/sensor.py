@@ -1,11 +1,13 @@
 """Support for statistics for sensor values."""
+from bisect import bisect_left, insort
 from collections import deque
 import logging
-import statistics
+import math
 
 import voluptuous as vol
 
-from homeassistant.components.recorder.models import States
+from homeassistant.components.recorder.history import query_states
+from homeassistant.components.recorder.models import LazyState, States
 from homeassistant.components.recorder.util import execute, session_scope
 from homeassistant.components.sensor import PLATFORM_SCHEMA, SensorEntity
 from homeassistant.const import (
@@ -131,7 +133,10 @@ class StatisticsSensor(SensorEntity):
         self._quantile_intervals = quantile_intervals
         self._quantile_method = quantile_method
         self._unit_of_measurement = None
-        self.states = deque(maxlen=self._sampling_size)
+        if self.is_binary:
+            self.states = deque(maxlen=self._sampling_size)
+        else:
+            self.states = StreamingStatistics(self._sampling_size)
         self.ages = deque(maxlen=self._sampling_size)
 
         self.count = 0
@@ -283,33 +288,36 @@ class StatisticsSensor(SensorEntity):
         self.count = len(self.states)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if self.count:  # require only one data point
+                self.mean = round(self.states.mean, self._precision)
+                self.median = round(self.states.median, self._precision)
+            else:
+                _LOGGER.debug(
+                    "%s: mean requires at least one data point", self.entity_id
+                )
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
+            if self.count > 1:  # require at least two data points
+                variance = self.states.variance
+                self.stdev = round(math.sqrt(variance), self._precision)
+                self.variance = round(variance, self._precision)
                 if self._quantile_intervals < self.count:
                     self.quantiles = [
                         round(quantile, self._precision)
-                        for quantile in statistics.quantiles(
-                            self.states,
-                            n=self._quantile_intervals,
-                            method=self._quantile_method,
+                        for quantile in self.states.quantiles(
+                            self._quantile_intervals, self._quantile_method
                         )
                     ]
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            else:
+                _LOGGER.debug(
+                    "%s: variance requires at least two data points", self.entity_id
+                )
                 self.stdev = self.variance = self.quantiles = STATE_UNKNOWN
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = round(self.states.total, self._precision)
+                self.min = round(self.states.min, self._precision)
+                self.max = round(self.states.max, self._precision)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
@@ -370,7 +378,7 @@ class StatisticsSensor(SensorEntity):
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
 
         with session_scope(hass=self.hass) as session:
-            query = session.query(States).filter(
+            query = query_states(session).filter(
                 States.entity_id == self._entity_id.lower()
             )
 
@@ -388,7 +396,7 @@ class StatisticsSensor(SensorEntity):
             query = query.order_by(States.last_updated.desc()).limit(
                 self._sampling_size
             )
-            states = execute(query, to_native=True, validate_entity_ids=False)
+            states = [LazyState(row) for row in execute(query)]
 
         for state in reversed(states):
             self._add_state_to_queue(state)
@@ -396,3 +404,141 @@ class StatisticsSensor(SensorEntity):
         self.async_schedule_update_ha_state(True)
 
         _LOGGER.debug("%s: initializing from database completed", self.entity_id)
+
+
+class StreamingStatistics:
+    """Sliding window of numbers with incrementally updated statistics.
+
+    The mean and variance are running sums updated with Welford's algorithm
+    and the values are also kept sorted, so the median, quantiles, min and
+    max are looked up instead of computed over the whole window.
+    """
+
+    def __init__(self, maxlen):
+        """Initialize the window."""
+        self.maxlen = maxlen
+        self._values = deque()
+        self._sorted = []
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._total = 0.0
+        self._removals = 0
+
+    def __len__(self):
+        """Return the number of values in the window."""
+        return len(self._values)
+
+    def __getitem__(self, index):
+        """Return the value at index in the order they were added."""
+        return self._values[index]
+
+    def __iter__(self):
+        """Iterate over the values in the order they were added."""
+        return iter(self._values)
+
+    def append(self, value):
+        """Add a value, removing the oldest value if the window is full."""
+        if len(self._values) == self.maxlen:
+            self.popleft()
+
+        self._values.append(value)
+        insort(self._sorted, value)
+        self._total += value
+        delta = value - self._mean
+        self._mean += delta / len(self._values)
+        self._m2 += delta * (value - self._mean)
+
+    def popleft(self):
+        """Remove and return the oldest value."""
+        value = self._values.popleft()
+        index = bisect_left(self._sorted, value)
+        if index < len(self._sorted) and self._sorted[index] == value:
+            del self._sorted[index]
+        else:
+            # Values that don't compare, like NaN, can't be bisected
+            self._sorted.remove(value)
+
+        count = len(self._values)
+        if not count:
+            self._mean = self._m2 = self._total = 0.0
+            self._removals = 0
+            return value
+
+        self._total -= value
+        delta = value - self._mean
+        self._mean -= delta / count
+        self._m2 -= delta * (value - self._mean)
+
+        # Removing values accumulates rounding errors in the running sums,
+        # recalculating them once per window keeps the cost amortized O(1)
+        self._removals += 1
+        if self._removals >= self.maxlen:
+            self._recalculate()
+        return value
+
+    def _recalculate(self):
+        """Recalculate the running sums from the values."""
+        self._total = math.fsum(self._values)
+        self._mean = self._total / len(self._values)
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in self._values)
+        self._removals = 0
+
+    @property
+    def mean(self):
+        """Return the mean of the values."""
+        return self._mean
+
+    @property
+    def variance(self):
+        """Return the sample variance, requires at least two values."""
+        return max(self._m2, 0.0) / (len(self._values) - 1)
+
+    @property
+    def total(self):
+        """Return the sum of the values."""
+        return self._total
+
+    @property
+    def min(self):
+        """Return the smallest value."""
+        return self._sorted[0]
+
+    @property
+    def max(self):
+        """Return the largest value."""
+        return self._sorted[-1]
+
+    @property
+    def median(self):
+        """Return the median of the values."""
+        data = self._sorted
+        middle = len(data) // 2
+        if len(data) % 2:
+            return data[middle]
+        return (data[middle - 1] + data[middle]) / 2
+
+    def quantiles(self, intervals, method):
+        """Return the cut points dividing the values in equal intervals.
+
+        Matches statistics.quantiles, requires at least two values.
+        """
+        data = self._sorted
+        length = len(data)
+        result = []
+        if method == "inclusive":
+            scale = length - 1
+            for idx in range(1, intervals):
+                j, delta = divmod(idx * scale, intervals)
+                result.append(
+                    (data[j] * (intervals - delta) + data[j + 1] * delta) / intervals
+                )
+            return result
+
+        scale = length + 1
+        for idx in range(1, intervals):
+            j = min(max(idx * scale // intervals, 1), length - 1)
+            delta = idx * scale - j * intervals
+            result.append(
+                (data[j - 1] * (intervals - delta) + data[j] * delta) / intervals
+            )
+        return result
@@ -19,7 +19,12 @@ from homeassistant.exceptions import (
     TemplateError,
     Unauthorized,
 )
-from homeassistant.helpers import config_validation as cv, entity, template
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity,
+    entity_platform,
+    template,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     TrackTemplate,
@@ -42,7 +47,10 @@ def async_register_commands(
 ) -> None:
     """Register commands."""
     async_reg(hass, handle_call_service)
+    async_reg(hass, handle_entity_coalesced_state_writes)
+    async_reg(hass, handle_entity_poll_latency)
     async_reg(hass, handle_entity_source)
+    async_reg(hass, handle_event_bus_listener_stats)
     async_reg(hass, handle_execute_script)
     async_reg(hass, handle_get_config)
     async_reg(hass, handle_get_services)
@@ -55,6 +63,7 @@ def async_register_commands(
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
+    async_reg(hass, handle_template_cache_info)
     async_reg(hass, handle_test_condition)
     async_reg(hass, handle_unsubscribe_events)
 
@@ -238,7 +247,7 @@ def handle_get_states(
             if entity_perm(state.entity_id, "read")
         ]
 
-    connection.send_message(messages.result_message(msg["id"], states))
+    connection.send_message(messages.states_result_message(msg["id"], states))
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -305,6 +314,34 @@ async def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "event_bus/listener_stats",
+        vol.Optional("profiling"): bool,
+    }
+)
+@decorators.require_admin
+def handle_event_bus_listener_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle event bus listener stats command.
+
+    Enables or disables listener profiling when profiling is passed.
+    """
+    if "profiling" in msg:
+        hass.bus.async_set_listener_profiling(msg["profiling"])
+
+    stats = hass.bus.async_listener_stats()
+    connection.send_result(
+        msg["id"],
+        {
+            "profiling": stats is not None,
+            "listeners": [listener.as_dict() for listener in stats or ()],
+        },
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -386,6 +423,81 @@ async def handle_render_template(
     hass.loop.call_soon_threadsafe(info.async_refresh)
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "entity/coalesced_state_writes"})
+@decorators.require_admin
+def handle_entity_coalesced_state_writes(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle entity coalesced state writes command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {
+                "domain": platform.domain,
+                "platform": platform.platform_name,
+                "config_entry_id": platform.config_entry
+                and platform.config_entry.entry_id,
+                "coalesced_state_writes": platform.coalesced_state_writes,
+                "entities": {
+                    entity_id: ent.coalesced_state_writes
+                    for entity_id, ent in platform.entities.items()
+                    if ent.coalesced_state_writes
+                },
+            }
+            for platforms in hass.data.get(
+                entity_platform.DATA_ENTITY_PLATFORM, {}
+            ).values()
+            for platform in platforms
+            if platform.coalesced_state_writes
+        ],
+    )
+
+
+@decorators.websocket_command({vol.Required("type"): "template/cache_info"})
+@decorators.require_admin
+@decorators.async_response
+async def handle_template_cache_info(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle template cache info command."""
+    connection.send_result(
+        msg["id"],
+        {
+            "compiled": template.compile_cache_info(),
+            "bytecode": await hass.async_add_executor_job(
+                template.bytecode_cache_info, hass
+            ),
+        },
+    )
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "entity/poll_latency"})
+@decorators.require_admin
+def handle_entity_poll_latency(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle entity poll latency command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {
+                "domain": platform.domain,
+                "platform": platform.platform_name,
+                "config_entry_id": platform.config_entry
+                and platform.config_entry.entry_id,
+                "latency": platform.poll_latency.as_dict(),
+            }
+            for platforms in hass.data.get(
+                entity_platform.DATA_ENTITY_PLATFORM, {}
+            ).values()
+            for platform in platforms
+            if platform.poll_latency.count
+        ],
+    )
+
+
 @callback
 @decorators.websocket_command(
     {vol.Required("type"): "entity/source", vol.Optional("entity_id"): [cv.entity_id]}
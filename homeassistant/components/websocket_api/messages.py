@@ -7,7 +7,7 @@ from typing import Any, Final
 
 import voluptuous as vol
 
-from homeassistant.core import Event
+from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.util.json import (
     find_paths_unserializable_data,
@@ -37,6 +37,27 @@ def result_message(iden: int, result: Any = None) -> dict[str, Any]:
     return {"id": iden, "type": const.TYPE_RESULT, "success": True, "result": result}
 
 
+def result_message_json(iden: int, result_json: str) -> str:
+    """Return a success result message with an already serialized result."""
+    return (
+        f'{{"id": {iden}, "type": "{const.TYPE_RESULT}", "success": true, '
+        f'"result": {result_json}}}'
+    )
+
+
+def states_result_message(iden: int, states: list[State]) -> str:
+    """Return a success result message with a list of states.
+
+    The message is assembled from the JSON cached on each State.
+    """
+    try:
+        states_json = ", ".join([state.as_dict_json() for state in states])
+    except (ValueError, TypeError):
+        # Let message_to_json find and log the bad data
+        return message_to_json(result_message(iden, states))
+    return result_message_json(iden, f"[{states_json}]")
+
+
 def error_message(iden: int | None, code: str, message: str) -> dict[str, Any]:
     """Return an error result message."""
     return {
@@ -71,7 +92,38 @@ def _cached_event_message(event: Event) -> str:
     The IDEN_TEMPLATE is used which will be replaced
     with the actual iden in cached_event_message
     """
-    return message_to_json(event_message(IDEN_TEMPLATE, event))
+    try:
+        return _event_message_json(event)
+    except (ValueError, TypeError):
+        # Let message_to_json find and log the bad data
+        return message_to_json(event_message(IDEN_TEMPLATE, event))
+
+
+def _event_message_json(event: Event) -> str:
+    """Serialize an event message, reusing the JSON cached on States in its data."""
+    event_dict = event.as_dict()
+    data = event_dict.pop("data")
+    if not all(type(key) is str for key in data):
+        # Only the json module knows how to convert other keys to strings
+        return message_to_json(event_message(IDEN_TEMPLATE, event))
+    data_json = ", ".join(
+        [
+            f"{const.JSON_DUMP(key)}: {_data_value_json(value)}"
+            for key, value in data.items()
+        ]
+    )
+    event_json = const.JSON_DUMP(event_dict)
+    return (
+        f'{{"id": {IDEN_JSON_TEMPLATE}, "type": "event", '
+        f'"event": {{"data": {{{data_json}}}, {event_json[1:]}}}'
+    )
+
+
+def _data_value_json(value: Any) -> str:
+    """Serialize a value of event data."""
+    if isinstance(value, State):
+        return value.as_dict_json()
+    return const.JSON_DUMP(value)
 
 
 def message_to_json(message: dict[str, Any]) -> str:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import math
 from typing import Any, cast
 
 import voluptuous as vol
@@ -89,6 +90,16 @@ RELOAD_SERVICE_SCHEMA = vol.Schema({})
 STORAGE_KEY = DOMAIN
 STORAGE_VERSION = 1
 
+DATA_ZONE_INDEX = "zone_index"
+
+# Size of the grid cells of the zone index, roughly 1 km
+ZONE_INDEX_CELL_DEGREES = 0.01
+# Zones and points with a radius covering more cells are not looked up in the grid
+ZONE_INDEX_MAX_CELLS = 256
+# Lower bound of the length of a degree of latitude in meters, so the grid
+# cells of a circle always cover the whole circle
+METERS_PER_DEGREE = 110_000
+
 
 @bind_hass
 def async_active_zone(
@@ -98,11 +109,15 @@ def async_active_zone(
 
     This method must be run in the event loop.
     """
-    # Sort entity IDs so that we are deterministic if equal distance to 2 zones
-    zones = (
-        cast(State, hass.states.get(entity_id))
-        for entity_id in sorted(hass.states.async_entity_ids(DOMAIN))
-    )
+    if (index := hass.data.get(DATA_ZONE_INDEX)) is None:
+        index = hass.data[DATA_ZONE_INDEX] = ZoneIndex(hass)
+
+    entity_ids = index.async_candidates(latitude, longitude, radius)
+    if entity_ids is None:
+        # Sort entity IDs so that we are deterministic if equal distance to 2 zones
+        entity_ids = sorted(hass.states.async_entity_ids(DOMAIN))
+
+    zones = (cast(State, hass.states.get(entity_id)) for entity_id in entity_ids)
 
     min_dist = None
     closest = None
@@ -156,6 +171,110 @@ def in_zone(zone: State, latitude: float, longitude: float, radius: float = 0) -
     return zone_dist - radius < cast(float, zone.attributes[ATTR_RADIUS])
 
 
+def _grid_cells(
+    latitude: float, longitude: float, radius: float
+) -> list[tuple[int, int]] | None:
+    """Return the grid cells covering a circle.
+
+    Return None if the circle covers too many cells, a pole or the
+    antimeridian.
+    """
+    lat_delta = radius / METERS_PER_DEGREE
+    lat_min = latitude - lat_delta
+    lat_max = latitude + lat_delta
+    if lat_min <= -90 or lat_max >= 90:
+        return None
+
+    lon_delta = lat_delta / math.cos(math.radians(max(-lat_min, lat_max)))
+    lon_min = longitude - lon_delta
+    lon_max = longitude + lon_delta
+    if lon_min < -180 or lon_max > 180:
+        return None
+
+    rows = range(
+        math.floor(lat_min / ZONE_INDEX_CELL_DEGREES),
+        math.floor(lat_max / ZONE_INDEX_CELL_DEGREES) + 1,
+    )
+    columns = range(
+        math.floor(lon_min / ZONE_INDEX_CELL_DEGREES),
+        math.floor(lon_max / ZONE_INDEX_CELL_DEGREES) + 1,
+    )
+    if len(rows) * len(columns) > ZONE_INDEX_MAX_CELLS:
+        return None
+    return [(row, column) for row in rows for column in columns]
+
+
+class ZoneIndex:
+    """Grid index of the active zones.
+
+    Every zone is added to the grid cells its circle overlaps, so a lookup
+    only has to test the zones in the cells of the point. Zones that don't
+    fit in the grid are tested for every lookup. The index is rebuilt on
+    the first lookup after a zone state changed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._cells: dict[tuple[int, int], list[str]] = {}
+        self._unindexed: list[str] = []
+        # The zone states the index was built from
+        self._zones: list[State] | None = None
+
+    @callback
+    def _async_build(self, zones: list[State]) -> None:
+        """Build the index from the zone states."""
+        self._cells = {}
+        self._unindexed = []
+        for zone in zones:
+            if zone.state == STATE_UNAVAILABLE or zone.attributes.get(ATTR_PASSIVE):
+                continue
+
+            try:
+                cells = _grid_cells(
+                    float(zone.attributes[ATTR_LATITUDE]),
+                    float(zone.attributes[ATTR_LONGITUDE]),
+                    max(float(zone.attributes[ATTR_RADIUS]), 0),
+                )
+            except (KeyError, TypeError, ValueError):
+                cells = None
+
+            if cells is None:
+                self._unindexed.append(zone.entity_id)
+                continue
+
+            for cell in cells:
+                self._cells.setdefault(cell, []).append(zone.entity_id)
+
+        self._zones = zones
+
+    @callback
+    def async_candidates(
+        self, latitude: float | None, longitude: float | None, radius: float = 0
+    ) -> list[str] | None:
+        """Return the sorted entity ids of the zones that may contain a point.
+
+        Return None if all zones have to be tested.
+        """
+        if latitude is None or longitude is None:
+            return []
+
+        cells = _grid_cells(latitude, longitude, max(radius, 0))
+        if cells is None:
+            return None
+
+        # States are replaced when they change, comparing the lists
+        # is cheap as unchanged states are the same objects
+        zones = self.hass.states.async_all(DOMAIN)
+        if zones != self._zones:
+            self._async_build(zones)
+
+        candidates = set(self._unindexed)
+        for cell in cells:
+            candidates.update(self._cells.get(cell, ()))
+        return sorted(candidates)
+
+
 class ZoneStorageCollection(collection.StorageCollection):
     """Zone collection stored in storage."""
 
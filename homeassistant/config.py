@@ -25,6 +25,7 @@ from homeassistant.const import (
     ATTR_ASSUMED_STATE,
     ATTR_FRIENDLY_NAME,
     ATTR_HIDDEN,
+    CONF_ADAPTIVE_POLLING,
     CONF_ALLOWLIST_EXTERNAL_DIRS,
     CONF_ALLOWLIST_EXTERNAL_URLS,
     CONF_AUTH_MFA_MODULES,
@@ -43,7 +44,9 @@ from homeassistant.const import (
     CONF_MEDIA_DIRS,
     CONF_NAME,
     CONF_PACKAGES,
+    CONF_PRELOAD_INTEGRATIONS,
     CONF_TEMPERATURE_UNIT,
+    CONF_TEMPLATE_BYTECODE_CACHE,
     CONF_TIME_ZONE,
     CONF_TYPE,
     CONF_UNIT_SYSTEM,
@@ -256,6 +259,9 @@ CORE_CONFIG_SCHEMA = vol.All(
             # pylint: disable=no-value-for-parameter
             vol.Optional(CONF_MEDIA_DIRS): cv.schema_with_slug_keys(vol.IsDir()),
             vol.Optional(CONF_LEGACY_TEMPLATES): cv.boolean,
+            vol.Optional(CONF_TEMPLATE_BYTECODE_CACHE): cv.boolean,
+            vol.Optional(CONF_ADAPTIVE_POLLING): cv.boolean,
+            vol.Optional(CONF_PRELOAD_INTEGRATIONS): cv.boolean,
             vol.Optional(CONF_CURRENCY): cv.currency,
         }
     ),
@@ -553,6 +559,9 @@ async def async_process_ha_core_config(hass: HomeAssistant, config: dict) -> Non
         (CONF_EXTERNAL_URL, "external_url"),
         (CONF_MEDIA_DIRS, "media_dirs"),
         (CONF_LEGACY_TEMPLATES, "legacy_templates"),
+        (CONF_TEMPLATE_BYTECODE_CACHE, "template_bytecode_cache"),
+        (CONF_ADAPTIVE_POLLING, "adaptive_polling"),
+        (CONF_PRELOAD_INTEGRATIONS, "preload_integrations"),
         (CONF_CURRENCY, "currency"),
     ):
         if key in config:
@@ -11,7 +11,9 @@ from collections.abc import Awaitable, Collection, Coroutine, Iterable, Mapping
 import datetime
 import enum
 import functools
+import json
 import logging
+import math
 import os
 import pathlib
 import re
@@ -60,6 +62,7 @@ from homeassistant.exceptions import (
     ServiceNotFound,
     Unauthorized,
 )
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util import location
 from homeassistant.util.async_ import (
     fire_coroutine_threadsafe,
@@ -657,12 +660,81 @@ class Event:
         )
 
 
+@attr.s(slots=True)
+class ListenerStats:
+    """Time spent running an event listener while profiling."""
+
+    event_type: str = attr.ib()
+    listener: str = attr.ib()
+    calls: int = attr.ib(default=0)
+    total_time: float = attr.ib(default=0.0)
+    max_time: float = attr.ib(default=0.0)
+    profiled_job: HassJob | None = attr.ib(default=None, repr=False)
+
+    def record(self, duration: float) -> None:
+        """Record one run of the listener."""
+        self.calls += 1
+        self.total_time += duration
+        if duration > self.max_time:
+            self.max_time = duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the statistics."""
+        return {
+            "event_type": self.event_type,
+            "listener": self.listener,
+            "calls": self.calls,
+            "total_time": self.total_time,
+            "max_time": self.max_time,
+        }
+
+
+def _callable_name(target: Callable) -> str:
+    """Return a readable name for a callable."""
+    while isinstance(target, functools.partial):
+        target = target.func
+    if (qualname := getattr(target, "__qualname__", None)) is None:
+        return repr(target)
+    return f"{getattr(target, '__module__', None)}.{qualname}"
+
+
+def _profiled_job(job: HassJob, record: Callable[[float], None]) -> HassJob:
+    """Wrap a job to pass the time spent running it to record."""
+    target = job.target
+
+    if job.job_type == HassJobType.Coroutinefunction:
+
+        async def _profiled_coroutine(*args: Any) -> None:
+            start = monotonic()
+            try:
+                await target(*args)
+            finally:
+                record(monotonic() - start)
+
+        return HassJob(_profiled_coroutine)
+
+    def _profiled(*args: Any) -> None:
+        start = monotonic()
+        try:
+            target(*args)
+        finally:
+            record(monotonic() - start)
+
+    if job.job_type == HassJobType.Callback:
+        return HassJob(callback(_profiled))
+    return HassJob(_profiled)
+
+
 class EventBus:
     """Allow the firing of and listening for events."""
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[tuple[HassJob, Callable | None]]] = {}
+        # Listeners of an event type merged with the MATCH_ALL listeners,
+        # invalidated whenever a listener is added or removed
+        self._dispatch: dict[str, tuple[tuple[HassJob, Callable | None], ...]] = {}
+        self._listener_stats: dict[HassJob, ListenerStats] | None = None
         self._hass = hass
 
     @callback
@@ -708,12 +780,10 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
-
-        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
-        match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        try:
+            listeners = self._dispatch[event_type]
+        except KeyError:
+            listeners = self._async_build_dispatch(event_type)
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
@@ -733,6 +803,73 @@ class EventBus:
                     continue
             self._hass.async_add_hass_job(job, event)
 
+    @callback
+    def _async_build_dispatch(
+        self, event_type: str
+    ) -> tuple[tuple[HassJob, Callable | None], ...]:
+        """Build and cache the listeners to dispatch an event type to."""
+        listen_types = [event_type]
+        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
+        if MATCH_ALL in self._listeners and event_type != EVENT_HOMEASSISTANT_CLOSE:
+            listen_types.insert(0, MATCH_ALL)
+
+        if self._listener_stats is None:
+            dispatch = tuple(
+                filterable_job
+                for listen_type in listen_types
+                for filterable_job in self._listeners.get(listen_type, ())
+            )
+        else:
+            dispatch = tuple(
+                (self._async_profiled_job(listen_type, job), event_filter)
+                for listen_type in listen_types
+                for job, event_filter in self._listeners.get(listen_type, ())
+            )
+
+        self._dispatch[event_type] = dispatch
+        return dispatch
+
+    @callback
+    def _async_invalidate_dispatch(self, event_type: str) -> None:
+        """Invalidate the cached listeners of an event type."""
+        if event_type == MATCH_ALL:
+            self._dispatch.clear()
+        else:
+            self._dispatch.pop(event_type, None)
+
+    @callback
+    def async_set_listener_profiling(self, enabled: bool) -> None:
+        """Enable or disable measuring the time spent in each listener.
+
+        Enabling resets the collected statistics.
+
+        This method must be run in the event loop.
+        """
+        self._listener_stats = {} if enabled else None
+        self._dispatch.clear()
+
+    @callback
+    def async_listener_stats(self) -> list[ListenerStats] | None:
+        """Return the listener statistics or None if profiling is disabled.
+
+        This method must be run in the event loop.
+        """
+        if self._listener_stats is None:
+            return None
+        return list(self._listener_stats.values())
+
+    @callback
+    def _async_profiled_job(self, listen_type: str, job: HassJob) -> HassJob:
+        """Return a job that records the time spent running a listener job."""
+        assert self._listener_stats is not None
+        if (stats := self._listener_stats.get(job)) is None:
+            stats = self._listener_stats[job] = ListenerStats(
+                listen_type, _callable_name(job.target)
+            )
+            stats.profiled_job = _profiled_job(job, stats.record)
+        assert stats.profiled_job is not None
+        return stats.profiled_job
+
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -778,6 +915,7 @@ class EventBus:
         self, event_type: str, filterable_job: tuple[HassJob, Callable | None]
     ) -> CALLBACK_TYPE:
         self._listeners.setdefault(event_type, []).append(filterable_job)
+        self._async_invalidate_dispatch(event_type)
 
         def remove_listener() -> None:
             """Remove the listener."""
@@ -852,6 +990,8 @@ class EventBus:
             # delete event_type list if empty
             if not self._listeners[event_type]:
                 self._listeners.pop(event_type)
+
+            self._async_invalidate_dispatch(event_type)
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
@@ -883,6 +1023,8 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_dict_json",
+        "_attributes_cache",
     ]
 
     def __init__(
@@ -912,12 +1054,19 @@ class State:
 
         self.entity_id = entity_id.lower()
         self.state = state
-        self.attributes = MappingProxyType(attributes or {})
+        if isinstance(attributes, MappingProxyType):
+            # Already read-only, share it with the state it was taken from
+            self.attributes = attributes
+        else:
+            self.attributes = MappingProxyType(attributes or {})
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: dict[str, Collection[Any]] | None = None
+        self._as_dict_json: str | None = None
+        # JSON of the attributes, shared by states with the same attributes
+        self._attributes_cache: dict[str, Any] | None = None
 
     @property
     def name(self) -> str:
@@ -950,6 +1099,44 @@ class State:
             }
         return self._as_dict
 
+    def as_dict_json(self) -> str:
+        """Return a JSON string of the dict representation of the State.
+
+        Async friendly.
+
+        The State is immutable, so the JSON is serialized once and shared by
+        everything sending this State to clients.
+        Raises TypeError or ValueError if the attributes are not JSON serializable.
+        """
+        if self._as_dict_json is None:
+            as_dict = self.as_dict()
+            attributes_cache = self._get_attributes_cache()
+            if (attributes_json := attributes_cache.get("json")) is None:
+                attributes_json = attributes_cache["json"] = json.dumps(
+                    as_dict["attributes"], cls=JSONEncoder, allow_nan=False
+                )
+            self._as_dict_json = (
+                "{"
+                + ", ".join(
+                    f'"{key}": {attributes_json}'
+                    if key == "attributes"
+                    else f'"{key}": {json.dumps(value, cls=JSONEncoder, allow_nan=False)}'
+                    for key, value in as_dict.items()
+                )
+                + "}"
+            )
+        return self._as_dict_json
+
+    def _get_attributes_cache(self) -> dict[str, Any]:
+        """Return the cache of attribute representations."""
+        if self._attributes_cache is None:
+            self._attributes_cache = {}
+        return self._attributes_cache
+
+    def _share_attributes_cache(self, old_state: State) -> None:
+        """Share the cached attribute representations of the old state."""
+        self._attributes_cache = old_state._get_attributes_cache()
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Any:
         """Initialize a state from a dict.
@@ -1003,12 +1190,39 @@ class State:
         )
 
 
+def _same_attribute_value(old: Any, new: Any) -> bool:
+    """Return if an equal attribute value is also represented the same way.
+
+    Equal values can still differ, like 1 and True or 0.0 and -0.0.
+    """
+    if old is new:
+        return True
+    value_type = type(old)
+    if value_type is not type(new):
+        return False
+    if value_type is float:
+        return math.copysign(1, old) == math.copysign(1, new)
+    if value_type in (str, int, bool):
+        return True
+    if value_type in (list, tuple):
+        return all(map(_same_attribute_value, old, new))
+    if value_type is dict:
+        return all(_same_attribute_value(value, new[key]) for key, value in old.items())
+    if value_type in (set, frozenset):
+        # Elements can only be paired up when they all have the same type
+        types = {type(value) for value in old}
+        return len(types) == 1 and types == {type(value) for value in new}
+    return False
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: dict[str, State] = {}
+        # Secondary index of the states by domain
+        self._domain_index: dict[str, dict[str, State]] = {}
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
@@ -1032,12 +1246,12 @@ class StateMachine:
             return list(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), ()))
 
         return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain in domain_filter
+            entity_id
+            for domain_states in self._async_domain_states(domain_filter)
+            for entity_id in domain_states
         ]
 
     @callback
@@ -1052,10 +1266,11 @@ class StateMachine:
             return len(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return len(self._domain_index.get(domain_filter.lower(), ()))
 
-        return len(
-            [None for state in self._states.values() if state.domain in domain_filter]
+        return sum(
+            len(domain_states)
+            for domain_states in self._async_domain_states(domain_filter)
         )
 
     def all(self, domain_filter: str | Iterable | None = None) -> list[State]:
@@ -1074,10 +1289,26 @@ class StateMachine:
             return list(self._states.values())
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            if (domain_states := self._domain_index.get(domain_filter.lower())) is None:
+                return []
+            return list(domain_states.values())
 
         return [
-            state for state in self._states.values() if state.domain in domain_filter
+            state
+            for domain_states in self._async_domain_states(domain_filter)
+            for state in domain_states.values()
+        ]
+
+    @callback
+    def _async_domain_states(self, domains: Iterable) -> list[dict[str, State]]:
+        """Return the indexed states of each distinct domain.
+
+        This method must be run in the event loop.
+        """
+        return [
+            self._domain_index[domain]
+            for domain in dict.fromkeys(domains)
+            if domain in self._domain_index
         ]
 
     def get(self, entity_id: str) -> State | None:
@@ -1121,6 +1352,11 @@ class StateMachine:
         if old_state is None:
             return False
 
+        domain_states = self._domain_index[old_state.domain]
+        del domain_states[entity_id]
+        if not domain_states:
+            del self._domain_index[old_state.domain]
+
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": None},
@@ -1204,7 +1440,9 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == MappingProxyType(attributes)
+            same_attr = (
+                attributes is old_state.attributes or old_state.attributes == attributes
+            )
             last_changed = old_state.last_changed if same_state else None
 
         if same_state and same_attr:
@@ -1215,6 +1453,22 @@ class StateMachine:
 
         now = dt_util.utcnow()
 
+        reuse_attr = False
+        if (
+            old_state is not None
+            and same_attr
+            and (
+                attributes is old_state.attributes
+                or all(
+                    _same_attribute_value(value, attributes[key])
+                    for key, value in old_state.attributes.items()
+                )
+            )
+        ):
+            # Reuse the unchanged read-only attributes of the old state
+            attributes = old_state.attributes
+            reuse_attr = True
+
         state = State(
             entity_id,
             new_state,
@@ -1224,7 +1478,10 @@ class StateMachine:
             context,
             old_state is None,
         )
+        if old_state is not None and reuse_attr:
+            state._share_attributes_cache(old_state)  # pylint: disable=protected-access
         self._states[entity_id] = state
+        self._domain_index.setdefault(state.domain, {})[entity_id] = state
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -1576,6 +1833,15 @@ class Config:
         # Use legacy template behavior
         self.legacy_templates: bool = False
 
+        # Persist compiled templates in the storage directory
+        self.template_bytecode_cache: bool = False
+
+        # Spread polling of entities over the scan interval
+        self.adaptive_polling: bool = False
+
+        # Import integrations in the executor before setting them up
+        self.preload_integrations: bool = False
+
     def distance(self, lat: float, lon: float) -> float | None:
         """Calculate distance from Home Assistant.
 
@@ -47,6 +47,9 @@ ORPHANED_DEVICE_KEEP_SECONDS = 86400 * 30
 class _DeviceIndex(NamedTuple):
     identifiers: dict[tuple[str, str], str]
     connections: dict[tuple[str, str], str]
+    # Device ids keyed by area and config entry, dicts are used as ordered sets
+    area_ids: dict[str, dict[str, None]]
+    config_entries: dict[str, dict[str, None]]
 
 
 @attr.s(slots=True, frozen=True)
@@ -162,7 +165,9 @@ class DeviceRegistry:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the device registry."""
         self.hass = hass
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION, STORAGE_KEY, journal=True
+        )
         self._clear_index()
 
     @callback
@@ -229,8 +234,22 @@ class DeviceRegistry:
 
     def _clear_index(self) -> None:
         """Clear the index."""
-        self._registered_index = _DeviceIndex(identifiers={}, connections={})
-        self._deleted_index = _DeviceIndex(identifiers={}, connections={})
+        self._registered_index = _DeviceIndex(
+            identifiers={}, connections={}, area_ids={}, config_entries={}
+        )
+        self._deleted_index = _DeviceIndex(
+            identifiers={}, connections={}, area_ids={}, config_entries={}
+        )
+
+    def _update_deleted_device(
+        self, old_device: DeletedDeviceEntry, new_device: DeletedDeviceEntry
+    ) -> None:
+        """Update a deleted device and the index."""
+        self.deleted_devices[new_device.id] = new_device
+
+        devices_index = self._deleted_index
+        _remove_device_from_index(devices_index, old_device)
+        _add_device_to_index(devices_index, new_device)
 
     def _rebuild_index(self) -> None:
         """Create the index after loading devices."""
@@ -586,23 +605,32 @@ class DeviceRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for device in list(self.devices.values()):
-            self._async_update_device(device.id, remove_config_entry_id=config_entry_id)
-        for deleted_device in list(self.deleted_devices.values()):
+        for device_id in list(
+            self._registered_index.config_entries.get(config_entry_id, ())
+        ):
+            self._async_update_device(device_id, remove_config_entry_id=config_entry_id)
+        for device_id in list(
+            self._deleted_index.config_entries.get(config_entry_id, ())
+        ):
+            deleted_device = self.deleted_devices[device_id]
             config_entries = deleted_device.config_entries
-            if config_entry_id not in config_entries:
-                continue
             if config_entries == {config_entry_id}:
                 # Add a time stamp when the deleted device became orphaned
-                self.deleted_devices[deleted_device.id] = attr.evolve(
-                    deleted_device, orphaned_timestamp=now_time, config_entries=set()
+                self._update_deleted_device(
+                    deleted_device,
+                    attr.evolve(
+                        deleted_device,
+                        orphaned_timestamp=now_time,
+                        config_entries=set(),
+                    ),
                 )
             else:
-                config_entries = config_entries - {config_entry_id}
-                # No need to reindex here since we currently
-                # do not have a lookup by config entry
-                self.deleted_devices[deleted_device.id] = attr.evolve(
-                    deleted_device, config_entries=config_entries
+                self._update_deleted_device(
+                    deleted_device,
+                    attr.evolve(
+                        deleted_device,
+                        config_entries=config_entries - {config_entry_id},
+                    ),
                 )
             self.async_schedule_save()
 
@@ -627,9 +655,28 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        for dev_id in list(self._registered_index.area_ids.get(area_id, ())):
+            self._async_update_device(dev_id, area_id=None)
+
+    @callback
+    def async_get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
+        """Return devices that are in an area."""
+        return [
+            self.devices[device_id]
+            for device_id in self._registered_index.area_ids.get(area_id, ())
+        ]
+
+    @callback
+    def async_get_devices_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[DeviceEntry]:
+        """Return devices that belong to a config entry."""
+        return [
+            self.devices[device_id]
+            for device_id in self._registered_index.config_entries.get(
+                config_entry_id, ()
+            )
+        ]
 
 
 @callback
@@ -657,7 +704,7 @@ async def async_get_registry(hass: HomeAssistant) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.async_get_devices_for_area_id(area_id)
 
 
 @callback
@@ -665,11 +712,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.async_get_devices_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -815,6 +858,10 @@ def _add_device_to_index(
         devices_index.identifiers[identifier] = device.id
     for connection in device.connections:
         devices_index.connections[connection] = device.id
+    if isinstance(device, DeviceEntry) and device.area_id:
+        devices_index.area_ids.setdefault(device.area_id, {})[device.id] = None
+    for config_entry_id in device.config_entries:
+        devices_index.config_entries.setdefault(config_entry_id, {})[device.id] = None
 
 
 def _remove_device_from_index(
@@ -828,3 +875,18 @@ def _remove_device_from_index(
     for connection in device.connections:
         if connection in devices_index.connections:
             del devices_index.connections[connection]
+    if isinstance(device, DeviceEntry) and device.area_id:
+        _discard_from_index(devices_index.area_ids, device.area_id, device.id)
+    for config_entry_id in device.config_entries:
+        _discard_from_index(devices_index.config_entries, config_entry_id, device.id)
+
+
+def _discard_from_index(
+    index: dict[str, dict[str, None]], key: str, device_id: str
+) -> None:
+    """Remove a device id from a multi-valued index, dropping empty keys."""
+    if (device_ids := index.get(key)) is None:
+        return
+    device_ids.pop(device_id, None)
+    if not device_ids:
+        del index[key]
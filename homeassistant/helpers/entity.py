@@ -233,10 +233,16 @@ class Entity(ABC):
     # If entity is added to an entity platform
     _added = False
 
+    # Coalescing of state writes, see state_write_interval
+    _state_write_last: float | None = None
+    _state_write_timer: asyncio.TimerHandle | None = None
+    coalesced_state_writes = 0
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_attribution: str | None = None
     _attr_available: bool = True
+    _attr_coalesce_state_writes: bool
     _attr_context_recent_time: timedelta = timedelta(seconds=5)
     _attr_device_class: str | None
     _attr_device_info: DeviceInfo | None = None
@@ -249,6 +255,7 @@ class Entity(ABC):
     _attr_name: str | None
     _attr_should_poll: bool = True
     _attr_state: StateType = STATE_UNKNOWN
+    _attr_state_write_interval: timedelta | None
     _attr_supported_features: int | None = None
     _attr_unique_id: str | None = None
     _attr_unit_of_measurement: str | None
@@ -393,6 +400,31 @@ class Entity(ABC):
         """Time that a context is considered recent."""
         return self._attr_context_recent_time
 
+    @property
+    def state_write_interval(self) -> timedelta | None:
+        """Return the minimum time between two state writes.
+
+        Writes within the interval are coalesced and only the latest state is
+        written at the end of it, see coalesce_state_writes.
+        Defaults to STATE_WRITE_INTERVAL of the platform.
+        """
+        if hasattr(self, "_attr_state_write_interval"):
+            return self._attr_state_write_interval
+        if self.platform is not None:
+            return self.platform.state_write_interval
+        return None
+
+    @property
+    def coalesce_state_writes(self) -> bool:
+        """Return True if state writes may be coalesced.
+
+        Defaults to False for entities with force_update, which write every
+        state.
+        """
+        if hasattr(self, "_attr_coalesce_state_writes"):
+            return self._attr_coalesce_state_writes
+        return not self.force_update
+
     @property
     def entity_registry_enabled_default(self) -> bool:
         """Return if the entity should be enabled when first added to the entity registry."""
@@ -500,6 +532,13 @@ class Entity(ABC):
                 )
             return
 
+        if (
+            (interval := self.state_write_interval) is not None
+            and self.coalesce_state_writes
+            and self._async_postpone_state_write(interval)
+        ):
+            return
+
         start = timer()
 
         attr = self.capability_attributes
@@ -586,6 +625,36 @@ class Entity(ABC):
             self.entity_id, state, attr, self.force_update, self._context
         )
 
+    @callback
+    def _async_postpone_state_write(self, interval: timedelta) -> bool:
+        """Return True if the state write is coalesced with a later write."""
+        if self._state_write_timer is not None:
+            # A write is already scheduled and will pick up this update
+            self.coalesced_state_writes += 1
+            if self.platform is not None:
+                self.platform.coalesced_state_writes += 1
+            return True
+
+        now = self.hass.loop.time()
+        if (
+            self._state_write_last is None
+            or (delay := self._state_write_last + interval.total_seconds() - now) <= 0
+        ):
+            self._state_write_last = now
+            return False
+
+        self._state_write_timer = self.hass.loop.call_later(
+            delay, self._async_write_coalesced_state
+        )
+        return True
+
+    @callback
+    def _async_write_coalesced_state(self) -> None:
+        """Write the latest state at the end of the coalescing interval."""
+        self._state_write_timer = None
+        self._state_write_last = None
+        self._async_write_ha_state()
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
@@ -620,6 +689,16 @@ class Entity(ABC):
 
         This method is a coroutine.
         """
+        await self._async_device_update(warning)
+
+    async def _async_device_update(
+        self, warning: bool, poll_semaphore: asyncio.Semaphore | None = None
+    ) -> None:
+        """Process the update, holding poll_semaphore only while updating.
+
+        The poll semaphore is acquired after parallel_updates, so an update
+        waiting for its platform does not hold a slot of the poll semaphore.
+        """
         if self._update_staged:
             return
         self._update_staged = True
@@ -629,35 +708,43 @@ class Entity(ABC):
             await self.parallel_updates.acquire()
 
         try:
-            if hasattr(self, "async_update"):
-                task = self.hass.async_create_task(self.async_update())  # type: ignore
-            elif hasattr(self, "update"):
-                task = self.hass.async_add_executor_job(self.update)  # type: ignore
+            if poll_semaphore is None:
+                await self._async_process_update(warning)
             else:
-                return
-
-            if not warning:
-                await task
-                return
-
-            finished, _ = await asyncio.wait([task], timeout=SLOW_UPDATE_WARNING)
-
-            for done in finished:
-                if exc := done.exception():
-                    raise exc
-                return
-
-            _LOGGER.warning(
-                "Update of %s is taking over %s seconds",
-                self.entity_id,
-                SLOW_UPDATE_WARNING,
-            )
-            await task
+                async with poll_semaphore:
+                    await self._async_process_update(warning)
         finally:
             self._update_staged = False
             if self.parallel_updates:
                 self.parallel_updates.release()
 
+    async def _async_process_update(self, warning: bool) -> None:
+        """Run 'update' or 'async_update', warning when it is slow."""
+        if hasattr(self, "async_update"):
+            task = self.hass.async_create_task(self.async_update())  # type: ignore
+        elif hasattr(self, "update"):
+            task = self.hass.async_add_executor_job(self.update)  # type: ignore
+        else:
+            return
+
+        if not warning:
+            await task
+            return
+
+        finished, _ = await asyncio.wait([task], timeout=SLOW_UPDATE_WARNING)
+
+        for done in finished:
+            if exc := done.exception():
+                raise exc
+            return
+
+        _LOGGER.warning(
+            "Update of %s is taking over %s seconds",
+            self.entity_id,
+            SLOW_UPDATE_WARNING,
+        )
+        await task
+
     @callback
     def async_on_remove(self, func: CALLBACK_TYPE) -> None:
         """Add a function to call when entity removed."""
@@ -720,6 +807,10 @@ class Entity(ABC):
 
         self._added = False
 
+        if self._state_write_timer is not None:
+            self._state_write_timer.cancel()
+            self._state_write_timer = None
+
         if self._on_remove is not None:
             while self._on_remove:
                 self._on_remove.pop()()
@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import asyncio
+from bisect import bisect_left
 from collections.abc import Callable, Coroutine, Iterable
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from logging import Logger, getLogger
+import random
+from timeit import default_timer as timer
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Protocol
 
@@ -56,6 +59,13 @@ SLOW_ADD_MIN_TIMEOUT = 500
 
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
+DATA_POLL_SEMAPHORE = "entity_platform_poll_semaphore"
+
+# Upper bounds in seconds of the poll latency histogram buckets
+POLL_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+# Used with adaptive polling
+MAX_PARALLEL_POLLS = 16
+MAX_POLL_BACKOFF = 32  # Rounds
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
 _LOGGER = getLogger(__name__)
@@ -102,9 +112,20 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
+        # Adaptive polling, see _async_schedule_polls
+        self._poll_handles: dict[str, asyncio.TimerHandle] = {}
+        self._polls_running: set[str] = set()
+        self._poll_backoff: dict[str, list[int]] = {}
+        self.poll_latency = PollLatencyHistogram()
 
         self.parallel_updates: asyncio.Semaphore | None = None
 
+        # Coalesce state writes of the entities, see Entity.state_write_interval
+        self.state_write_interval: timedelta | None = getattr(
+            platform, "STATE_WRITE_INTERVAL", None
+        )
+        self.coalesced_state_writes = 0
+
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
         self.parallel_updates_created = platform is None
@@ -620,6 +641,9 @@ class EntityPlatform:
         if self._async_unsub_polling is not None:
             self._async_unsub_polling()
             self._async_unsub_polling = None
+        for handle in self._poll_handles.values():
+            handle.cancel()
+        self._poll_handles.clear()
 
     async def async_destroy(self) -> None:
         """Destroy an entity platform.
@@ -637,8 +661,7 @@ class EntityPlatform:
         if self._async_unsub_polling is not None and not any(
             entity.should_poll for entity in self.entities.values()
         ):
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
+            self.async_unsub_polling()
 
     async def async_extract_from_service(
         self, service_call: ServiceCall, expand_group: bool = True
@@ -697,6 +720,10 @@ class EntityPlatform:
 
         This method must be run in the event loop.
         """
+        if self.hass.config.adaptive_polling:
+            self._async_schedule_polls()
+            return
+
         if self._process_updates is None:
             self._process_updates = asyncio.Lock()
         if self._process_updates.locked():
@@ -713,11 +740,133 @@ class EntityPlatform:
             for entity in self.entities.values():
                 if not entity.should_poll:
                     continue
-                tasks.append(entity.async_update_ha_state(True))
+                tasks.append(self._async_timed_update(entity))
 
             if tasks:
                 await asyncio.gather(*tasks)
 
+    async def _async_timed_update(self, entity: Entity) -> None:
+        """Update an entity and record the poll latency."""
+        start = timer()
+        await entity.async_update_ha_state(True)
+        self.poll_latency.record(timer() - start)
+
+    @callback
+    def _async_schedule_polls(self) -> None:
+        """Spread the polls of this round over the scan interval.
+
+        Entities still busy with their previous poll are skipped, as are
+        entities backing off after slow or failed updates.
+        """
+        entities = []
+        for entity in self.entities.values():
+            if not entity.should_poll:
+                continue
+            entity_id = entity.entity_id
+            if entity_id in self._polls_running or entity_id in self._poll_handles:
+                self.logger.debug(
+                    "Skipping poll of %s, the previous one did not finish",
+                    entity_id,
+                )
+                continue
+            if (backoff := self._poll_backoff.get(entity_id)) and backoff[1]:
+                backoff[1] -= 1
+                continue
+            entities.append(entity)
+
+        interval = self.scan_interval.total_seconds()
+        slot = interval / len(entities) if entities else 0
+        for idx, entity in enumerate(entities):
+            # Each entity polls at a random moment within its own slot
+            delay = (idx + random.random()) * slot
+            self._poll_handles[entity.entity_id] = self.hass.loop.call_later(
+                delay, self._async_start_poll, entity
+            )
+
+    @callback
+    def _async_start_poll(self, entity: Entity) -> None:
+        """Start a scheduled poll."""
+        entity_id = entity.entity_id
+        self._poll_handles.pop(entity_id, None)
+        if self.entities.get(entity_id) is not entity:
+            return
+        self._polls_running.add(entity_id)
+        self.hass.async_create_task(self._async_adaptive_poll(entity))
+
+    async def _async_adaptive_poll(self, entity: Entity) -> None:
+        """Poll an entity, limiting the polls running at the same time."""
+        entity_id = entity.entity_id
+        semaphore = self.hass.data.get(DATA_POLL_SEMAPHORE)
+        if semaphore is None:
+            semaphore = self.hass.data[DATA_POLL_SEMAPHORE] = asyncio.Semaphore(
+                MAX_PARALLEL_POLLS
+            )
+
+        try:
+            start = timer()
+            try:
+                # Only hold a poll slot once the platform allows the update
+                await entity._async_device_update(  # pylint: disable=protected-access
+                    True, semaphore
+                )
+            except Exception:  # pylint: disable=broad-except
+                self.logger.exception("Update for %s fails", entity_id)
+                failed = True
+            else:
+                entity.async_write_ha_state()
+                failed = not entity.available
+            duration = timer() - start
+        finally:
+            self._polls_running.discard(entity_id)
+
+        self.poll_latency.record(duration)
+
+        if not failed and duration < self.scan_interval.total_seconds():
+            self._poll_backoff.pop(entity_id, None)
+            return
+
+        # Skip 1, 2, 4, ... rounds while the entity keeps failing or being slow
+        backoff = self._poll_backoff.setdefault(entity_id, [0, 0])
+        backoff[1] = min(2 ** backoff[0], MAX_POLL_BACKOFF)
+        backoff[0] += 1
+        self.logger.debug(
+            "Update of %s %s, skipping the next %s polls",
+            entity_id,
+            "failed" if failed else f"took {duration:.3f} seconds",
+            backoff[1],
+        )
+
+
+class PollLatencyHistogram:
+    """Histogram of the time it takes to poll entities."""
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        # The last bucket counts polls slower than the largest bound
+        self.counts = [0] * (len(POLL_LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record the latency of a poll."""
+        self.counts[bisect_left(POLL_LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram with the number of polls per upper bound."""
+        return {
+            "buckets": {
+                **{
+                    str(bound): count
+                    for bound, count in zip(POLL_LATENCY_BUCKETS, self.counts)
+                },
+                "+Inf": self.counts[-1],
+            },
+            "count": self.count,
+            "sum": self.sum,
+        }
+
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
     "current_platform", default=None
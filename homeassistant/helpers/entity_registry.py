@@ -155,7 +155,14 @@ class EntityRegistry:
         self.hass = hass
         self.entities: dict[str, RegistryEntry]
         self._index: dict[tuple[str, str, str], str] = {}
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        # Entity ids keyed by device, area and config entry, dicts are used as
+        # ordered sets
+        self._device_id_index: dict[str, dict[str, None]] = {}
+        self._area_id_index: dict[str, dict[str, None]] = {}
+        self._config_entry_id_index: dict[str, dict[str, None]] = {}
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION, STORAGE_KEY, journal=True
+        )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
         )
@@ -572,19 +579,40 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
+        for entity_id in list(self._config_entry_id_index.get(config_entry, ())):
             self.async_remove(entity_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self._async_update_entity(entity_id, area_id=None)
+        for entity_id in list(self._area_id_index.get(area_id, ())):
+            self._async_update_entity(entity_id, area_id=None)
+
+    @callback
+    def async_get_entries_for_device_id(self, device_id: str) -> list[RegistryEntry]:
+        """Return entries that belong to a device."""
+        return [
+            self.entities[entity_id]
+            for entity_id in self._device_id_index.get(device_id, ())
+        ]
+
+    @callback
+    def async_get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
+        """Return entries that are in an area."""
+        return [
+            self.entities[entity_id]
+            for entity_id in self._area_id_index.get(area_id, ())
+        ]
+
+    @callback
+    def async_get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[RegistryEntry]:
+        """Return entries that belong to a config entry."""
+        return [
+            self.entities[entity_id]
+            for entity_id in self._config_entry_id_index.get(config_entry_id, ())
+        ]
 
     def _register_entry(self, entry: RegistryEntry) -> None:
         self.entities[entry.entity_id] = entry
@@ -592,6 +620,16 @@ class EntityRegistry:
 
     def _add_index(self, entry: RegistryEntry) -> None:
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        if entry.device_id:
+            self._device_id_index.setdefault(entry.device_id, {})[
+                entry.entity_id
+            ] = None
+        if entry.area_id:
+            self._area_id_index.setdefault(entry.area_id, {})[entry.entity_id] = None
+        if entry.config_entry_id:
+            self._config_entry_id_index.setdefault(entry.config_entry_id, {})[
+                entry.entity_id
+            ] = None
 
     def _unregister_entry(self, entry: RegistryEntry) -> None:
         self._remove_index(entry)
@@ -599,13 +637,35 @@ class EntityRegistry:
 
     def _remove_index(self, entry: RegistryEntry) -> None:
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        if entry.device_id:
+            _discard_from_index(self._device_id_index, entry.device_id, entry.entity_id)
+        if entry.area_id:
+            _discard_from_index(self._area_id_index, entry.area_id, entry.entity_id)
+        if entry.config_entry_id:
+            _discard_from_index(
+                self._config_entry_id_index, entry.config_entry_id, entry.entity_id
+            )
 
     def _rebuild_index(self) -> None:
         self._index = {}
+        self._device_id_index = {}
+        self._area_id_index = {}
+        self._config_entry_id_index = {}
         for entry in self.entities.values():
             self._add_index(entry)
 
 
+def _discard_from_index(
+    index: dict[str, dict[str, None]], key: str, entity_id: str
+) -> None:
+    """Remove an entity id from a multi-valued index, dropping empty keys."""
+    if (entity_ids := index.get(key)) is None:
+        return
+    entity_ids.pop(entity_id, None)
+    if not entity_ids:
+        del index[key]
+
+
 @callback
 def async_get(hass: HomeAssistant) -> EntityRegistry:
     """Get entity registry."""
@@ -635,9 +695,8 @@ def async_entries_for_device(
     """Return entries that match a device."""
     return [
         entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
+        for entry in registry.async_get_entries_for_device_id(device_id)
+        if not entry.disabled_by or include_disabled_entities
     ]
 
 
@@ -646,7 +705,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return registry.async_get_entries_for_area_id(area_id)
 
 
 @callback
@@ -654,11 +713,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.async_get_entries_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -1,7 +1,29 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
+from __future__ import annotations
+
 from datetime import datetime, timedelta
 import json
-from typing import Any
+import math
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def json_encoder_default(obj: Any) -> Any:
+    """Convert Home Assistant objects.
+
+    Raise TypeError for objects that can't be converted.
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, set):
+        return list(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
 
 
 class JSONEncoder(json.JSONEncoder):
@@ -10,16 +32,9 @@ class JSONEncoder(json.JSONEncoder):
     def default(self, o: Any) -> Any:
         """Convert Home Assistant objects.
 
-        Hand other objects to the original method.
+        Raise TypeError for other objects.
         """
-        if isinstance(o, datetime):
-            return o.isoformat()
-        if isinstance(o, set):
-            return list(o)
-        if hasattr(o, "as_dict"):
-            return o.as_dict()
-
-        return json.JSONEncoder.default(self, o)
+        return json_encoder_default(o)
 
 
 class ExtendedJSONEncoder(JSONEncoder):
@@ -36,3 +51,98 @@ class ExtendedJSONEncoder(JSONEncoder):
             return super().default(o)
         except TypeError:
             return {"__type": str(type(o)), "repr": repr(o)}
+
+
+JsonDumpsType = Callable[..., str]
+JsonLoadsType = Callable[[Any], Any]
+
+
+def _json_dumps_stdlib(
+    data: Any,
+    pretty: bool = False,
+    default: Callable[[Any], Any] | None = json_encoder_default,
+) -> str:
+    """Serialize data to JSON with the json module."""
+    if pretty:
+        return json.dumps(data, indent=4, default=default)
+    return json.dumps(data, default=default, separators=(",", ":"))
+
+
+def _has_non_finite(data: Any, default: Callable[[Any], Any] | None) -> bool:
+    """Return if data contains a float that is NaN or infinite."""
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        obj_type = type(obj)
+        if obj_type is str or obj_type is int or obj is None or obj_type is bool:
+            continue
+        if isinstance(obj, float):
+            if not math.isfinite(obj):
+                return True
+        elif isinstance(obj, dict):
+            stack.extend(obj)
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif default is not None and not isinstance(obj, (str, int)):
+            try:
+                stack.append(default(obj))
+            except TypeError:
+                pass
+    return False
+
+
+def _json_dumps_orjson(
+    data: Any,
+    pretty: bool = False,
+    default: Callable[[Any], Any] | None = json_encoder_default,
+) -> str:
+    """Serialize data to JSON with orjson.
+
+    orjson only indents with two spaces, writes NaN and Infinity as null and
+    does not support integers over 64 bit. The json module is used for those
+    so the output stays the same.
+    """
+    if pretty:
+        return _json_dumps_stdlib(data, pretty, default)
+    try:
+        result = orjson.dumps(data, option=_ORJSON_OPTIONS, default=default)
+    except TypeError:
+        # The json module raises for data that is really invalid
+        return _json_dumps_stdlib(data, pretty, default)
+    if b"null" in result and _has_non_finite(data, default):
+        return _json_dumps_stdlib(data, pretty, default)
+    return result.decode("utf-8")
+
+
+def _json_loads_orjson(data: str | bytes) -> Any:
+    """Parse JSON data with orjson."""
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # The json module also accepts NaN and Infinity
+        return json.loads(data)
+
+
+JSON_BACKENDS: dict[str, tuple[JsonDumpsType, JsonLoadsType]] = {
+    "json": (_json_dumps_stdlib, json.loads)
+}
+
+if orjson is not None:
+    # Datetimes and dataclasses are handed to json_encoder_default so they are
+    # serialized exactly like the json module does
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+    JSON_BACKENDS["orjson"] = (_json_dumps_orjson, _json_loads_orjson)
+
+# The C accelerated backend is used when it is installed. Both backends
+# produce the same JSON: json_dumps(data, pretty=False, default=...) converts
+# objects that are not natively supported with default, pass None to only
+# allow plain JSON types. json_loads(data) also accepts NaN and Infinity.
+JSON_BACKEND = "orjson" if "orjson" in JSON_BACKENDS else "json"
+json_dumps: JsonDumpsType
+json_loads: JsonLoadsType
+json_dumps, json_loads = JSON_BACKENDS[JSON_BACKEND]
@@ -98,7 +98,7 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store: Store = Store(
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, journal=True
         )
         self.last_states: dict[str, StoredState] = {}
         self.entity_ids: set[str] = set()
@@ -4,16 +4,23 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+import json
 from json import JSONEncoder
 import logging
 import os
-from typing import Any
+from typing import Any, cast
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import (
+    JSONEncoder as HAJSONEncoder,
+    json_dumps,
+    json_loads,
+)
 from homeassistant.loader import MAX_LOAD_CONCURRENTLY, bind_hass
 from homeassistant.util import json as json_util
+from homeassistant.util.uuid import random_uuid_hex
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-warn-return-any
 # mypy: no-check-untyped-defs
@@ -23,6 +30,10 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
 
+JOURNAL_SUFFIX = ".journal"
+# Compact the journal into the main file when it grows past this share of it
+JOURNAL_COMPACT_RATIO = 0.5
+
 
 @bind_hass
 async def async_migrator(
@@ -78,8 +89,14 @@ class Store:
         private: bool = False,
         *,
         encoder: type[JSONEncoder] | None = None,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        In journal mode, saves only append the changes since the previous
+        save to a journal file, which is compacted into the main file when it
+        grows too large and when Home Assistant stops.
+        """
         self.version = version
         self.key = key
         self.hass = hass
@@ -90,12 +107,26 @@ class Store:
         self._write_lock = asyncio.Lock()
         self._load_task: asyncio.Future | None = None
         self._encoder = encoder
+        self._journal = journal
+        # The data on disk and the journal it is followed by
+        self._journal_base: dict[str, Any] | None = None
+        self._journal_id: str | None = None
+        self._journal_size = 0
+        self._main_size = 0
+        self.bytes_written = 0
+        self.journal_bytes_written = 0
+        self.compactions = 0
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def journal_path(self):
+        """Return the path of the journal."""
+        return self.path + JOURNAL_SUFFIX
+
     async def async_load(self) -> dict | list | None:
         """Load data.
 
@@ -131,9 +162,7 @@ class Store:
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
         else:
-            data = await self.hass.async_add_executor_job(
-                json_util.load_json, self.path
-            )
+            data = await self.hass.async_add_executor_job(self._load_data, self.path)
 
             if data == {}:
                 return None
@@ -208,19 +237,22 @@ class Store:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
-        await self._async_handle_write_data()
+        await self._async_handle_write_data(compact=self._journal)
 
-    async def _async_handle_write_data(self, *_args):
+    async def _async_handle_write_data(
+        self, *_args: Any, compact: bool = False
+    ) -> None:
         """Handle writing the config."""
         async with self._write_lock:
             self._async_cleanup_delay_listener()
             self._async_cleanup_final_write_listener()
 
-            if self._data is None:
-                # Another write already consumed the data
-                return
-
             data = self._data
+            if data is None:
+                if not (compact and self._journal_size) or self._journal_base is None:
+                    # Another write already consumed the data
+                    return
+                data = self._journal_base
 
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
@@ -228,12 +260,57 @@ class Store:
             self._data = None
 
             try:
-                await self.hass.async_add_executor_job(
-                    self._write_data, self.path, data
-                )
+                if self._journal:
+                    await self.hass.async_add_executor_job(
+                        self._write_journaled_data, self.path, data, compact
+                    )
+                else:
+                    await self.hass.async_add_executor_job(
+                        self._write_data, self.path, data
+                    )
             except (json_util.SerializationError, json_util.WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if self._journal_size:
+                self._async_ensure_final_write_listener()
+
+    def _load_data(self, path: str) -> dict:
+        """Load the data and replay its journal."""
+        data = cast(dict, json_util.load_json(path))
+        if "journal_id" not in data:
+            return data
+
+        self._journal_id = data.pop("journal_id")
+        self._main_size = os.path.getsize(path)
+        self._journal_size = 0
+        try:
+            with open(self.journal_path, encoding="utf-8") as journal:
+                lines = journal.readlines()
+        except FileNotFoundError:
+            lines = []
+        except OSError as err:
+            _LOGGER.error("Error reading journal of %s: %s", self.key, err)
+            lines = []
+
+        for line in lines:
+            try:
+                entry = json_loads(line)
+                if entry["journal_id"] != self._journal_id:
+                    # Left behind by a compaction that was interrupted
+                    continue
+                data["data"] = _apply_journal_ops(data["data"], entry["ops"])
+            except (ValueError, LookupError, TypeError):
+                # Written partially when Home Assistant crashed, the changes of
+                # this save are lost and the journal needs to be rewritten
+                _LOGGER.warning("Ignoring corrupt journal entry of %s", self.key)
+                self._journal_id = None
+                break
+            self._journal_size += len(line)
+
+        if self._journal_id is not None:
+            self._journal_base = json_loads(json_dumps(data, default=None))
+        return data
+
     def _write_data(self, path: str, data: dict) -> None:
         """Write the data."""
         if not os.path.isdir(os.path.dirname(path)):
@@ -241,6 +318,82 @@ class Store:
 
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_util.save_json(path, data, self._private, encoder=self._encoder)
+        self.bytes_written += os.path.getsize(path)
+
+    def _write_journaled_data(self, path: str, data: dict, compact: bool) -> None:
+        """Write the changes since the previous save to the journal.
+
+        The data is written to the main file instead if there is nothing to
+        apply the changes to or the journal grew too large.
+        """
+        try:
+            # Compare the data as it is stored
+            data = json_loads(self._serialize(data))
+        except TypeError:
+            # Let saving the main file report the invalid data
+            self._compact_journal(path, data)
+            return
+        base = self._journal_base
+
+        if (
+            compact
+            or base is None
+            or self._journal_id is None
+            or base["version"] != data["version"]
+        ):
+            self._compact_journal(path, data)
+            return
+
+        ops: list[list[Any]] = []
+        _diff_journal_ops(base["data"], data["data"], [], ops)
+        if not ops:
+            return
+
+        line = json_dumps({"journal_id": self._journal_id, "ops": ops}) + "\n"
+        if self._journal_size + len(line) > self._main_size * JOURNAL_COMPACT_RATIO:
+            self._compact_journal(path, data)
+            return
+
+        _LOGGER.debug("Writing %s changes for %s to journal", len(ops), self.key)
+        try:
+            # Start with an empty file if a compaction could not remove it
+            mode = "a" if self._journal_size else "w"
+            with open(self.journal_path, mode, encoding="utf-8") as journal:
+                journal.write(line)
+                journal.flush()
+                os.fsync(journal.fileno())
+        except OSError as err:
+            # Nothing can be appended to a journal in an unknown state
+            self._journal_id = None
+            raise json_util.WriteError(err) from err
+
+        self._journal_base = data
+        self._journal_size += len(line)
+        self.bytes_written += len(line)
+        self.journal_bytes_written += len(line)
+
+    def _compact_journal(self, path: str, data: dict) -> None:
+        """Write the data to the main file and start a new journal."""
+        self._journal_base = None
+        journal_id = random_uuid_hex()
+        # The new journal id makes stale journal entries be ignored if the
+        # journal can't be removed
+        self._write_data(path, {**data, "journal_id": journal_id})
+        with suppress(OSError):
+            os.unlink(self.journal_path)
+        self._journal_base = data
+        self._journal_id = journal_id
+        self._journal_size = 0
+        self._main_size = os.path.getsize(path)
+        self.compactions += 1
+
+    def _serialize(self, data: dict) -> str:
+        """Serialize data with the encoder of the store."""
+        if self._encoder is None:
+            return json_dumps(data, default=None)
+        if self._encoder is HAJSONEncoder:
+            return json_dumps(data)
+        return json.dumps(data, cls=self._encoder)
 
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
@@ -253,3 +406,58 @@ class Store:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if self._journal:
+            self._journal_base = None
+            self._journal_size = 0
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+
+
+def _diff_journal_ops(old: Any, new: Any, path: list, ops: list[list[Any]]) -> None:
+    """Add the operations that turn old into new to ops."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append(["del", [*path, key]])
+        for key, value in new.items():
+            if key not in old:
+                ops.append(["set", [*path, key], value])
+            elif old[key] != value:
+                _diff_journal_ops(old[key], value, [*path, key], ops)
+        return
+
+    if isinstance(old, list) and isinstance(new, list):
+        common = min(len(old), len(new))
+        for idx in range(common):
+            if old[idx] != new[idx]:
+                _diff_journal_ops(old[idx], new[idx], [*path, idx], ops)
+        if len(new) > common:
+            ops.append(["extend", path, new[common:]])
+        elif len(old) > common:
+            ops.append(["truncate", path, common])
+        return
+
+    ops.append(["set", path, new])
+
+
+def _apply_journal_ops(data: Any, ops: list[list[Any]]) -> Any:
+    """Apply journal operations to data and return the result."""
+    for kind, path, *args in ops:
+        if kind == "set" and not path:
+            data = args[0]
+            continue
+        target = data
+        for key in path[:-1] if kind in ("set", "del") else path:
+            target = target[key]
+        if kind == "set":
+            target[path[-1]] = args[0]
+        elif kind == "del":
+            del target[path[-1]]
+        elif kind == "extend":
+            target.extend(args[0])
+        elif kind == "truncate":
+            del target[args[0] :]
+        else:
+            raise ValueError(f"Unknown journal operation {kind}")
+    return data
@@ -4,22 +4,26 @@ from __future__ import annotations
 from ast import literal_eval
 import asyncio
 import base64
+from collections import OrderedDict
 import collections.abc
 from collections.abc import Callable, Generator, Iterable
 from contextlib import contextmanager, suppress
 from contextvars import ContextVar
 from datetime import datetime, timedelta
+import fnmatch
 from functools import partial, wraps
 import json
 import logging
 import math
 from operator import attrgetter
+import os
 import random
 import re
 import sys
+import threading
+from types import CodeType
 from typing import Any, cast
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 import jinja2
 from jinja2 import pass_context
@@ -65,10 +69,21 @@ _RENDER_INFO = "template.render_info"
 _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
+_BYTECODE_CACHE = "template.bytecode_cache"
+
+# Compiled code kept by the process wide cache shared by all environments
+COMPILED_CACHE_SIZE = 4096
+# Compiled code persisted by the optional bytecode cache in the config dir
+BYTECODE_CACHE_DIR = ".template_bytecode"
+BYTECODE_CACHE_MAX_FILES = COMPILED_CACHE_SIZE
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
-_IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
+_IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$", re.ASCII)
+# Match words separated by spaces. Except for the constants below these are
+# never evaluated to a literal: on, off, not_home, Living room
+_IS_WORDS = re.compile(r"^[^\W\d]\w*(?: +\w+)*$")
+_CONSTANTS = {"True": True, "False": False, "None": None}
 
 _RESERVED_NAMES = {"contextfunction", "evalcontextfunction", "environmentfunction"}
 
@@ -407,6 +422,22 @@ class Template:
 
     def _parse_result(self, render_result: str) -> Any:  # pylint: disable=no-self-use
         """Parse the result."""
+        # Fast paths for the most common results, they return the same
+        # values as the literal_eval below
+        if render_result in _CONSTANTS:
+            return _CONSTANTS[render_result]
+
+        if _IS_NUMERIC.match(render_result) is not None:
+            try:
+                if "." in render_result:
+                    return float(render_result)
+                return int(render_result)
+            except ValueError:
+                return render_result
+
+        if _IS_WORDS.match(render_result) is not None:
+            return render_result
+
         try:
             result = literal_eval(render_result)
 
@@ -1674,7 +1705,15 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             undefined = jinja2.StrictUndefined
         super().__init__(undefined=undefined)
         self.hass = hass
-        self.template_cache = weakref.WeakValueDictionary()
+        self.limited = limited
+        self.strict = strict
+        if hass is not None and hass.config.template_bytecode_cache:
+            # Shared by the environments, so the files are counted once
+            if (bytecode_cache := hass.data.get(_BYTECODE_CACHE)) is None:
+                bytecode_cache = hass.data[_BYTECODE_CACHE] = _BoundedBytecodeCache(
+                    hass.config.path(BYTECODE_CACHE_DIR), BYTECODE_CACHE_MAX_FILES
+                )
+            self.bytecode_cache = bytecode_cache
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1843,12 +1882,180 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        cached = self.template_cache.get(source)
+        # Environments without hass know fewer filters and tests, so they
+        # don't share code with the hass bound ones.
+        key = (source, self.limited, self.strict, self.hass is None)
+        cached = _COMPILED_CACHE.get(key)
 
         if cached is None:
-            cached = self.template_cache[source] = super().compile(source)
+            if self.bytecode_cache is None:
+                cached = super().compile(source)
+            else:
+                cached = self._compile_with_bytecode_cache(source)
+            _COMPILED_CACHE.set(key, cached)
 
         return cached
 
+    def _compile_with_bytecode_cache(self, source: str) -> CodeType:
+        """Load compiled code from the bytecode cache or compile and store it."""
+        bytecode_cache = cast(jinja2.BytecodeCache, self.bytecode_cache)
+        # The bucket key is derived from the name, the source checksum
+        # guards against hash collisions.
+        try:
+            bucket = bytecode_cache.get_bucket(self, source, None, source)
+        except OSError as err:
+            _LOGGER.debug("Unable to load template bytecode: %s", err)
+            return super().compile(source)
+
+        if bucket.code is not None:
+            return bucket.code
+
+        bucket.code = super().compile(source)
+        try:
+            os.makedirs(cast(Any, bytecode_cache).directory, exist_ok=True)
+            bytecode_cache.set_bucket(bucket)
+        except OSError as err:
+            _LOGGER.debug("Unable to store template bytecode: %s", err)
+        return bucket.code
+
+
+class _CompiledCodeCache:
+    """Bounded LRU of compiled template code shared by all environments."""
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the cache."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[tuple[str, bool, bool, bool], CodeType] = OrderedDict()
+        # Templates are also compiled from executor threads, e.g. config validation
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, bool, bool, bool]) -> CodeType | None:
+        """Return cached code and mark it as recently used."""
+        with self._lock:
+            code = self._cache.get(key)
+            if code is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return code
+
+    def set(self, key: tuple[str, bool, bool, bool], code: CodeType) -> None:
+        """Store compiled code, evicting the least recently used entry."""
+        with self._lock:
+            self._cache[key] = code
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached code and reset the counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> dict[str, int]:
+        """Return the cache statistics."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._cache),
+                "maxsize": self.maxsize,
+            }
+
+
+class _BoundedBytecodeCache(jinja2.FileSystemBytecodeCache):
+    """Bytecode cache on disk that keeps the most recently used files."""
+
+    def __init__(self, directory: str, max_files: int) -> None:
+        """Initialize the cache."""
+        super().__init__(directory)
+        self.max_files = max_files
+        self.hits = 0
+        self.misses = 0
+        # Paths from least to most recently used, read from disk on first use
+        self._files: OrderedDict[str, None] | None = None
+        # Templates are also compiled from executor threads, e.g. config validation
+        self._lock = threading.Lock()
+
+    def _get_files(self) -> OrderedDict[str, None]:
+        """Return the cached files, listing the directory only once."""
+        if self._files is None:
+            mtimes: dict[str, float] = {}
+            with suppress(OSError):
+                for filename in fnmatch.filter(
+                    os.listdir(self.directory), self.pattern % ("*",)
+                ):
+                    path = os.path.join(self.directory, filename)
+                    with suppress(OSError):
+                        mtimes[path] = os.stat(path).st_mtime
+            self._files = OrderedDict(
+                (path, None) for path in sorted(mtimes, key=mtimes.__getitem__)
+            )
+        return self._files
+
+    def _mark_used(self, path: str) -> OrderedDict[str, None]:
+        """Mark a file as the most recently used one."""
+        files = self._get_files()
+        files[path] = None
+        files.move_to_end(path)
+        return files
+
+    def load_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        """Load the bytecode and mark the file as recently used."""
+        super().load_bytecode(bucket)
+        with self._lock:
+            if bucket.code is None:
+                self.misses += 1
+                return
+            self.hits += 1
+            path = self._get_cache_filename(bucket)
+            self._mark_used(path)
+        with suppress(OSError):
+            os.utime(path)
+
+    def dump_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        """Store the bytecode, removing the least recently used files."""
+        super().dump_bytecode(bucket)
+        with self._lock:
+            files = self._mark_used(self._get_cache_filename(bucket))
+            stale = [
+                files.popitem(last=False)[0] for _ in range(len(files) - self.max_files)
+            ]
+        for path in stale:
+            with suppress(OSError):
+                os.remove(path)
+
+    def info(self) -> dict[str, int]:
+        """Return the cache statistics."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._get_files()),
+                "maxsize": self.max_files,
+            }
+
+
+_COMPILED_CACHE = _CompiledCodeCache(COMPILED_CACHE_SIZE)
+
+
+def compile_cache_info() -> dict[str, int]:
+    """Return hit and miss counters of the shared compiled template cache."""
+    return _COMPILED_CACHE.info()
+
+
+def bytecode_cache_info(hass: HomeAssistant) -> dict[str, int] | None:
+    """Return hit and miss counters of the bytecode cache, if enabled.
+
+    Lists the cache directory the first time, so don't call it in the event loop.
+    """
+    if (bytecode_cache := hass.data.get(_BYTECODE_CACHE)) is None:
+        return None
+    return cast(_BoundedBytecodeCache, bytecode_cache).info()
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)  # type: ignore[no-untyped-call]
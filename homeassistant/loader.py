@@ -14,8 +14,19 @@ import json
 import logging
 import pathlib
 import sys
+from time import monotonic
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Callable, Dict, TypedDict, TypeVar, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    TypedDict,
+    TypeVar,
+    cast,
+)
 
 from awesomeversion import (
     AwesomeVersion,
@@ -23,6 +34,8 @@ from awesomeversion import (
     AwesomeVersionStrategy,
 )
 
+from homeassistant.const import __version__
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.generated.dhcp import DHCP
 from homeassistant.generated.mqtt import MQTT
 from homeassistant.generated.ssdp import SSDP
@@ -45,6 +58,8 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_IMPORT_TIME = "integration_import_time"
+DATA_MANIFEST_CACHE = "manifest_cache"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -58,6 +73,10 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+MANIFEST_CACHE_STORAGE_KEY = "core.manifest_cache"
+MANIFEST_CACHE_STORAGE_VERSION = 1
+MANIFEST_CACHE_SAVE_DELAY = 10
+
 
 class Manifest(TypedDict, total=False):
     """
@@ -112,10 +131,16 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
+    manifest_cache: ManifestCache | None = hass.data.get(DATA_MANIFEST_CACHE)
+
+    def get_sub_directories(paths: list[str]) -> list[str]:
+        """Return the names of all sub directories in a set of paths."""
+        if manifest_cache is not None:
+            return [
+                name for path in paths for name in manifest_cache.sub_directories(path)
+            ]
         return [
-            entry
+            entry.name
             for path in paths
             for entry in pathlib.Path(path).iterdir()
             if entry.is_dir()
@@ -129,12 +154,15 @@ async def _async_get_custom_components(
         MAX_LOAD_CONCURRENTLY,
         *(
             hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
+                Integration.resolve_from_root, hass, custom_components, name
             )
-            for comp in dirs
+            for name in dirs
         ),
     )
 
+    if manifest_cache is not None:
+        manifest_cache.async_schedule_save()
+
     return {
         integration.domain: integration
         for integration in integrations
@@ -151,6 +179,10 @@ async def async_get_custom_components(
     if reg_or_evt is None:
         evt = hass.data[DATA_CUSTOM_COMPONENTS] = asyncio.Event()
 
+        if DATA_MANIFEST_CACHE not in hass.data:
+            manifest_cache = hass.data[DATA_MANIFEST_CACHE] = ManifestCache(hass)
+            await manifest_cache.async_load()
+
         reg = await _async_get_custom_components(hass)
 
         hass.data[DATA_CUSTOM_COMPONENTS] = reg
@@ -297,6 +329,8 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        manifest_cache: ManifestCache | None = hass.data.get(DATA_MANIFEST_CACHE)
+
         for base in root_module.__path__:  # type: ignore
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
@@ -304,7 +338,10 @@ class Integration:
                 continue
 
             try:
-                manifest = json.loads(manifest_path.read_text())
+                if manifest_cache is not None:
+                    manifest = manifest_cache.manifest(manifest_path)
+                else:
+                    manifest = json.loads(manifest_path.read_text())
             except ValueError as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
@@ -521,7 +558,9 @@ class Integration:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain not in cache:
+            start = monotonic()
             cache[self.domain] = importlib.import_module(self.pkg_path)
+            _record_import_time(self.hass, self.domain, monotonic() - start)
         return cache[self.domain]  # type: ignore
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -529,13 +568,32 @@ class Integration:
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         full_name = f"{self.domain}.{platform_name}"
         if full_name not in cache:
+            start = monotonic()
             cache[full_name] = self._import_platform(platform_name)
+            _record_import_time(self.hass, full_name, monotonic() - start)
         return cache[full_name]  # type: ignore
 
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
         return importlib.import_module(f"{self.pkg_path}.{platform_name}")
 
+    def preload_component(self) -> float | None:
+        """Import the component module so it is cached in sys.modules.
+
+        Returns the import time or None if the module was not imported.
+        This method is meant to be run in the executor.
+        """
+        if self.pkg_path in sys.modules:
+            return None
+        start = monotonic()
+        try:
+            importlib.import_module(self.pkg_path)
+        except Exception:  # pylint: disable=broad-except
+            # The error is raised again when the component is set up
+            _LOGGER.debug("Unable to preload %s", self.domain, exc_info=True)
+            return None
+        return monotonic() - start
+
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
@@ -587,14 +645,150 @@ async def _async_get_integration(hass: HomeAssistant, domain: str) -> Integratio
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
-    if integration := await hass.async_add_executor_job(
+    integration = await hass.async_add_executor_job(
         Integration.resolve_from_root, hass, components, domain
-    ):
+    )
+
+    if manifest_cache := hass.data.get(DATA_MANIFEST_CACHE):
+        manifest_cache.async_schedule_save()
+
+    if integration:
         return integration
 
     raise IntegrationNotFound(domain)
 
 
+async def async_preload_integrations(
+    hass: HomeAssistant, integrations: Iterable[Integration]
+) -> None:
+    """Import the component modules of integrations in parallel in the executor.
+
+    Importing them ahead of setup avoids blocking the event loop on imports.
+    """
+    to_preload = [
+        integration
+        for integration in integrations
+        if integration.domain not in hass.data.get(DATA_COMPONENTS, {})
+    ]
+    results = await asyncio.gather(
+        *(
+            hass.async_add_executor_job(integration.preload_component)
+            for integration in to_preload
+        )
+    )
+    for integration, seconds in zip(to_preload, results):
+        if seconds is not None:
+            _record_import_time(hass, integration.domain, seconds)
+
+
+def _record_import_time(hass: HomeAssistant, name: str, seconds: float) -> None:
+    """Record the time it took to import a module of an integration."""
+    import_time: dict[str, float] = hass.data.setdefault(DATA_IMPORT_TIME, {})
+    # Keep the time of the actual import if the module was preloaded
+    import_time.setdefault(name, seconds)
+
+
+class ManifestCache:
+    """Cache of parsed manifests and custom integration directories.
+
+    Entries are keyed by path and are only used as long as the modification
+    time of the file or directory is unchanged. The cache is dropped when
+    Home Assistant is updated.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manifest cache."""
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.helpers.storage import Store
+
+        self.hass = hass
+        self._store = Store(
+            hass, MANIFEST_CACHE_STORAGE_VERSION, MANIFEST_CACHE_STORAGE_KEY
+        )
+        self._manifests: dict[str, dict[str, Any]] = {}
+        self._directories: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+
+    async def async_load(self) -> None:
+        """Load the manifest cache from storage."""
+        try:
+            data = await self._store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Ignoring invalid manifest cache: %s", err)
+            return
+        # Anything unexpected is treated as an empty cache
+        if not isinstance(data, dict) or data.get("ha_version") != __version__:
+            return
+        manifests = data.get("manifests")
+        directories = data.get("directories")
+        if not isinstance(manifests, dict) or not isinstance(directories, dict):
+            return
+        self._manifests = {
+            key: entry
+            for key, entry in manifests.items()
+            if isinstance(entry, dict)
+            and "mtime" in entry
+            and isinstance(entry.get("manifest"), dict)
+        }
+        self._directories = {
+            key: entry
+            for key, entry in directories.items()
+            if isinstance(entry, dict)
+            and "mtime" in entry
+            and isinstance(entry.get("names"), list)
+        }
+
+    def manifest(self, manifest_path: pathlib.Path) -> Manifest:
+        """Return the parsed manifest at a path.
+
+        This method is meant to be run in the executor.
+        """
+        key = str(manifest_path)
+        mtime = manifest_path.stat().st_mtime_ns
+        if (entry := self._manifests.get(key)) is None or entry["mtime"] != mtime:
+            entry = {"mtime": mtime, "manifest": json.loads(manifest_path.read_text())}
+            self._manifests[key] = entry
+            self._dirty = True
+        # The integration adds keys to its manifest
+        return cast(Manifest, dict(entry["manifest"]))
+
+    def sub_directories(self, path: str) -> list[str]:
+        """Return the names of the sub directories of a path.
+
+        This method is meant to be run in the executor.
+        """
+        # Adding or removing an entry updates the mtime of the directory
+        mtime = pathlib.Path(path).stat().st_mtime_ns
+        if (entry := self._directories.get(path)) is None or entry["mtime"] != mtime:
+            entry = {
+                "mtime": mtime,
+                "names": [
+                    sub_dir.name
+                    for sub_dir in pathlib.Path(path).iterdir()
+                    if sub_dir.is_dir()
+                ],
+            }
+            self._directories[path] = entry
+            self._dirty = True
+        return cast(List[str], entry["names"])
+
+    def async_schedule_save(self) -> None:
+        """Schedule saving the cache if it changed."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        self._store.async_delay_save(self._data_to_save, MANIFEST_CACHE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the cache to store."""
+        # Copied because the executor may add entries while it is written
+        return {
+            "ha_version": __version__,
+            "manifests": dict(self._manifests),
+            "directories": dict(self._directories),
+        }
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
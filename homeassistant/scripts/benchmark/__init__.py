@@ -9,6 +9,7 @@ from contextlib import suppress
 from datetime import datetime
 import json
 import logging
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 from typing import TypeVar
 
@@ -16,7 +17,7 @@ from homeassistant import core
 from homeassistant.components.websocket_api.const import JSON_DUMP
 from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_dumps
 from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
@@ -378,6 +379,27 @@ async def valid_entity_id(hass):
     return timer() - start
 
 
+@benchmark
+async def template_render(hass):
+    """Render 100k templates with typical state based results."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.template import Template
+
+    hass.states.async_set("sensor.power", "1234.5")
+    hass.states.async_set("light.kitchen", "on")
+    templates = [
+        Template("{{ states('sensor.power') | float * 2 }}", hass),
+        Template("{{ states('light.kitchen') }}", hass),
+        Template("{{ is_state('light.kitchen', 'on') }}", hass),
+        Template("{{ state_attr('light.kitchen', 'friendly_name') }}", hass),
+    ]
+
+    start = timer()
+    for idx in range(10 ** 5):
+        templates[idx % 4].async_render()
+    return timer() - start
+
+
 @benchmark
 async def json_serialize_states(hass):
     """Serialize million states with websocket default encoder."""
@@ -391,6 +413,346 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def json_dumps_state_payloads(hass):
+    """Serialize 100k state changed event payloads with the json helper."""
+    return _json_dumps_state_payloads(json_dumps)
+
+
+@benchmark
+async def json_dumps_state_payloads_stdlib(hass):
+    """Serialize 100k state changed event payloads with the json module."""
+    return _json_dumps_state_payloads(
+        lambda data: json.dumps(data, cls=JSONEncoder, separators=(",", ":"))
+    )
+
+
+def _json_dumps_state_payloads(dump):
+    """Serialize state changed event payloads of different kinds of entities."""
+    now = dt_util.utcnow()
+    attributes = [
+        {"friendly_name": "Kitchen Lights"},
+        {
+            "friendly_name": "Living Room",
+            "supported_color_modes": {"color_temp", "hs"},
+            "color_mode": "hs",
+            "brightness": 180,
+            "hs_color": (30.0, 61.2),
+            "rgb_color": (255, 180, 99),
+            "xy_color": (0.524, 0.388),
+            "supported_features": 44,
+        },
+        {
+            "friendly_name": "Outdoor Temperature",
+            "unit_of_measurement": "°C",
+            "device_class": "temperature",
+            "state_class": "measurement",
+        },
+        {
+            "friendly_name": "Home",
+            "latitude": 52.3731339,
+            "longitude": 4.8903147,
+            "gps_accuracy": 12,
+            "source_type": "gps",
+            "last_seen": now,
+        },
+    ]
+    payloads = []
+    for idx in range(10 ** 5):
+        entity_id = f"sensor.entity_{idx}"
+        attrs = attributes[idx % len(attributes)]
+        payloads.append(
+            {
+                "entity_id": entity_id,
+                "old_state": core.State(entity_id, "20.5", attrs, now, now),
+                "new_state": core.State(entity_id, "21.0", attrs, now, now),
+            }
+        )
+
+    start = timer()
+    for payload in payloads:
+        dump(payload)
+    return timer() - start
+
+
+@benchmark
+async def statistics_sensor_update(hass):
+    """Update a statistics sensor with a 10k samples window 1000 times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.statistics.sensor import StatisticsSensor
+
+    sensor = StatisticsSensor("sensor.power", "Power", 10 ** 4, None, 2, 4, "exclusive")
+    sensor.hass = hass
+    sensor.entity_id = "sensor.power_stats"
+    states = _create_statistics_states()
+    for state in states[: 10 ** 4]:
+        sensor._add_state_to_queue(state)  # pylint: disable=protected-access
+
+    start = timer()
+    for state in states[10 ** 4 :]:
+        sensor._add_state_to_queue(state)  # pylint: disable=protected-access
+        await sensor.async_update()
+    return timer() - start
+
+
+@benchmark
+async def statistics_sensor_update_stdlib(hass):
+    """Compute the statistics of a 10k samples window 1000 times from scratch."""
+    # pylint: disable=import-outside-toplevel
+    import statistics
+
+    values = collections.deque(maxlen=10 ** 4)
+    states = _create_statistics_states()
+    for state in states[: 10 ** 4]:
+        values.append(float(state.state))
+
+    start = timer()
+    for state in states[10 ** 4 :]:
+        values.append(float(state.state))
+        statistics.mean(values)
+        statistics.median(values)
+        statistics.stdev(values)
+        statistics.variance(values)
+        statistics.quantiles(values, n=4, method="exclusive")
+        sum(values)
+        min(values)
+        max(values)
+    return timer() - start
+
+
+def _create_statistics_states():
+    """Create 11k states of a power sensor."""
+    now = dt_util.utcnow()
+    return [
+        core.State("sensor.power", str(round(idx * 7919 % 10007 / 3, 2)), {}, now, now)
+        for idx in range(11 * 10 ** 3)
+    ]
+
+
+@benchmark
+async def zone_active_zone(hass):
+    """Find the active zone of 100 trackers moving between 500 zones."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components import zone
+
+    updates = 100
+    trackers = 100
+
+    # A city sized grid of zones
+    for idx in range(500):
+        hass.states.async_set(
+            f"zone.zone_{idx}",
+            "zoning",
+            {
+                "latitude": 52.3 + idx % 25 * 0.008,
+                "longitude": 4.8 + idx // 25 * 0.012,
+                "radius": 100 + idx % 5 * 50,
+                "passive": False,
+            },
+        )
+
+    start = timer()
+    for update in range(updates):
+        for tracker in range(trackers):
+            zone.async_active_zone(
+                hass,
+                52.3 + (tracker * 7 + update) % 200 * 0.001,
+                4.8 + (tracker * 13 + update) % 240 * 0.001,
+                20 + tracker % 4 * 10,
+            )
+    return timer() - start
+
+
+@benchmark
+async def mqtt_dispatch_messages(hass):
+    """Dispatch 100k MQTT messages with 10k subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from paho.mqtt.client import MQTTMessage
+
+    from homeassistant import config_entries
+    from homeassistant.components import mqtt
+
+    count = 0
+    devices = 2500
+    messages_to_dispatch = 10 ** 5
+
+    @core.callback
+    def listener(_):
+        """Handle message."""
+        nonlocal count
+        count += 1
+
+    conf = {
+        mqtt.CONF_BROKER: "mock-broker",
+        mqtt.CONF_PORT: mqtt.DEFAULT_PORT,
+        mqtt.CONF_PROTOCOL: mqtt.DEFAULT_PROTOCOL,
+    }
+    entry = config_entries.ConfigEntry(
+        1, mqtt.DOMAIN, "mock-broker", conf, config_entries.SOURCE_USER
+    )
+    client = mqtt.MQTT(hass, entry, conf)
+
+    # Mix of exact and wildcard filters, as Zigbee2MQTT and Tasmota set up
+    for idx in range(devices):
+        await client.async_subscribe(f"zigbee2mqtt/device_{idx}", listener, 0)
+        await client.async_subscribe(f"zigbee2mqtt/device_{idx}/+", listener, 0)
+        await client.async_subscribe(f"tele/tasmota_{idx}/#", listener, 0)
+        await client.async_subscribe(f"stat/tasmota_{idx}/POWER", listener, 0)
+
+    msgs = []
+    for idx in range(1000):
+        msg = MQTTMessage(topic=f"tele/tasmota_{idx}/SENSOR".encode())
+        msg.payload = b'{"ENERGY": {"Power": 12}}'
+        msgs.append(msg)
+
+    start = timer()
+
+    for idx in range(messages_to_dispatch):
+        # pylint: disable=protected-access
+        client._mqtt_handle_message(msgs[idx % 1000])
+
+    await hass.async_block_till_done()
+
+    assert count == messages_to_dispatch
+
+    return timer() - start
+
+
+@benchmark
+async def registry_lookups(hass):
+    """Look up 10k entities and 2k devices by device, area and config entry."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import config_entries as ce
+    from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+    devices = 2000
+    entities_per_device = 5
+    areas = 50
+    config_entries = 20
+
+    with TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        dev_reg = dr.async_get(hass)
+        ent_reg = er.async_get(hass)
+
+        entries = [
+            ce.ConfigEntry(
+                1, "benchmark", "Benchmark", {}, ce.SOURCE_USER, entry_id=f"entry_{idx}"
+            )
+            for idx in range(config_entries)
+        ]
+        device_ids = []
+        for idx in range(devices):
+            config_entry = entries[idx % config_entries]
+            device = dev_reg.async_get_or_create(
+                config_entry_id=config_entry.entry_id,
+                identifiers={("benchmark", str(idx))},
+            )
+            dev_reg.async_update_device(device.id, area_id=f"area_{idx % areas}")
+            device_ids.append(device.id)
+            for num in range(entities_per_device):
+                ent_reg.async_get_or_create(
+                    "sensor",
+                    "benchmark",
+                    f"{idx}_{num}",
+                    config_entry=config_entry,
+                    device_id=device.id,
+                )
+        await hass.async_block_till_done()
+
+        start = timer()
+        for _ in range(10):
+            for device_id in device_ids:
+                assert len(er.async_entries_for_device(ent_reg, device_id)) == 5
+            for idx in range(areas):
+                dr.async_entries_for_area(dev_reg, f"area_{idx}")
+                er.async_entries_for_area(ent_reg, f"area_{idx}")
+            for config_entry in entries:
+                dr.async_entries_for_config_entry(dev_reg, config_entry.entry_id)
+                er.async_entries_for_config_entry(ent_reg, config_entry.entry_id)
+        return timer() - start
+
+
+@benchmark
+async def recorder_write_states(hass):
+    """Write 100k state changes with the recorder session."""
+    return await _recorder_write_states(hass, False)
+
+
+@benchmark
+async def recorder_bulk_write_states(hass):
+    """Write 100k state changes with recorder bulk inserts."""
+    return await _recorder_write_states(hass, True)
+
+
+async def _recorder_write_states(hass, bulk_insert):
+    # pylint: disable=import-outside-toplevel,protected-access
+    from homeassistant.components import recorder
+
+    events_to_write = 10 ** 5
+    # State changes received between two commits, ie. 200 per second
+    events_per_commit = 200
+
+    events = []
+    old_states = {}
+    for idx in range(events_to_write):
+        entity_id = f"sensor.power_{idx % 1000}"
+        new_state = core.State(
+            entity_id,
+            str(idx),
+            {"unit_of_measurement": "W", "friendly_name": f"Power {idx % 1000}"},
+        )
+        events.append(
+            core.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "old_state": old_states.get(entity_id),
+                    "new_state": new_state,
+                },
+            )
+        )
+        old_states[entity_id] = new_state
+
+    with TemporaryDirectory() as tmpdir:
+        instance = recorder.Recorder(
+            hass,
+            auto_purge=False,
+            keep_days=10,
+            commit_interval=1,
+            uri=f"{recorder.SQLITE_URL_PREFIX}//{tmpdir}/benchmark.db",
+            db_max_retries=1,
+            db_retry_wait=0,
+            entity_filter=lambda entity_id: True,
+            exclude_t=[],
+            bulk_insert=bulk_insert,
+        )
+
+        def write_states():
+            """Process the events as the recorder thread does."""
+            instance._setup_connection()
+            instance._setup_run()
+
+            start = timer()
+            for idx, event in enumerate(events, 1):
+                instance._process_one_event(event)
+                if idx % events_per_commit == 0:
+                    instance._commit_event_session_or_retry()
+            instance._commit_event_session_or_retry()
+            runtime = timer() - start
+
+            instance._end_session()
+            instance._close_connection()
+            return runtime
+
+        runtime = await hass.async_add_executor_job(write_states)
+
+    print(f"Wrote {events_to_write / runtime:.0f} state changes/s")
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
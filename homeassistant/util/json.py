@@ -11,6 +11,7 @@ from typing import Any
 
 from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import JSONEncoder, json_dumps, json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,7 +31,7 @@ def load_json(filename: str, default: list | dict | None = None) -> list | dict:
     """
     try:
         with open(filename, encoding="utf-8") as fdesc:
-            return json.loads(fdesc.read())  # type: ignore
+            return json_loads(fdesc.read())  # type: ignore
     except FileNotFoundError:
         # This is not a fatal error
         _LOGGER.debug("JSON file not found: %s", filename)
@@ -55,7 +56,12 @@ def save_json(
     Returns True on success.
     """
     try:
-        json_data = json.dumps(data, indent=4, cls=encoder)
+        if encoder is None:
+            json_data = json_dumps(data, pretty=True, default=None)
+        elif encoder is JSONEncoder:
+            json_data = json_dumps(data, pretty=True)
+        else:
+            json_data = json.dumps(data, indent=4, cls=encoder)
     except TypeError as error:
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
         _LOGGER.error(msg)
@@ -666,6 +666,10 @@ class MockEntityPlatform(entity_platform.EntityPlatform):
         # Otherwise the constructor will blow up.
         if isinstance(platform, Mock) and isinstance(platform.PARALLEL_UPDATES, Mock):
             platform.PARALLEL_UPDATES = 0
+        if isinstance(platform, Mock) and isinstance(
+            platform.STATE_WRITE_INTERVAL, Mock
+        ):
+            platform.STATE_WRITE_INTERVAL = None
 
         super().__init__(
             hass=hass,
@@ -1029,6 +1033,10 @@ def mock_storage(data=None):
         # To ensure that the data can be serialized
         data[store.key] = json.loads(json.dumps(data_to_write, cls=store._encoder))
 
+    def mock_write_journaled_data(store, path, data_to_write, compact):
+        """Mock version of writing data in journal mode."""
+        mock_write_data(store, path, data_to_write)
+
     async def mock_remove(store):
         """Remove data."""
         data.pop(store.key, None)
@@ -1041,6 +1049,10 @@ def mock_storage(data=None):
         "homeassistant.helpers.storage.Store._write_data",
         side_effect=mock_write_data,
         autospec=True,
+    ), patch(
+        "homeassistant.helpers.storage.Store._write_journaled_data",
+        side_effect=mock_write_journaled_data,
+        autospec=True,
     ), patch(
         "homeassistant.helpers.storage.Store.async_remove",
         side_effect=mock_remove,
@@ -1,16 +1,19 @@
 """The test for the data filter sensor platform."""
+from copy import copy
 from datetime import timedelta
 from os import path
 from unittest.mock import patch
 
-from pytest import fixture
+from pytest import fixture, mark
 
 from homeassistant import config as hass_config
+from homeassistant.components.filter import sensor as filter_sensor
 from homeassistant.components.filter.sensor import (
     DOMAIN,
     LowPassFilter,
     OutlierFilter,
     RangeFilter,
+    RingBuffer,
     ThrottleFilter,
     TimeSMAFilter,
     TimeThrottleFilter,
@@ -449,6 +452,72 @@ def test_time_sma(values):
     assert filtered.state == 21.5
 
 
+def test_ring_buffer():
+    """Test the ring buffer keeps the newest values in order."""
+    buffer = RingBuffer(3)
+    assert list(buffer) == []
+    buffer.extend([1, 2])
+    assert list(buffer) == [1, 2]
+    buffer.append(3)
+    buffer.append(4)
+    assert list(buffer) == [2, 3, 4]
+    assert (len(buffer), buffer[0], buffer[-1]) == (3, 2, 4)
+    buffer.extend([5, 6, 7, 8])
+    assert list(buffer) == [6, 7, 8]
+    buffer.clear()
+    assert not buffer
+
+
+@mark.parametrize("numpy_module", [filter_sensor.numpy, None])
+@mark.parametrize(
+    "create_filter",
+    [
+        lambda: OutlierFilter(window_size=4, precision=2, entity=None, radius=4.0),
+        lambda: LowPassFilter(
+            window_size=10, precision=0, entity=None, time_constant=4
+        ),
+        lambda: RangeFilter(entity=None, precision=2, lower_bound=5, upper_bound=25),
+        lambda: ThrottleFilter(window_size=3, precision=2, entity=None),
+        lambda: TimeThrottleFilter(
+            window_size=timedelta(minutes=2), precision=2, entity=None
+        ),
+        lambda: TimeSMAFilter(
+            window_size=timedelta(minutes=3), precision=2, entity=None, type="last"
+        ),
+    ],
+)
+def test_filter_batch(create_filter, numpy_module):
+    """Test filtering a batch gives the same result as one state at a time."""
+    states = []
+    timestamp = dt_util.utcnow()
+    for idx in range(40):
+        value = 15 + idx % 7 * 1.37 + (40 if idx % 11 == 0 else 0)
+        states.append(ha.State("sensor.test_monitored", value, last_updated=timestamp))
+        timestamp += timedelta(seconds=50)
+
+    expected = []
+    filt = create_filter()
+    for state in states:
+        filtered = filt.filter_state(copy(state))
+        if not filt.skip_processing:
+            expected.append(filtered.state)
+
+    batch_filt = create_filter()
+    with patch("homeassistant.components.filter.sensor.numpy", numpy_module):
+        kept, filtered_values = batch_filt.filter_batch(
+            [state.last_updated.timestamp() for state in states[:30]],
+            [float(state.state) for state in states[:30]],
+        )
+    result = filtered_values
+    for state in states[30:]:
+        filtered = batch_filt.filter_state(state)
+        if not batch_filt.skip_processing:
+            result.append(filtered.state)
+
+    assert result == expected
+    assert len(kept) <= 30
+
+
 async def test_reload(hass):
     """Verify we can reload filter sensors."""
     await async_init_recorder_component(hass)
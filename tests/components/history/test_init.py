@@ -8,8 +8,13 @@ import pytest
 from pytest import approx
 
 from homeassistant.components import history, recorder
-from homeassistant.components.recorder.history import get_significant_states
+from homeassistant.components.recorder.history import (
+    get_significant_states,
+    states_to_columns,
+    stream_significant_states_with_session,
+)
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.util import session_scope
 import homeassistant.core as ha
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.setup import async_setup_component
@@ -75,6 +80,74 @@ def test_get_significant_states_minimal_response(hass_history):
     assert states == hist
 
 
+@pytest.mark.parametrize("minimal_response", [False, True])
+@pytest.mark.parametrize("include_start_time_state", [False, True])
+def test_stream_significant_states(
+    hass_history, minimal_response, include_start_time_state
+):
+    """Test streaming significant states matches fetching them at once."""
+    hass = hass_history
+    zero, four, _ = record_states(hass)
+    one = zero + timedelta(seconds=1)
+    two = one + timedelta(seconds=1)
+
+    for start_time in (zero, one, two):
+        kwargs = {
+            "filters": history.Filters(),
+            "include_start_time_state": include_start_time_state,
+            "minimal_response": minimal_response,
+        }
+        hist = get_significant_states(hass, start_time, four, **kwargs)
+
+        with session_scope(hass=hass) as session:
+            streamed = {
+                entity_id: list(states)
+                for entity_id, states in stream_significant_states_with_session(
+                    hass, session, start_time, four, **kwargs
+                )
+            }
+
+        assert streamed == hist
+
+
+def test_states_to_columns(hass_history):
+    """Test converting the states of an entity to the compact format."""
+    hass = hass_history
+    zero, four, states = record_states(hass)
+    hist = get_significant_states(hass, zero, four, filters=history.Filters())
+
+    therm = hist["thermostat.test"]
+    assert states_to_columns(therm) == {
+        "s": ["20", "21", "21"],
+        "lc": [state.last_changed.timestamp() for state in therm[:2]]
+        + [therm[1].last_changed.timestamp()],
+        "lu": [[2, therm[2].last_updated.timestamp()]],
+        "a": [
+            [0, {"current_temperature": 19.5}],
+            [1, {"current_temperature": 19.8}],
+            [2, {"current_temperature": 20}],
+        ],
+    }
+
+    hist = get_significant_states(
+        hass, zero, four, filters=history.Filters(), minimal_response=True
+    )
+    media_player = hist["media_player.test"]
+    assert states_to_columns(media_player) == {
+        "s": ["idle", "YouTube", "Netflix"],
+        "lc": [
+            states["media_player.test"][0].last_changed.timestamp(),
+            states["media_player.test"][1].last_changed.timestamp(),
+            states["media_player.test"][2].last_changed.timestamp(),
+        ],
+        "lu": [],
+        "a": [
+            [0, {"media_title": str(sentinel.mt1)}],
+            [2, {"media_title": str(sentinel.mt4)}],
+        ],
+    }
+
+
 def test_get_significant_states_with_initial(hass_history):
     """Test that only significant states are returned.
 
@@ -613,6 +686,110 @@ async def test_fetch_period_api_with_minimal_response(hass, hass_client):
     assert response.status == 200
 
 
+@pytest.mark.parametrize("query", ["", "&minimal_response"])
+async def test_fetch_period_api_stream(hass, hass_client, query):
+    """Test the fetch period view streaming the response."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    for i in range(10):
+        hass.states.async_set("sensor.power", i)
+        hass.states.async_set("light.kitchen", "on" if i % 2 else "off")
+    hass.states.async_set("light.cow", "on")
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    url = f"/api/history/period/{start.isoformat()}?significant_changes_only=0{query}"
+    response = await client.get(url)
+    assert response.status == 200
+    expected = await response.json()
+
+    with patch.object(history, "STREAM_CHUNK_SIZE", 3):
+        response = await client.get(f"{url}&stream")
+    assert response.status == 200
+    assert response.headers["Content-Type"] == "application/json"
+    streamed = await response.json()
+
+    assert [states[0]["entity_id"] for states in streamed] == [
+        "light.cow",
+        "light.kitchen",
+        "sensor.power",
+    ]
+    assert sorted(streamed, key=lambda states: states[0]["entity_id"]) == sorted(
+        expected, key=lambda states: states[0]["entity_id"]
+    )
+    assert len(streamed[2]) == 10
+
+
+@pytest.mark.parametrize("query", ["", "&stream"])
+async def test_fetch_period_api_compact(hass, hass_client, query):
+    """Test the fetch period view with the compact format."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 200})
+    hass.states.async_set("light.kitchen", "off", {"brightness": 200})
+    hass.states.async_set("light.cow", "on")
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    url = f"/api/history/period/{start.isoformat()}?significant_changes_only=0"
+    response = await client.get(url)
+    assert response.status == 200
+    expected = {states[0]["entity_id"]: states for states in await response.json()}
+
+    response = await client.get(f"{url}&compact{query}")
+    assert response.status == 200
+    compact = await response.json()
+
+    assert compact.keys() == expected.keys()
+    kitchen = expected["light.kitchen"]
+    assert compact["light.kitchen"] == {
+        "s": ["on", "on", "off"],
+        "lc": [
+            approx(dt_util.parse_datetime(kitchen[0]["last_changed"]).timestamp()),
+            approx(dt_util.parse_datetime(kitchen[0]["last_changed"]).timestamp()),
+            approx(dt_util.parse_datetime(kitchen[2]["last_changed"]).timestamp()),
+        ],
+        "lu": [
+            [1, approx(dt_util.parse_datetime(kitchen[1]["last_updated"]).timestamp())]
+        ],
+        "a": [[0, {"brightness": 100}], [1, {"brightness": 200}]],
+    }
+    assert compact["light.cow"]["s"] == ["on"]
+    assert compact["light.cow"]["a"] == [[0, {}]]
+
+    response = await client.get(
+        f"/api/history/period/{dt_util.utcnow().isoformat()}?compact{query}"
+        "&skip_initial_state&filter_entity_id=light.kitchen"
+    )
+    assert response.status == 200
+    assert await response.json() == {}
+
+
+async def test_fetch_period_api_stream_empty(hass, hass_client):
+    """Test streaming the fetch period view without any states."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{dt_util.utcnow().isoformat()}?stream"
+        "&filter_entity_id=light.kitchen"
+    )
+    assert response.status == 200
+    assert await response.json() == []
+
+
 async def test_fetch_period_api_with_no_timestamp(hass, hass_client):
     """Test the fetch period view for history with no timestamp."""
     await hass.async_add_executor_job(init_recorder_component, hass)
@@ -920,6 +1097,27 @@ async def test_statistics_during_period(
         ]
     }
 
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "history/statistics_during_period",
+            "start_time": now.isoformat(),
+            "statistic_ids": ["sensor.test"],
+            "period": "5minute",
+            "compact": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "sensor.test": {
+            "start": [approx(now.timestamp())],
+            "mean": [approx(value)],
+            "min": [approx(value)],
+            "max": [approx(value)],
+        }
+    }
+
 
 async def test_statistics_during_period_bad_start_time(hass, hass_ws_client):
     """Test statistics_during_period."""
@@ -352,6 +352,80 @@ async def test_measure_multiple(hass):
     assert hass.states.get("sensor.sensor4").state == "50.0"
 
 
+async def test_measure_from_state_changes(hass):
+    """Test the history statistics sensor only queries the recorder once."""
+    await async_init_recorder_component(hass)
+
+    t0 = dt_util.utcnow() - timedelta(minutes=40)
+    t1 = t0 + timedelta(minutes=20)
+    t2 = dt_util.utcnow() - timedelta(minutes=10)
+
+    # Start     t0        t1        t2        End
+    # |--20min--|--20min--|--10min--|--10min--|
+    # |---off---|---on----|---off---|---on----|
+
+    fake_states = {
+        "binary_sensor.test_id": [
+            ha.State("binary_sensor.test_id", "on", last_changed=t0),
+            ha.State("binary_sensor.test_id", "off", last_changed=t1),
+            ha.State("binary_sensor.test_id", "on", last_changed=t2),
+        ]
+    }
+
+    await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "history_stats",
+                    "entity_id": "binary_sensor.test_id",
+                    "name": "sensor1",
+                    "state": "on",
+                    "start": "{{ as_timestamp(now()) - states('input_number.hours')"
+                    " | int * 3600 }}",
+                    "end": "{{ now() }}",
+                    "type": "count",
+                },
+            ]
+        },
+    )
+    hass.states.async_set("input_number.hours", "1")
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        return_value=fake_states,
+    ) as mock_changes, patch(
+        "homeassistant.components.recorder.history.get_state", return_value=None
+    ):
+        await hass.helpers.entity_component.async_update_entity("sensor.sensor1")
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.sensor1").state == "2"
+        assert mock_changes.call_count == 1
+
+        hass.states.async_set("binary_sensor.test_id", "off")
+        await hass.async_block_till_done()
+        hass.states.async_set("binary_sensor.test_id", "on")
+        await hass.async_block_till_done()
+        hass.states.async_set("binary_sensor.test_id", "on", {"attr": 1})
+        await hass.async_block_till_done()
+
+        now = dt_util.now() + timedelta(seconds=2)
+        with patch("homeassistant.util.dt.now", return_value=now):
+            await hass.helpers.entity_component.async_update_entity("sensor.sensor1")
+            await hass.async_block_till_done()
+        assert hass.states.get("sensor.sensor1").state == "3"
+        assert mock_changes.call_count == 1
+
+        # The window now starts before the cached history, so it is
+        # loaded again from the recorder
+        hass.states.async_set("input_number.hours", "2")
+        await hass.helpers.entity_component.async_update_entity("sensor.sensor1")
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.sensor1").state == "2"
+        assert mock_changes.call_count == 2
+
+
 async def async_test_measure(hass):
     """Test the history statistics sensor measure."""
     t0 = dt_util.utcnow() - timedelta(minutes=40)
@@ -1,6 +1,10 @@
 """The tests for the InfluxDB component."""
 from dataclasses import dataclass
 import datetime
+import gzip
+import http.server
+import os
+import threading
 from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
@@ -14,7 +18,7 @@ from homeassistant.const import (
     STATE_ON,
     STATE_STANDBY,
 )
-from homeassistant.core import split_entity_id
+from homeassistant.core import State, split_entity_id
 from homeassistant.setup import async_setup_component
 
 INFLUX_PATH = "homeassistant.components.influxdb"
@@ -1790,3 +1794,224 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+class _InfluxStandIn(http.server.BaseHTTPRequestHandler):
+    """Record requests to a local stand-in for an InfluxDB server."""
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Record a write and answer with the configured status."""
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.requests.append((self.path, dict(self.headers), body))
+        self.send_response(self.server.status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        """Don't log requests."""
+
+
+@pytest.fixture(name="influx_stand_in")
+def influx_stand_in_fixture(socket_enabled):
+    """Run a local HTTP stand-in for an InfluxDB server."""
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _InfluxStandIn)
+    server.requests = []
+    server.status = 204
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _gzip_writes(server):
+    """Return the decompressed line protocol bodies written to the stand-in."""
+    return [
+        gzip.decompress(body).decode()
+        for _, headers, body in server.requests
+        if headers.get("Content-Encoding") == "gzip"
+    ]
+
+
+def _power_event(state, time_fired):
+    """Return a state changed event for a power sensor."""
+    return MagicMock(
+        data={
+            "new_state": State(
+                "sensor.power", state, {"unit_of_measurement": "W", "name": "P 1"}
+            )
+        },
+        time_fired=time_fired,
+    )
+
+
+def test_json_to_line_protocol():
+    """Test encoding points as line protocol."""
+    time_fired = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+    json = {
+        "measurement": "my measurement,1",
+        "tags": {"entity_id": "power", "domain": "sensor", "area": "", "x=y": "a b"},
+        "time": time_fired,
+        "fields": {
+            "value": 12.5,
+            "state_str": 'say "hi"\\',
+            "count": 3,
+            "on": True,
+            "inf": float("inf"),
+        },
+    }
+
+    assert influxdb.json_to_line_protocol(json, None) == (
+        "my\\ measurement\\,1,domain=sensor,entity_id=power,x\\=y=a\\ b "
+        'value=12.5,state_str="say \\"hi\\"\\\\",count=3i,on=true '
+        "1609459200000000000"
+    )
+    assert influxdb.json_to_line_protocol(json, "s").endswith(" 1609459200")
+    assert influxdb.json_to_line_protocol(json, "ms").endswith(" 1609459200000")
+
+    json["fields"] = {"inf": float("inf")}
+    assert influxdb.json_to_line_protocol(json, None) is None
+
+
+@pytest.mark.parametrize(
+    "config_ext, path",
+    [
+        (BASE_V1_CONFIG, "/write?db=home_assistant"),
+        (
+            {**BASE_V2_CONFIG, "ssl": False, "bucket": "bucket"},
+            "/api/v2/write?org=org&bucket=bucket",
+        ),
+    ],
+)
+async def test_high_throughput_writes_gzip_line_protocol(
+    hass, tmp_path, influx_stand_in, config_ext, path
+):
+    """Test high throughput mode writes gzip compressed line protocol."""
+    hass.config.config_dir = str(tmp_path)
+    config = {
+        "influxdb": {
+            "host": "127.0.0.1",
+            "port": influx_stand_in.server_port,
+            "high_throughput": True,
+            **config_ext,
+        }
+    }
+    assert await async_setup_component(hass, influxdb.DOMAIN, config)
+    await hass.async_block_till_done()
+    handler_method = hass.bus.listen.call_args_list[0][0][1]
+    writer = hass.data[influxdb.DOMAIN]
+    time_fired = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+
+    handler_method(_power_event("12.5", time_fired))
+    await hass.async_add_executor_job(writer.block_till_done)
+
+    assert _gzip_writes(influx_stand_in) == [
+        'W,domain=sensor,entity_id=power value=12.5,name_str="P 1" '
+        "1609459200000000000\n"
+    ]
+    request_path, headers, _ = influx_stand_in.requests[-1]
+    assert request_path == path
+    assert headers["Content-Type"].startswith("text/plain")
+    assert writer.write_latency is not None
+
+
+async def test_high_throughput_spools_failed_writes(
+    hass, tmp_path, influx_stand_in, monkeypatch
+):
+    """Test batches are spooled while InfluxDB is unavailable."""
+    monkeypatch.setattr(f"{INFLUX_PATH}.RETRY_DELAY", 0)
+    hass.config.config_dir = str(tmp_path)
+    config = {
+        "influxdb": {
+            "host": "127.0.0.1",
+            "port": influx_stand_in.server_port,
+            "high_throughput": True,
+        }
+    }
+    assert await async_setup_component(hass, influxdb.DOMAIN, config)
+    await hass.async_block_till_done()
+    handler_method = hass.bus.listen.call_args_list[0][0][1]
+    writer = hass.data[influxdb.DOMAIN]
+    time_fired = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+
+    influx_stand_in.status = 503
+    handler_method(_power_event("1", time_fired))
+    await hass.async_add_executor_job(writer.block_till_done)
+
+    assert len(writer.spool) == 1
+    assert writer.spool.events == 1
+    assert len(os.listdir(tmp_path / ".influxdb_spool")) == 1
+
+    influx_stand_in.requests.clear()
+    influx_stand_in.status = 204
+    handler_method(_power_event("2", time_fired + datetime.timedelta(seconds=1)))
+    await hass.async_add_executor_job(writer.block_till_done)
+
+    assert [body.split(" ")[1] for body in _gzip_writes(influx_stand_in)] == [
+        'value=1.0,name_str="P',
+        'value=2.0,name_str="P',
+    ]
+    assert len(writer.spool) == 0
+    assert os.listdir(tmp_path / ".influxdb_spool") == []
+    assert writer.dropped_events == 0
+
+
+def test_spool_is_bounded_and_persistent(tmp_path):
+    """Test the spool drops the oldest batches when full and survives restarts."""
+    path = str(tmp_path / "spool")
+    spool = influxdb.InfluxSpool(path, 10)
+
+    assert spool.add(b"abcd", 1) == 0
+    assert spool.add(b"efgh", 2) == 0
+    assert spool.add(b"ijkl", 3) == 1
+    assert len(spool) == 2
+    assert spool.events == 5
+    assert spool.size == 8
+
+    spool = influxdb.InfluxSpool(path, 10)
+    assert len(spool) == 2
+    assert spool.events == 5
+    assert spool.oldest() == (b"efgh", 2)
+    spool.remove_oldest()
+    assert spool.oldest() == (b"ijkl", 3)
+
+    spool.add(b"mnop", 4)
+    spool.remove_oldest()
+    assert spool.oldest() == (b"mnop", 4)
+
+
+def test_batch_size_adapts_to_write_latency(hass, tmp_path):
+    """Test the batch size grows with fast writes and shrinks with slow ones."""
+    writer = influxdb.InfluxBatchThread(
+        hass, Mock(), Mock(), 0, None, influxdb.InfluxSpool(str(tmp_path), 1000)
+    )
+    assert writer.batch_size == influxdb.BATCH_BUFFER_SIZE
+
+    writer._write_batch(b"", influxdb.BATCH_BUFFER_SIZE)
+    assert writer.batch_size == influxdb.BATCH_BUFFER_SIZE * 2
+
+    # Batches which aren't full don't grow the batch size
+    writer._write_batch(b"", 1)
+    assert writer.batch_size == influxdb.BATCH_BUFFER_SIZE * 2
+
+    with patch(f"{INFLUX_PATH}.time.monotonic", side_effect=[0, 1.0]):
+        writer._write_batch(b"", writer.batch_size)
+    assert writer.batch_size == influxdb.BATCH_BUFFER_SIZE
+    assert writer.write_latency == 1.0
+
+
+@pytest.mark.parametrize(
+    "mock_client", [influxdb.DEFAULT_API_VERSION], indirect=["mock_client"]
+)
+async def test_high_throughput_metric_sensors(hass, tmp_path, mock_client):
+    """Test the metrics of the writer are exposed as sensors."""
+    hass.config.config_dir = str(tmp_path)
+    config = {"influxdb": {"host": "host", "high_throughput": True}}
+    assert await async_setup_component(hass, influxdb.DOMAIN, config)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.influxdb_queue_depth").state == "0"
+    assert hass.states.get("sensor.influxdb_dropped_events").state == "0"
+    latency = hass.states.get("sensor.influxdb_write_latency")
+    assert latency.state == "unknown"
+    assert latency.attributes["unit_of_measurement"] == "ms"
@@ -401,6 +401,197 @@ async def test_logbook_view_period_entity(hass, hass_client):
     assert response_json[0]["entity_id"] == entity_id_test
 
 
+async def _async_set_spread_states(hass):
+    """Set states 20 minutes apart, so they are not grouped together."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    start = dt_util.utcnow() - timedelta(hours=3)
+    for idx in range(6):
+        with patch(
+            "homeassistant.util.dt.utcnow",
+            return_value=start + timedelta(minutes=20 * idx),
+        ):
+            hass.states.async_set("switch.test", STATE_ON if idx % 2 else STATE_OFF)
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    return start - timedelta(hours=1)
+
+
+async def test_logbook_view_pages(hass, hass_client):
+    """Test the logbook view returns pages of events with a cursor."""
+    start = await _async_set_spread_states(hass)
+    client = await hass_client()
+
+    response = await client.get(f"/api/logbook/{start.isoformat()}")
+    assert response.status == 200
+    all_events = await response.json()
+    assert len(all_events) == 5
+
+    pages = []
+    query = "page_size=2"
+    while True:
+        response = await client.get(f"/api/logbook/{start.isoformat()}?{query}")
+        assert response.status == 200
+        response_json = await response.json()
+        pages.append(response_json["events"])
+        if response_json["next_cursor"] is None:
+            break
+        query = f"page_size=2&cursor={response_json['next_cursor']}"
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [event for page in pages for event in page] == all_events
+
+    # The events and states of entities are queried with a union
+    response = await client.get(
+        f"/api/logbook/{start.isoformat()}?page_size=3&entity=switch.test"
+    )
+    response_json = await response.json()
+    assert response_json["events"] == all_events[:3]
+    response = await client.get(
+        f"/api/logbook/{start.isoformat()}?page_size=3&entity=switch.test"
+        f"&cursor={response_json['next_cursor']}"
+    )
+    response_json = await response.json()
+    assert response_json == {"events": all_events[3:], "next_cursor": None}
+
+    response = await client.get(f"/api/logbook/{start.isoformat()}?page_size=0")
+    assert response.status == 400
+    response = await client.get(
+        f"/api/logbook/{start.isoformat()}?page_size=2&cursor=invalid"
+    )
+    assert response.status == 400
+
+
+async def test_logbook_view_pages_context(hass, hass_client):
+    """Test pages resolve contexts and keep time groups together."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await async_setup_component(hass, "automation", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    automation_context = ha.Context()
+    service_context = ha.Context()
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=3
+    )
+
+    def set_state(minutes, entity_id, state, context=None):
+        with patch(
+            "homeassistant.util.dt.utcnow",
+            return_value=start + timedelta(minutes=minutes),
+        ):
+            hass.states.async_set(entity_id, state, context=context)
+
+    # The first group, with the events that start the contexts
+    hass.bus.async_fire(
+        EVENT_AUTOMATION_TRIGGERED,
+        {ATTR_NAME: "Mock automation", ATTR_ENTITY_ID: "automation.alarm"},
+        context=automation_context,
+        time_fired=start,
+    )
+    hass.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {
+            ATTR_DOMAIN: "light",
+            ATTR_SERVICE: "turn_off",
+            ATTR_ENTITY_ID: "light.switch",
+        },
+        context=service_context,
+        time_fired=start + timedelta(minutes=1),
+    )
+    set_state(2, "light.switch", STATE_ON)
+    set_state(2, "switch.test", STATE_OFF)
+    set_state(3, "alarm_control_panel.area", STATE_OFF, automation_context)
+    set_state(4, "switch.test", STATE_ON)
+    set_state(6, "switch.test", STATE_OFF)
+    # Later groups with events caused by these contexts
+    set_state(20, "light.switch", STATE_OFF, service_context)
+    set_state(20, "alarm_control_panel.area", STATE_ON, automation_context)
+    set_state(40, "alarm_control_panel.area", STATE_OFF, automation_context)
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    period_start = (start - timedelta(minutes=1)).isoformat()
+    response = await client.get(f"/api/logbook/{period_start}")
+    assert response.status == 200
+    all_events = await response.json()
+    assert [event.get("entity_id") for event in all_events] == [
+        "automation.alarm",
+        "switch.test",
+        "switch.test",
+        "light.switch",
+        "alarm_control_panel.area",
+        "alarm_control_panel.area",
+    ]
+    assert all_events[3]["context_service"] == "turn_off"
+    assert all_events[4]["context_entity_id"] == "automation.alarm"
+    assert all_events[4]["context_name"] == "Mock automation"
+    assert all_events[5]["context_entity_id"] == "automation.alarm"
+
+    pages = []
+    query = "page_size=1"
+    while True:
+        response = await client.get(f"/api/logbook/{period_start}?{query}")
+        assert response.status == 200
+        response_json = await response.json()
+        pages.append(response_json["events"])
+        if response_json["next_cursor"] is None:
+            break
+        query = f"page_size=1&cursor={response_json['next_cursor']}"
+
+    # Pages are extended to all events of their 15 minute group, the
+    # contexts of the later pages were started on the first page
+    assert [len(page) for page in pages] == [3, 2, 1]
+    assert [event for page in pages for event in page] == all_events
+
+
+async def test_logbook_get_events_stream(hass, hass_ws_client):
+    """Test the logbook events are streamed in pages over the websocket."""
+    start = await _async_set_spread_states(hass)
+    all_events = await hass.async_add_executor_job(
+        logbook._get_events, hass, start, dt_util.utcnow()
+    )
+    assert len(all_events) == 5
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/get_events",
+            "start_time": start.isoformat(),
+            "page_size": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    pages = []
+    while True:
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert response["type"] == "event"
+        pages.append(response["event"]["events"])
+        if not response["event"]["partial"]:
+            break
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [event for page in pages for event in page] == json.loads(
+        json.dumps(all_events, cls=JSONEncoder)
+    )
+
+    await client.send_json(
+        {"id": 2, "type": "logbook/get_events", "start_time": "invalid"}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
 async def test_logbook_describe_event(hass, hass_client):
     """Test teaching logbook about a new event."""
     await hass.async_add_executor_job(init_recorder_component, hass)
@@ -702,6 +702,60 @@ async def test_not_calling_unsubscribe_with_active_subscribers(
     assert not mqtt_client_mock.unsubscribe.called
 
 
+async def test_unsubscribe_last_subscriber_of_wildcard_topic(
+    hass, mqtt_client_mock, mqtt_mock, calls, record_calls
+):
+    """Test removing the last subscriber of a topic stops dispatch and unsubscribes."""
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+
+    unsub_wildcard = await mqtt.async_subscribe(hass, "test/+/state", record_calls)
+    unsub_subtree = await mqtt.async_subscribe(hass, "test/#", record_calls)
+    await hass.async_block_till_done()
+
+    async_fire_mqtt_message(hass, "test/kitchen/state", "on")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+    unsub_wildcard()
+    await hass.async_block_till_done()
+    mqtt_client_mock.unsubscribe.assert_called_once_with("test/+/state")
+
+    async_fire_mqtt_message(hass, "test/kitchen/state", "off")
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+    assert calls[2][0].subscribed_topic == "test/#"
+
+    unsub_subtree()
+    async_fire_mqtt_message(hass, "test/kitchen/state", "on")
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+
+async def test_unsubscribe_during_dispatch(hass, mqtt_mock):
+    """Test a subscriber can unsubscribe while a message is being dispatched."""
+    calls = []
+    unsubs = []
+
+    @callback
+    def unsubscribe_all(msg):
+        calls.append(msg)
+        while unsubs:
+            unsubs.pop()()
+
+    unsubs.append(await mqtt.async_subscribe(hass, "test/state", unsubscribe_all))
+    unsubs.append(await mqtt.async_subscribe(hass, "test/state", unsubscribe_all))
+    unsubs.append(await mqtt.async_subscribe(hass, "test/#", unsubscribe_all))
+
+    async_fire_mqtt_message(hass, "test/state", "online")
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+    async_fire_mqtt_message(hass, "test/state", "online")
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+
 @pytest.mark.parametrize(
     "mqtt_config",
     [{mqtt.CONF_BROKER: "mock-broker", mqtt.CONF_DISCOVERY: False}],
@@ -923,13 +977,9 @@ async def test_delayed_birth_message(hass, mqtt_client_mock, mqtt_config):
     assert result
     await hass.async_block_till_done()
 
-    # Workaround: asynctest==0.13 fails on @functools.lru_cache
-    spec = dir(hass.data["mqtt"])
-    spec.remove("_matching_subscriptions")
-
     mqtt_component_mock = MagicMock(
         return_value=hass.data["mqtt"],
-        spec_set=spec,
+        spec_set=hass.data["mqtt"],
         wraps=hass.data["mqtt"],
     )
     mqtt_component_mock._mqttc = mqtt_client_mock
@@ -6,7 +6,8 @@ import json
 from unittest.mock import patch, sentinel
 
 from homeassistant.components.recorder import history
-from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.models import States, process_timestamp
+from homeassistant.components.recorder.util import session_scope
 import homeassistant.core as ha
 from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
@@ -75,6 +76,37 @@ def test_get_states(hass_recorder):
     assert history.get_state(hass, time_before_recorder_ran, "demo.id") is None
 
 
+def test_get_states_with_legacy_attributes(hass_recorder):
+    """Test states recorded before the state_attributes table are returned."""
+    hass = hass_recorder()
+    start = dt_util.utcnow()
+    point = start + timedelta(seconds=1)
+
+    hass.states.set("test.shared", "on", {"shared": True})
+    wait_recording_done(hass)
+    with session_scope(hass=hass) as session:
+        session.add(
+            States(
+                entity_id="test.legacy",
+                domain="test",
+                state="on",
+                attributes='{"legacy":true}',
+                last_changed=point,
+                last_updated=point,
+            )
+        )
+
+    hist = history.get_significant_states(hass, start, significant_changes_only=False)
+    assert hist["test.shared"][0].attributes == {"shared": True}
+    assert hist["test.legacy"][0].attributes == {"legacy": True}
+
+    states = history.get_states(hass, point + timedelta(seconds=1))
+    assert {state.entity_id: state.attributes for state in states} == {
+        "test.shared": {"shared": True},
+        "test.legacy": {"legacy": True},
+    }
+
+
 def test_state_changes_during_period(hass_recorder):
     """Test state change during period."""
     hass = hass_recorder()
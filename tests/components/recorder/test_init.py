@@ -28,6 +28,7 @@ from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
@@ -830,6 +831,157 @@ def test_saving_sets_old_state(hass_recorder):
         assert states[3].old_state_id == states[1].state_id
 
 
+@pytest.mark.parametrize("commit_interval", [0, 1])
+def test_saving_with_bulk_insert(hass_recorder, commit_interval):
+    """Test saving states and events with bulk insert sets ids and old state."""
+    hass = hass_recorder({"bulk_insert": True, "commit_interval": commit_interval})
+    assert hass.data[DATA_INSTANCE].bulk_insert
+
+    hass.states.set("test.one", "on", {"attr": 1})
+    hass.states.set("test.two", "on", {})
+    hass.bus.fire("bulk_event", {"data": "value"})
+    wait_recording_done(hass)
+    hass.states.set("test.one", "off", {"attr": 2})
+    hass.states.set("test.one", "on", {"attr": 3})
+    hass.states.remove("test.two")
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 5
+        assert [state.entity_id for state in states] == [
+            "test.one",
+            "test.two",
+            "test.one",
+            "test.one",
+            "test.two",
+        ]
+        assert states[0].old_state_id is None
+        assert states[1].old_state_id is None
+        assert states[2].old_state_id == states[0].state_id
+        assert states[3].old_state_id == states[2].state_id
+        assert states[4].old_state_id == states[1].state_id
+        assert states[4].state is None
+        assert states[3].to_native().attributes == {"attr": 3}
+
+        for state in states:
+            event = session.query(Events).get(state.event_id)
+            assert event.event_type == "state_changed"
+            assert event.time_fired == state.created
+
+        db_events = list(session.query(Events).filter_by(event_type="bulk_event"))
+        assert len(db_events) == 1
+        assert db_events[0].to_native().data == {"data": "value"}
+
+
+def test_saving_with_bulk_insert_retries_commit(hass_recorder):
+    """Test bulk insert rows are written once when a commit is retried."""
+    hass = hass_recorder({"bulk_insert": True})
+    event_session = hass.data[DATA_INSTANCE].event_session
+    commit = event_session.commit
+    attempts = 0
+
+    def _fail_first_commit():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
+        commit()
+
+    with patch("time.sleep"), patch.object(
+        event_session, "commit", side_effect=_fail_first_commit
+    ):
+        hass.states.set("test.one", "on", {})
+        wait_recording_done(hass)
+
+    assert attempts == 2
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 1
+        assert session.query(Events).get(states[0].event_id) is not None
+
+
+def test_saving_with_bulk_insert_after_error(hass_recorder):
+    """Test bulk insert recovers the next row ids after a failed commit."""
+    hass = hass_recorder({"bulk_insert": True})
+
+    hass.states.set("test.one", "on", {})
+    wait_recording_done(hass)
+
+    with patch.object(
+        hass.data[DATA_INSTANCE].event_session,
+        "commit",
+        side_effect=SQLAlchemyError("insert the state"),
+    ):
+        hass.states.set("test.one", "off", {})
+        wait_recording_done(hass)
+
+    hass.states.set("test.one", "on", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 2
+        assert states[0].state == "on"
+        assert states[1].state == "on"
+        assert states[1].state_id == states[0].state_id + 1
+        # The old state was lost with the failed commit
+        assert states[1].old_state_id is None
+
+
+@pytest.mark.parametrize("bulk_insert", [False, True])
+def test_saving_states_with_shared_attributes(hass_recorder, bulk_insert):
+    """Test identical attributes are stored once and shared between states."""
+    hass = hass_recorder({"bulk_insert": bulk_insert})
+    attributes = {"media_title": "title", "volume_level": 0.5}
+
+    hass.states.set("media_player.one", "playing", attributes)
+    hass.states.set("media_player.two", "playing", attributes)
+    wait_recording_done(hass)
+    hass.states.set("media_player.one", "paused", attributes)
+    hass.states.set("media_player.two", "paused", {"media_title": "other"})
+    wait_recording_done(hass)
+    # Attributes that are no longer cached are looked up in the database
+    hass.data[DATA_INSTANCE]._state_attributes_ids.clear()
+    hass.states.set("media_player.one", "playing", attributes)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 5
+        assert [state.attributes for state in states] == [None] * 5
+        assert [state.to_native().attributes for state in states] == [
+            attributes,
+            attributes,
+            attributes,
+            {"media_title": "other"},
+            attributes,
+        ]
+        assert len({states[idx].attributes_id for idx in (0, 1, 2, 4)}) == 1
+        assert states[3].attributes_id != states[0].attributes_id
+        assert session.query(StateAttributes).count() == 2
+
+
+def test_state_attributes_ids_cache_size(hass_recorder):
+    """Test the least recently used shared attributes ids are evicted."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+
+    with patch.object(recorder, "STATE_ATTRIBUTES_ID_CACHE_SIZE", 2):
+        for value in range(3):
+            hass.states.set("sensor.one", "on", {"value": value})
+            wait_recording_done(hass)
+        assert list(instance._state_attributes_ids) == ['{"value":1}', '{"value":2}']
+
+        hass.states.set("sensor.one", "on", {"value": 1})
+        wait_recording_done(hass)
+        assert list(instance._state_attributes_ids) == ['{"value":2}', '{"value":1}']
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 3
+
+
 def test_saving_state_with_serializable_data(hass_recorder, caplog):
     """Test saving data that cannot be serialized does not crash."""
     hass = hass_recorder()
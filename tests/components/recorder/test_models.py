@@ -1,5 +1,7 @@
 """The tests for the Recorder component."""
 from datetime import datetime
+import json
+import math
 
 import pytest
 from sqlalchemy import create_engine
@@ -8,7 +10,9 @@ from sqlalchemy.orm import scoped_session, sessionmaker
 from homeassistant.components.recorder.models import (
     Base,
     Events,
+    LazyState,
     RecorderRuns,
+    StateAttributes,
     States,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
@@ -37,7 +41,39 @@ def test_from_event_to_db_state():
     # We don't restore context unless we need it by joining the
     # events table on the event_id for state_changed events
     state.context = ha.Context(id=None)
-    assert state == States.from_event(event).to_native()
+    db_state = States.from_event(event)
+    db_state.state_attributes = StateAttributes.from_event(event)
+    assert state == db_state.to_native()
+
+
+def test_from_event_to_db_state_attributes():
+    """Test converting event to db state attributes."""
+    attrs = {"this_attr": True}
+    state = ha.State("sensor.temperature", "18", attrs)
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        context=state.context,
+    )
+    db_attrs = StateAttributes.from_event(event)
+    assert db_attrs.to_native() == attrs
+    assert db_attrs.hash == StateAttributes.hash_shared_attrs('{"this_attr":true}')
+
+
+def test_from_event_to_db_non_finite_attributes():
+    """Test NaN and Infinity in attributes and event data are kept."""
+    state = ha.State("sensor.temperature", "18", {"min": -math.inf, "max": None})
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        context=state.context,
+    )
+    db_attrs = StateAttributes.from_event(event)
+    assert db_attrs.shared_attrs == '{"min":-Infinity,"max":null}'
+    assert db_attrs.to_native() == {"min": -math.inf, "max": None}
+
+    event = ha.Event("test_event", {"value": math.nan})
+    assert math.isnan(Events.from_event(event).to_native().data["value"])
 
 
 def test_from_event_to_delete_state():
@@ -215,3 +251,18 @@ async def test_event_to_db_model():
     native = Events.from_event(event, event_data="{}").to_native()
     event.data = {}
     assert native == event
+
+
+async def test_lazy_state_as_dict_json():
+    """Test LazyState can be serialized like a State."""
+    now = dt_util.utcnow()
+    state = ha.State("sensor.temperature", "18", {"unit": "°C"}, now, now)
+    db_state = States.from_event(
+        ha.Event(
+            EVENT_STATE_CHANGED, {"entity_id": state.entity_id, "new_state": state}
+        )
+    )
+    db_state.attributes = '{"unit":"°C"}'
+    lazy_state = LazyState(db_state)
+    assert json.loads(lazy_state.as_dict_json()) == lazy_state.as_dict()
+    assert lazy_state.as_dict()["attributes"] == {"unit": "°C"}
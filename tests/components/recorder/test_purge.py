@@ -4,13 +4,19 @@ import json
 import sqlite3
 from unittest.mock import MagicMock, patch
 
+import pytest
 from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import PurgeTask
 from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -85,6 +91,69 @@ async def test_purge_old_states(
         assert "test.recorder2" in instance._old_states
 
 
+async def test_purge_old_states_with_bulk_insert(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test deleting old states written with bulk insert evicts old state ids."""
+    instance = await async_setup_recorder_instance(hass, {"bulk_insert": True})
+
+    await _add_test_states(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        assert states.count() == 6
+        assert states[0].old_state_id is None
+        assert states[-1].old_state_id == states[-2].state_id
+        assert instance._old_state_ids["test.recorder2"] == states[-1].state_id
+        assert not instance._old_states
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert states.count() == 2
+        assert "test.recorder2" in instance._old_state_ids
+
+        purge_before = dt_util.utcnow()
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert states.count() == 0
+        assert "test.recorder2" not in instance._old_state_ids
+
+
+@pytest.mark.parametrize("bulk_insert", [False, True])
+async def test_purge_old_states_purges_unused_attributes(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: SetupRecorderInstanceT,
+    bulk_insert: bool,
+):
+    """Test purging old states deletes the attributes no state refers to."""
+    instance = await async_setup_recorder_instance(hass, {"bulk_insert": bulk_insert})
+
+    await _add_test_states(hass, instance)
+    added_test_states = dt_util.utcnow()
+    hass.states.async_set("test.recorder3", "on", {"other": True})
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        state_attributes = session.query(StateAttributes)
+        assert state_attributes.count() == 2
+        assert len(instance._state_attributes_ids) == 2
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        # The attributes are still used by the remaining states
+        assert state_attributes.count() == 2
+        assert len(instance._state_attributes_ids) == 2
+
+        finished = purge_old_data(instance, added_test_states, repack=False)
+        assert not finished
+        assert session.query(States).count() == 1
+        assert state_attributes.count() == 1
+        assert state_attributes.one().to_native() == {"other": True}
+        assert list(instance._state_attributes_ids) == ['{"other":true}']
+
+
 async def test_purge_old_states_encouters_database_corruption(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -227,3 +227,33 @@ async def test_update_statistics_metadata(hass, hass_ws_client, new_unit):
     assert response["result"] == [
         {"statistic_id": "sensor.test", "unit_of_measurement": new_unit}
     ]
+
+
+async def test_last_statistics_run(hass, hass_ws_client):
+    """Test fetching the timing of the last statistics compile."""
+    now = dt_util.utcnow()
+
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "sensor", {})
+    await hass.async_add_executor_job(hass.data[DATA_INSTANCE].block_till_done)
+    hass.states.async_set("sensor.test", 10, attributes=POWER_SENSOR_ATTRIBUTES)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, "type": "recorder/last_statistics_run"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    hass.data[DATA_INSTANCE].do_adhoc_statistics(start=now)
+    await hass.async_add_executor_job(hass.data[DATA_INSTANCE].block_till_done)
+
+    await client.send_json({"id": 2, "type": "recorder/last_statistics_run"})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["start"] == dt_util.as_utc(now).isoformat()
+    assert result["duration"] >= 0
+    assert set(result["platforms"]) == {"sensor"}
+    assert result["statistics"] == 1
@@ -1333,6 +1333,105 @@ def test_compile_hourly_statistics_unchanged(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_statistics_skips_unchanged_sensors(hass_recorder, caplog):
+    """Test history is only queried for sensors updated during the period."""
+    zero = dt_util.utcnow()
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    four, _ = record_states(hass, zero, "sensor.test1", TEMPERATURE_SENSOR_ATTRIBUTES)
+    energy_attributes = {
+        "device_class": "energy",
+        "state_class": "total_increasing",
+        "unit_of_measurement": "kWh",
+    }
+    with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=zero):
+        hass.states.set("sensor.test2", "10", attributes=energy_attributes)
+    wait_recording_done(hass)
+
+    with patch(
+        "homeassistant.components.recorder.history.get_significant_states_with_session",
+        wraps=history.get_significant_states_with_session,
+    ) as get_significant_states:
+        recorder.do_adhoc_statistics(start=zero)
+        wait_recording_done(hass)
+        queried = {
+            entity_id
+            for call in get_significant_states.mock_calls
+            for entity_id in call.kwargs["entity_ids"]
+        }
+        assert queried == {"sensor.test1", "sensor.test2"}
+
+        get_significant_states.reset_mock()
+        recorder.do_adhoc_statistics(start=four)
+        wait_recording_done(hass)
+        assert get_significant_states.mock_calls == []
+
+    five = four + timedelta(minutes=5)
+    with patch(
+        "homeassistant.components.recorder.dt_util.utcnow",
+        return_value=five + timedelta(minutes=1),
+    ):
+        hass.states.set("sensor.test2", "15", attributes=energy_attributes)
+    wait_recording_done(hass)
+
+    with patch(
+        "homeassistant.components.recorder.history.get_significant_states_with_session",
+        wraps=history.get_significant_states_with_session,
+    ) as get_significant_states:
+        recorder.do_adhoc_statistics(start=five)
+        wait_recording_done(hass)
+        queried = {
+            entity_id
+            for call in get_significant_states.mock_calls
+            for entity_id in call.kwargs["entity_ids"]
+        }
+        assert queried == {"sensor.test2"}
+
+    stats = statistics_during_period(hass, four, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "statistic_id": "sensor.test1",
+                "start": process_timestamp_to_utc_isoformat(start),
+                "end": process_timestamp_to_utc_isoformat(start + timedelta(minutes=5)),
+                "mean": approx(30.0),
+                "min": approx(30.0),
+                "max": approx(30.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+            for start in (four, five)
+        ],
+        "sensor.test2": [
+            {
+                "statistic_id": "sensor.test2",
+                "start": process_timestamp_to_utc_isoformat(four),
+                "end": process_timestamp_to_utc_isoformat(five),
+                "mean": None,
+                "min": None,
+                "max": None,
+                "last_reset": None,
+                "state": approx(10.0),
+                "sum": approx(0.0),
+            },
+            {
+                "statistic_id": "sensor.test2",
+                "start": process_timestamp_to_utc_isoformat(five),
+                "end": process_timestamp_to_utc_isoformat(five + timedelta(minutes=5)),
+                "mean": None,
+                "min": None,
+                "max": None,
+                "last_reset": None,
+                "state": approx(15.0),
+                "sum": approx(5.0),
+            },
+        ],
+    }
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
 def test_compile_hourly_statistics_partially_unavailable(hass_recorder, caplog):
     """Test compiling hourly statistics, with the sensor being partially unavailable."""
     zero = dt_util.utcnow()
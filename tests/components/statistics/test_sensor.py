@@ -9,7 +9,11 @@ import pytest
 
 from homeassistant import config as hass_config
 from homeassistant.components import recorder
-from homeassistant.components.statistics.sensor import DOMAIN, StatisticsSensor
+from homeassistant.components.statistics.sensor import (
+    DOMAIN,
+    StatisticsSensor,
+    StreamingStatistics,
+)
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
     SERVICE_RELOAD,
@@ -503,5 +507,33 @@ async def test_reload(hass):
     assert hass.states.get("sensor.cputest")
 
 
+@pytest.mark.parametrize("method", ["exclusive", "inclusive"])
+def test_streaming_statistics(method):
+    """Test the sliding window statistics match the statistics module."""
+    values = [17, 20, 15.2, 5, 3.8, 9.2, 6.7, 14, 6, 5, 1e6, -3.5, 0.1, 20]
+    window = StreamingStatistics(5)
+
+    for idx in range(len(values) * 3):
+        window.append(values[idx % len(values)])
+        data = list(window)
+        assert data == [values[i % len(values)] for i in range(idx + 1)][-5:]
+
+        assert window.mean == pytest.approx(statistics.mean(data))
+        assert window.median == statistics.median(data)
+        assert window.total == pytest.approx(sum(data))
+        assert window.min == min(data)
+        assert window.max == max(data)
+        if len(data) > 1:
+            assert window.variance == pytest.approx(statistics.variance(data))
+            assert window.quantiles(4, method) == pytest.approx(
+                statistics.quantiles(data, n=4, method=method)
+            )
+
+    while window:
+        window.popleft()
+    window.append(3)
+    assert window.mean == window.total == window.min == window.max == 3
+
+
 def _get_fixtures_base_path():
     return path.dirname(path.dirname(path.dirname(__file__)))
@@ -18,6 +18,11 @@ from homeassistant.core import Context, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.template import (
+    BYTECODE_CACHE_MAX_FILES,
+    Template,
+    compile_cache_info,
+)
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
 
@@ -1197,3 +1202,157 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
         {"domain": "august", "seconds": 12.5},
         {"domain": "isy994", "seconds": 12.8},
     ]
+
+
+async def test_event_bus_listener_stats(hass, websocket_client, hass_admin_user):
+    """Test enabling listener profiling and getting the listener stats."""
+    await websocket_client.send_json({"id": 5, "type": "event_bus/listener_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == {"profiling": False, "listeners": []}
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "event_bus/listener_stats", "profiling": True}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"profiling": True, "listeners": []}
+
+    @callback
+    def listener(event):
+        """Mock listener."""
+
+    hass.bus.async_listen("test_event", listener)
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+
+    await websocket_client.send_json({"id": 7, "type": "event_bus/listener_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["profiling"]
+    stats = [
+        stat
+        for stat in msg["result"]["listeners"]
+        if stat["event_type"] == "test_event"
+    ]
+    assert len(stats) == 1
+    assert stats[0]["listener"].endswith(
+        "test_event_bus_listener_stats.<locals>.listener"
+    )
+    assert stats[0]["calls"] == 1
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json(
+        {"id": 8, "type": "event_bus/listener_stats", "profiling": False}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_entity_poll_latency(hass, websocket_client, hass_admin_user):
+    """Test getting the poll latency of entity platforms."""
+    platform = MockEntityPlatform(hass)
+    await platform.async_add_entities([MockEntity(should_poll=True)])
+
+    await websocket_client.send_json({"id": 5, "type": "entity/poll_latency"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == []
+
+    platform.poll_latency.record(0.2)
+    await websocket_client.send_json({"id": 6, "type": "entity/poll_latency"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert len(msg["result"]) == 1
+    result = msg["result"][0]
+    assert result["domain"] == "test_domain"
+    assert result["platform"] == "test_platform"
+    assert result["config_entry_id"] is None
+    assert result["latency"]["count"] == 1
+    assert result["latency"]["buckets"]["0.1"] == 0
+    assert result["latency"]["buckets"]["0.25"] == 1
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 7, "type": "entity/poll_latency"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_entity_coalesced_state_writes(hass, websocket_client, hass_admin_user):
+    """Test getting the coalesced state writes of entity platforms."""
+    platform = MockEntityPlatform(hass)
+    ent = MockEntity(name="coalesce", state="1")
+    ent._attr_state_write_interval = datetime.timedelta(seconds=1)
+    await platform.async_add_entities([ent, MockEntity(name="other")])
+
+    await websocket_client.send_json({"id": 5, "type": "entity/coalesced_state_writes"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == []
+
+    for state in ("2", "3"):
+        ent._values["state"] = state
+        ent.async_write_ha_state()
+    await websocket_client.send_json({"id": 6, "type": "entity/coalesced_state_writes"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "domain": "test_domain",
+            "platform": "test_platform",
+            "config_entry_id": None,
+            "coalesced_state_writes": 1,
+            "entities": {ent.entity_id: 1},
+        }
+    ]
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 7, "type": "entity/coalesced_state_writes"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_template_cache_info(hass, websocket_client, hass_admin_user, tmp_path):
+    """Test getting the statistics of the template caches."""
+    await websocket_client.send_json({"id": 5, "type": "template/cache_info"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["compiled"] == compile_cache_info()
+    assert msg["result"]["bytecode"] is None
+
+    hass.config.config_dir = str(tmp_path)
+    hass.config.template_bytecode_cache = True
+    assert Template("{{ 'cache_info' }}", hass).async_render() == "cache_info"
+    await websocket_client.send_json({"id": 6, "type": "template/cache_info"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["bytecode"] == {
+        "hits": 0,
+        "misses": 1,
+        "size": 1,
+        "maxsize": BYTECODE_CACHE_MAX_FILES,
+    }
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 7, "type": "template/cache_info"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
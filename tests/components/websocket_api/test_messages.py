@@ -1,12 +1,15 @@
 """Test Websocket API messages module."""
+import json
 
 from homeassistant.components.websocket_api.messages import (
     _cached_event_message as lru_event_cache,
     cached_event_message,
     message_to_json,
+    states_result_message,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
-from homeassistant.core import callback
+from homeassistant.core import Event, State, callback
+from homeassistant.helpers.json import JSONEncoder
 
 
 async def test_cached_event_message(hass):
@@ -78,6 +81,94 @@ async def test_cached_event_message_with_different_idens(hass):
     assert cache_info.currsize == 1
 
 
+async def test_cached_event_message_reuses_state_json(hass):
+    """Test event messages embed the JSON cached on the states."""
+
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("light.window", "on", {"brightness": 100})
+    hass.states.async_set("light.window", "off")
+    await hass.async_block_till_done()
+
+    lru_event_cache.cache_clear()
+    event = events[1]
+    msg = cached_event_message(2, event)
+
+    assert json.loads(msg) == json.loads(
+        json.dumps(
+            {"id": 2, "type": "event", "event": event.as_dict()}, cls=JSONEncoder
+        )
+    )
+    assert event.data["old_state"].as_dict_json() in msg
+    assert event.data["new_state"].as_dict_json() in msg
+
+
+async def test_cached_event_message_non_string_keys(hass):
+    """Test event data keys are converted to strings like the json module does."""
+    event = Event("test_event", {1: "a", None: 2, 2.5: 3, "key": 4})
+
+    lru_event_cache.cache_clear()
+    msg = json.loads(cached_event_message(2, event))
+
+    assert msg["event"]["data"] == {"1": "a", "null": 2, "2.5": 3, "key": 4}
+
+
+async def test_cached_event_message_not_serializable(hass, caplog):
+    """Test an event with data which can't be serialized to JSON."""
+
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    hass.states.async_set("light.window", "on", {"brightness": float("nan")})
+    await hass.async_block_till_done()
+
+    lru_event_cache.cache_clear()
+    msg = json.loads(cached_event_message(2, events[0]))
+
+    assert msg["success"] is False
+    assert msg["error"]["code"] == "unknown_error"
+    assert "Unable to serialize to JSON" in caplog.text
+
+
+async def test_states_result_message(caplog):
+    """Test building a result message from states."""
+    states = [
+        State("light.window", "on", {"brightness": 100}),
+        State("light.door", "off"),
+    ]
+
+    msg = states_result_message(2, states)
+
+    assert json.loads(msg) == {
+        "id": 2,
+        "type": "result",
+        "success": True,
+        "result": [state.as_dict() for state in states],
+    }
+    assert json.loads(states_result_message(3, [])) == {
+        "id": 3,
+        "type": "result",
+        "success": True,
+        "result": [],
+    }
+
+    states.append(State("light.hall", "on", {"brightness": float("nan")}))
+    msg = json.loads(states_result_message(4, states))
+    assert msg["success"] is False
+    assert "Unable to serialize to JSON" in caplog.text
+
+
 async def test_message_to_json(caplog):
     """Test we can serialize websocket messages."""
 
@@ -503,3 +503,60 @@ async def test_unavailable_zone(hass):
     assert zone.async_active_zone(hass, 0.0, 0.01) is None
 
     assert zone.in_zone(hass.states.get("zone.bla"), 0, 0) is False
+
+
+async def test_active_zone_index(hass):
+    """Test active zone is found with the zone index."""
+    assert await setup.async_setup_component(hass, DOMAIN, {"zone": {}})
+    hass.states.async_set(
+        "zone.near", "zoning", {"latitude": 52.0, "longitude": 5.0, "radius": 500}
+    )
+    hass.states.async_set(
+        "zone.far", "zoning", {"latitude": 52.5, "longitude": 5.5, "radius": 500}
+    )
+    hass.states.async_set(
+        "zone.huge", "zoning", {"latitude": 40.0, "longitude": 5.0, "radius": 2e6}
+    )
+
+    assert zone.async_active_zone(hass, 52.001, 5.001).entity_id == "zone.near"
+    assert zone.async_active_zone(hass, 52.5, 5.5).entity_id == "zone.far"
+    assert zone.async_active_zone(hass, 45.0, 5.0).entity_id == "zone.huge"
+    # The accuracy reaches the zone from the next grid cell
+    assert zone.async_active_zone(hass, 52.0, 5.02, 1500).entity_id == "zone.near"
+    assert zone.async_active_zone(hass, 52.0, 5.02).entity_id == "zone.huge"
+
+    hass.states.async_set(
+        "zone.far", "zoning", {"latitude": 52.001, "longitude": 5.001, "radius": 10}
+    )
+    assert zone.async_active_zone(hass, 52.001, 5.001).entity_id == "zone.far"
+    assert zone.async_active_zone(hass, 52.5, 5.5).entity_id == "zone.huge"
+
+    hass.states.async_remove("zone.far")
+    assert zone.async_active_zone(hass, 52.001, 5.001).entity_id == "zone.near"
+
+
+async def test_active_zone_index_matches_all_zones(hass):
+    """Test the zone index finds the same zone as testing all zones."""
+    assert await setup.async_setup_component(hass, DOMAIN, {"zone": {}})
+    for idx in range(200):
+        hass.states.async_set(
+            f"zone.zone_{idx}",
+            "zoning",
+            {
+                "latitude": 52 + idx % 20 * 0.013,
+                "longitude": 5 + idx // 20 * 0.021,
+                "radius": 100 + idx % 7 * 300,
+                "passive": idx % 13 == 0,
+            },
+        )
+
+    points = [
+        (52 + idx % 31 * 0.0091, 5 + idx // 31 * 0.0233, idx % 5 * 150)
+        for idx in range(310)
+    ]
+    found = [zone.async_active_zone(hass, *point) for point in points]
+    with patch.object(zone.ZoneIndex, "async_candidates", return_value=None):
+        expected = [zone.async_active_zone(hass, *point) for point in points]
+
+    assert found == expected
+    assert sum(state is not None for state in found) > 100
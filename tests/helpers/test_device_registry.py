@@ -1295,3 +1295,44 @@ async def test_only_disable_device_if_all_config_entries_are_disabled(hass, regi
 
     entry1 = registry.async_get(entry1.id)
     assert not entry1.disabled
+
+
+async def test_lookup_indexes_follow_updates(hass, registry):
+    """Test the area and config entry lookups track device changes."""
+    device = registry.async_get_or_create(
+        config_entry_id="1234",
+        connections={(device_registry.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    other = registry.async_get_or_create(
+        config_entry_id="5678", identifiers={("bridgeid", "0123")}
+    )
+
+    assert device_registry.async_entries_for_config_entry(registry, "1234") == [device]
+    assert device_registry.async_entries_for_area(registry, "living_room") == []
+
+    device = registry.async_update_device(
+        device.id, area_id="living_room", add_config_entry_id="5678"
+    )
+    assert device_registry.async_entries_for_area(registry, "living_room") == [device]
+    assert device_registry.async_entries_for_config_entry(registry, "5678") == [
+        other,
+        device,
+    ]
+
+    registry.async_clear_area_id("living_room")
+    assert device_registry.async_entries_for_area(registry, "living_room") == []
+
+    registry.async_clear_config_entry("1234")
+    device = registry.async_get(device.id)
+    assert device.config_entries == {"5678"}
+    assert device_registry.async_entries_for_config_entry(registry, "1234") == []
+
+    registry.async_remove_device(other.id)
+    assert device_registry.async_entries_for_config_entry(registry, "5678") == [device]
+
+    # The deleted device is still tracked by config entry
+    registry.async_clear_config_entry("5678")
+    assert registry.devices == {}
+    assert registry.deleted_devices[other.id].config_entries == set()
+    assert registry.deleted_devices[other.id].orphaned_timestamp is not None
+    assert registry.deleted_devices[device.id].orphaned_timestamp is not None
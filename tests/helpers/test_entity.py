@@ -15,11 +15,14 @@ from homeassistant.const import (
 )
 from homeassistant.core import Context, HomeAssistantError
 from homeassistant.helpers import entity, entity_registry
+import homeassistant.util.dt as dt_util
 
 from tests.common import (
     MockConfigEntry,
     MockEntity,
     MockEntityPlatform,
+    MockPlatform,
+    async_fire_time_changed,
     get_test_home_assistant,
     mock_registry,
 )
@@ -829,3 +832,93 @@ async def test_entity_category_property(hass):
     )
     mock_entity2.entity_id = "hello.world"
     assert mock_entity2.entity_category == "config"
+
+
+async def test_state_write_interval(hass):
+    """Test state writes within the interval are coalesced."""
+    platform = MockEntityPlatform(hass)
+    ent = MockEntity(name="coalesce", state="1")
+    ent._attr_state_write_interval = timedelta(seconds=1)
+    await platform.async_add_entities([ent])
+
+    for state in ("2", "3", "4"):
+        ent._values["state"] = state
+        ent.async_write_ha_state()
+
+    assert hass.states.get(ent.entity_id).state == "1"
+    # The write of 2 is postponed, 3 and 4 are merged into it
+    assert ent.coalesced_state_writes == 2
+    assert platform.coalesced_state_writes == 2
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert hass.states.get(ent.entity_id).state == "4"
+
+    # A write right after the coalesced one is postponed again
+    ent._values["state"] = "5"
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).state == "4"
+
+    # The pending write is dropped when the entity is removed
+    await ent.async_remove()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert hass.states.get(ent.entity_id) is None
+
+
+async def test_state_write_interval_from_platform(hass):
+    """Test the platform default and the force_update exemption."""
+    mock_platform = MockPlatform()
+    mock_platform.STATE_WRITE_INTERVAL = timedelta(seconds=5)
+    platform = MockEntityPlatform(hass, platform=mock_platform)
+    assert platform.state_write_interval == timedelta(seconds=5)
+
+    ent = MockEntity(name="coalesce", state="1")
+    forced = MockEntity(name="forced", state="1")
+    forced._attr_force_update = True
+    await platform.async_add_entities([ent, forced])
+    assert ent.state_write_interval == timedelta(seconds=5)
+
+    for state in ("2", "3"):
+        ent._values["state"] = state
+        ent.async_write_ha_state()
+        forced._values["state"] = state
+        forced.async_write_ha_state()
+
+    assert hass.states.get(ent.entity_id).state == "1"
+    assert hass.states.get(forced.entity_id).state == "3"
+    assert forced.coalesced_state_writes == 0
+    assert platform.coalesced_state_writes == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    assert hass.states.get(ent.entity_id).state == "3"
+
+
+async def test_coalesce_state_writes(hass):
+    """Test entities can opt out of or into coalescing of state writes."""
+    platform = MockEntityPlatform(hass)
+    opt_out = MockEntity(name="opt_out", state="1")
+    opt_out._attr_state_write_interval = timedelta(seconds=1)
+    opt_out._attr_coalesce_state_writes = False
+    forced = MockEntity(name="forced", state="1")
+    forced._attr_state_write_interval = timedelta(seconds=1)
+    forced._attr_force_update = True
+    forced._attr_coalesce_state_writes = True
+    await platform.async_add_entities([opt_out, forced])
+    assert not opt_out.coalesce_state_writes
+    assert forced.coalesce_state_writes
+
+    for state in ("2", "3"):
+        opt_out._values["state"] = state
+        opt_out.async_write_ha_state()
+        forced._values["state"] = state
+        forced.async_write_ha_state()
+
+    assert hass.states.get(opt_out.entity_id).state == "3"
+    assert hass.states.get(forced.entity_id).state == "1"
+    assert forced.coalesced_state_writes == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert hass.states.get(forced.entity_id).state == "3"
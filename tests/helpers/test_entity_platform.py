@@ -105,6 +105,109 @@ async def test_polling_updates_entities_with_exception(hass):
     assert len(update_err) == 1
 
 
+async def test_adaptive_polling_spreads_updates(hass):
+    """Test adaptive polling spreads the updates over the scan interval."""
+    hass.config.adaptive_polling = True
+    platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=30))
+    entities = [MockEntity(should_poll=True) for _ in range(3)]
+    await platform.async_add_entities(entities)
+    # Drive the polling rounds from the test
+    platform.async_unsub_polling()
+    for ent in entities:
+        ent.async_update = Mock()
+
+    with patch.object(entity_platform.random, "random", return_value=0.5):
+        await platform._update_entity_states(dt_util.utcnow())
+    await hass.async_block_till_done()
+    assert not any(ent.async_update.called for ent in entities)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert [ent.async_update.called for ent in entities] == [True, False, False]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
+    await hass.async_block_till_done()
+    assert all(ent.async_update.called for ent in entities)
+    assert platform.poll_latency.count == 3
+
+
+async def test_adaptive_polling_backs_off_failing_entities(hass):
+    """Test adaptive polling skips rounds for entities that fail to update."""
+    hass.config.adaptive_polling = True
+    platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=30))
+    ent = MockEntity(should_poll=True)
+    await platform.async_add_entities([ent])
+    platform.async_unsub_polling()
+    ent.async_update = Mock(side_effect=Exception("Failed"))
+
+    async def poll_round():
+        await platform._update_entity_states(dt_util.utcnow())
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
+        await hass.async_block_till_done()
+
+    for _ in range(4):
+        await poll_round()
+    # Polled in the first round, skipped one round, polled, skipped two rounds
+    assert ent.async_update.call_count == 2
+
+    ent.async_update = Mock()
+    for _ in range(2):
+        await poll_round()
+    assert ent.async_update.call_count == 1
+    await poll_round()
+    assert ent.async_update.call_count == 2
+    assert ent.entity_id not in platform._poll_backoff
+
+
+async def test_adaptive_polling_waits_for_platform_before_poll_slot(hass):
+    """Test a poll waiting for its platform does not hold a global poll slot."""
+    hass.config.adaptive_polling = True
+    semaphore = hass.data[entity_platform.DATA_POLL_SEMAPHORE] = asyncio.Semaphore(1)
+    platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=30))
+    other_platform = MockEntityPlatform(
+        hass, platform_name="other", scan_interval=timedelta(seconds=30)
+    )
+    waiting = MockEntity(should_poll=True)
+    other = MockEntity(should_poll=True)
+    await platform.async_add_entities([waiting])
+    await other_platform.async_add_entities([other])
+    platform.async_unsub_polling()
+    other_platform.async_unsub_polling()
+    waiting.parallel_updates = asyncio.Semaphore(1)
+    waiting.async_update = Mock()
+    other.async_update = Mock()
+
+    # Another update of the platform is running
+    await waiting.parallel_updates.acquire()
+    task = hass.async_create_task(platform._async_adaptive_poll(waiting))
+    await asyncio.sleep(0)
+    assert not semaphore.locked()
+
+    await other_platform._async_adaptive_poll(other)
+    assert other.async_update.called
+    assert not waiting.async_update.called
+
+    waiting.parallel_updates.release()
+    await task
+    assert waiting.async_update.called
+    assert not semaphore.locked()
+
+
+async def test_polling_records_latency(hass):
+    """Test polling records the update latency of entities."""
+    platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=30))
+    await platform.async_add_entities(
+        [MockEntity(should_poll=True), MockEntity(should_poll=True)]
+    )
+
+    await platform._update_entity_states(dt_util.utcnow())
+
+    latency = platform.poll_latency.as_dict()
+    assert latency["count"] == 2
+    assert latency["buckets"]["0.05"] == 2
+    assert latency["buckets"]["+Inf"] == 0
+
+
 async def test_update_state_adds_entities(hass):
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -497,6 +497,54 @@ async def test_update_entity(registry):
         entry = updated_entry
 
 
+async def test_lookup_indexes_follow_updates(registry):
+    """Test the device, area and config entry lookups track entry changes."""
+    mock_config = MockConfigEntry(domain="light", entry_id="mock-id-1")
+    entry = registry.async_get_or_create(
+        "light",
+        "hue",
+        "1234",
+        config_entry=mock_config,
+        device_id="mock-dev-1",
+    )
+    other = registry.async_get_or_create(
+        "light", "hue", "5678", config_entry=mock_config, device_id="mock-dev-1"
+    )
+
+    assert er.async_entries_for_device(registry, "mock-dev-1") == [entry, other]
+    assert er.async_entries_for_config_entry(registry, "mock-id-1") == [
+        entry,
+        other,
+    ]
+    assert er.async_entries_for_area(registry, "mock-area-1") == []
+
+    registry.async_get_or_create("light", "hue", "1234", device_id="mock-dev-2")
+    entry = registry.async_update_entity(
+        entry.entity_id, new_entity_id="light.renamed", area_id="mock-area-1"
+    )
+
+    assert er.async_entries_for_device(registry, "mock-dev-1") == [other]
+    assert er.async_entries_for_device(registry, "mock-dev-2") == [entry]
+    assert er.async_entries_for_area(registry, "mock-area-1") == [entry]
+    assert set(er.async_entries_for_config_entry(registry, "mock-id-1")) == {
+        entry,
+        other,
+    }
+
+    registry.async_clear_area_id("mock-area-1")
+    assert er.async_entries_for_area(registry, "mock-area-1") == []
+
+    registry.async_remove(other.entity_id)
+    assert er.async_entries_for_device(registry, "mock-dev-1") == []
+    assert er.async_entries_for_config_entry(registry, "mock-id-1") == [
+        registry.async_get("light.renamed")
+    ]
+
+    registry.async_clear_config_entry("mock-id-1")
+    assert registry.entities == {}
+    assert er.async_entries_for_device(registry, "mock-dev-2") == []
+
+
 async def test_disabled_by(registry):
     """Test that we can disable an entry when we create it."""
     entry = registry.async_get_or_create(
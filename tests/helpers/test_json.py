@@ -1,10 +1,19 @@
 """Test Home Assistant remote methods and classes."""
-from datetime import timedelta
+from datetime import datetime, timedelta
+import json
+import math
 
 import pytest
 
 from homeassistant import core
-from homeassistant.helpers.json import ExtendedJSONEncoder, JSONEncoder
+from homeassistant.helpers.json import (
+    JSON_BACKEND,
+    JSON_BACKENDS,
+    ExtendedJSONEncoder,
+    JSONEncoder,
+    json_dumps,
+    json_loads,
+)
 from homeassistant.util import dt as dt_util
 
 
@@ -63,3 +72,71 @@ def test_trace_json_encoder(hass):
     # Default method falls back to repr(o)
     o = object()
     assert ha_json_enc.default(o) == {"__type": str(type(o)), "repr": repr(o)}
+
+
+@pytest.fixture(params=sorted(JSON_BACKENDS))
+def backend(request):
+    """Return the json dumps and loads functions of each installed backend."""
+    return JSON_BACKENDS[request.param]
+
+
+def test_json_backend():
+    """Test the C accelerated backend is used when it is installed."""
+    assert (json_dumps, json_loads) == JSON_BACKENDS[JSON_BACKEND]
+    assert JSON_BACKEND == ("orjson" if "orjson" in JSON_BACKENDS else "json")
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"now": dt_util.utcnow(), "naive": datetime(2021, 10, 1, 12, 30, 1, 5)},
+        {"set": {"milk"}, "tuple": (1, 2.5), "nested": [{"key": None}]},
+        {1: "int key", 2.5: "float key"},
+        {True: "bool key"},
+        {None: "none key"},
+        {"big": 2 ** 70, "unicode": "Ĥōmé"},
+        {"state": core.State("test.test", "hello", {"count": 1})},
+    ],
+)
+def test_json_dumps_matches_json_encoder(backend, data):
+    """Test json_dumps serializes like the JSONEncoder."""
+    dumps, _ = backend
+    assert json.loads(dumps(data)) == json.loads(json.dumps(data, cls=JSONEncoder))
+    assert dumps(data, pretty=True) == json.dumps(data, cls=JSONEncoder, indent=4)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"nan": math.nan},
+        {"inf": [1.5, -math.inf], "none": None},
+        {"state": core.State("test.test", "hello", {"value": math.inf})},
+    ],
+)
+def test_json_dumps_non_finite(backend, data):
+    """Test NaN and Infinity are serialized like the json module does."""
+    dumps, loads = backend
+    expected = json.dumps(data, cls=JSONEncoder, separators=(",", ":"))
+    assert dumps(data) == expected
+    assert dumps(data, pretty=True) == json.dumps(data, cls=JSONEncoder, indent=4)
+    assert repr(loads(dumps(data))) == repr(json.loads(expected))
+
+
+def test_json_dumps_not_serializable(backend):
+    """Test json_dumps raises for objects that can't be serialized."""
+    dumps, _ = backend
+    with pytest.raises(TypeError):
+        dumps({"key": object()})
+    with pytest.raises(TypeError):
+        dumps({"key": object()}, default=None)
+
+
+def test_json_loads(backend):
+    """Test loading JSON, including the extensions of the json module."""
+    _, loads = backend
+    assert loads('{"a": [1, 2.5, null]}') == {"a": [1, 2.5, None]}
+    assert loads(b'{"a": true}') == {"a": True}
+    assert math.isnan(loads('{"a": NaN}')["a"])
+
+    with pytest.raises(ValueError):
+        loads("{not json")
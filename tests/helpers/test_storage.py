@@ -2,6 +2,7 @@
 import asyncio
 from datetime import timedelta
 import json
+import os
 from unittest.mock import Mock, patch
 
 import pytest
@@ -279,3 +280,127 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+@pytest.fixture
+def journal_store(tmp_path):
+    """Fixture of a store in journal mode writing to a temporary directory."""
+    hass = Mock()
+    hass.config.path = lambda *parts: str(tmp_path.joinpath(*parts))
+    os.makedirs(tmp_path / storage.STORAGE_DIR)
+    yield storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+
+
+def _save(store, data):
+    """Save data like a store does in the executor."""
+    store._write_journaled_data(
+        store.path, {"version": store.version, "key": store.key, "data": data}, False
+    )
+
+
+def _reload(store):
+    """Return the data loaded by a new store for the same files."""
+    new_store = storage.Store(store.hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    return new_store, new_store._load_data(new_store.path)["data"]
+
+
+def test_journal_appends_changes(journal_store):
+    """Test saves only append the changes to the journal."""
+    data = {"entries": [{"id": str(idx), "name": "x" * 100} for idx in range(20)]}
+    _save(journal_store, data)
+    assert journal_store.compactions == 1
+    main_size = os.path.getsize(journal_store.path)
+
+    data["entries"][3]["name"] = "renamed"
+    data["entries"].append({"id": "new", "name": "added"})
+    data["options"] = {"enabled": True}
+    _save(journal_store, data)
+
+    assert journal_store.compactions == 1
+    assert os.path.getsize(journal_store.path) == main_size
+    assert 0 < journal_store.journal_bytes_written < 200
+    assert (
+        journal_store.bytes_written == main_size + journal_store.journal_bytes_written
+    )
+
+    del data["options"]
+    del data["entries"][15:]
+    _save(journal_store, data)
+
+    _, loaded = _reload(journal_store)
+    assert loaded == data
+
+
+def test_journal_compacts_when_large(journal_store):
+    """Test the journal is compacted into the main file when it grows."""
+    data = {"entries": [{"id": str(idx), "name": "x"} for idx in range(20)]}
+    _save(journal_store, data)
+
+    for idx in range(20):
+        data["entries"][idx]["name"] = "y" * 20
+        _save(journal_store, data)
+
+    assert journal_store.compactions > 1
+    new_store, loaded = _reload(journal_store)
+    assert loaded == data
+    assert new_store._journal_size == journal_store._journal_size
+
+
+def test_journal_recovers_from_partial_write(journal_store):
+    """Test a partially written journal entry is ignored on load."""
+    data = {"entries": [{"id": str(idx), "name": "x" * 100} for idx in range(20)]}
+    _save(journal_store, data)
+    data["entries"][0]["name"] = "first"
+    _save(journal_store, data)
+    expected = json.loads(json.dumps(data))
+    data["entries"][1]["name"] = "second"
+    _save(journal_store, data)
+
+    with open(journal_store.journal_path, "r+", encoding="utf-8") as journal:
+        content = journal.read()
+        journal.seek(0)
+        journal.truncate()
+        journal.write(content[:-10])
+
+    new_store, loaded = _reload(journal_store)
+    assert loaded == expected
+
+    # The next save starts a new journal
+    _save(new_store, data)
+    assert new_store.compactions == 1
+    assert not os.path.exists(new_store.journal_path)
+    _, loaded = _reload(new_store)
+    assert loaded == data
+
+
+def test_journal_ignores_stale_entries(journal_store):
+    """Test entries of a journal that was not removed by a compaction are ignored."""
+    data = {"entries": [{"id": str(idx), "name": "x" * 100} for idx in range(20)]}
+    _save(journal_store, data)
+    data["entries"][0]["name"] = "journaled"
+    _save(journal_store, data)
+
+    with open(journal_store.journal_path, encoding="utf-8") as journal:
+        stale = journal.read()
+    journal_store._compact_journal(
+        journal_store.path,
+        {"version": MOCK_VERSION, "key": MOCK_KEY, "data": {"entries": []}},
+    )
+    with open(journal_store.journal_path, "w", encoding="utf-8") as journal:
+        journal.write(stale)
+
+    _, loaded = _reload(journal_store)
+    assert loaded == {"entries": []}
+
+
+async def test_journal_compacted_on_final_write(hass, hass_storage):
+    """Test the journal is compacted when Home Assistant stops."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    store._journal_size = 10
+    store._journal_base = {"version": MOCK_VERSION, "key": MOCK_KEY, "data": MOCK_DATA}
+    store._async_ensure_final_write_listener()
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+    assert hass_storage[MOCK_KEY]["data"] == MOCK_DATA
@@ -1,6 +1,7 @@
 """Test Home Assistant template helper methods."""
 from datetime import datetime
 import math
+import os
 import random
 from unittest.mock import patch
 
@@ -2690,35 +2691,140 @@ def test_urlencode(hass):
     assert tpl.async_render() == "the%20quick%20brown%20fox%20%3D%20true"
 
 
-async def test_cache_garbage_collection():
-    """Test caching a template."""
+async def test_compiled_cache_shared_between_templates():
+    """Test compiled code is shared by templates with the same source."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template(
-        (template_string),
-    )
+    info = template.compile_cache_info()
+    tpl = template.Template(template_string)
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert template.compile_cache_info()["misses"] == info["misses"] + 1
 
-    tpl2 = template.Template(
-        (template_string),
-    )
+    tpl2 = template.Template(template_string)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert template.compile_cache_info()["hits"] == info["hits"] + 1
+    # pylint: disable=protected-access
+    assert tpl._compiled_code is tpl2._compiled_code
+
+    # Compiled code outlives the templates
+    del tpl, tpl2
+    tpl3 = template.Template(template_string)
+    tpl3.ensure_valid()
+    assert template.compile_cache_info()["hits"] == info["hits"] + 2
+
+
+async def test_compiled_cache_keyed_by_environment(hass):
+    """Test templates with and without hass don't share compiled code."""
+    with patch.object(
+        template, "_COMPILED_CACHE", template._CompiledCodeCache(10)
+    ):  # pylint: disable=protected-access
+        template.Template("{{ 1 + 41 }}").ensure_valid()
+        assert template.Template("{{ 1 + 41 }}", hass).async_render() == 42
+        assert template.compile_cache_info()["misses"] == 2
+
+        assert template.Template("{{ 1 + 41 }}", hass).async_render(limited=True) == 42
+        assert template.compile_cache_info()["hits"] == 1
+
+
+async def test_compiled_cache_is_bounded():
+    """Test the least recently used code is evicted from the cache."""
+    with patch.object(
+        template, "_COMPILED_CACHE", template._CompiledCodeCache(2)
+    ):  # pylint: disable=protected-access
+        for idx in range(3):
+            template.Template(f"{{{{ {idx} }}}}").ensure_valid()
+        assert template.compile_cache_info() == {
+            "hits": 0,
+            "misses": 3,
+            "size": 2,
+            "maxsize": 2,
+        }
+
+        template.Template("{{ 2 }}").ensure_valid()
+        template.Template("{{ 0 }}").ensure_valid()
+        assert template.compile_cache_info()["hits"] == 1
+        assert template.compile_cache_info()["misses"] == 4
+
+
+async def test_bytecode_cache(hass, tmp_path):
+    """Test compiled templates are persisted when the bytecode cache is enabled."""
+    hass.config.config_dir = str(tmp_path)
+    hass.config.template_bytecode_cache = True
+    cache_dir = tmp_path / template.BYTECODE_CACHE_DIR
+
+    with patch.object(
+        template, "_COMPILED_CACHE", template._CompiledCodeCache(10)
+    ):  # pylint: disable=protected-access
+        assert template.Template("{{ 6 * 7 }}", hass).async_render() == 42
+        assert len(list(cache_dir.iterdir())) == 1
+
+        template._COMPILED_CACHE.clear()  # pylint: disable=protected-access
+        with patch(
+            "jinja2.sandbox.ImmutableSandboxedEnvironment.compile"
+        ) as mock_compile:
+            assert template.Template("{{ 6 * 7 }}", hass).async_render() == 42
+        assert not mock_compile.called
+        assert template.compile_cache_info()["misses"] == 1
+        assert template.bytecode_cache_info(hass) == {
+            "hits": 1,
+            "misses": 1,
+            "size": 1,
+            "maxsize": template.BYTECODE_CACHE_MAX_FILES,
+        }
+
+
+async def test_bytecode_cache_disabled(hass):
+    """Test there are no bytecode cache statistics when it is disabled."""
+    assert template.Template("{{ 6 * 7 }}", hass).async_render() == 42
+    assert template.bytecode_cache_info(hass) is None
+
+
+async def test_bytecode_cache_pruned(hass, tmp_path):
+    """Test the bytecode cache keeps the most recently used templates."""
+    hass.config.config_dir = str(tmp_path)
+    hass.config.template_bytecode_cache = True
+    cache_dir = tmp_path / template.BYTECODE_CACHE_DIR
+
+    with patch.object(
+        template, "_COMPILED_CACHE", template._CompiledCodeCache(10)
+    ), patch.object(template, "BYTECODE_CACHE_MAX_FILES", 2):
+        for value in range(3):
+            template._COMPILED_CACHE.clear()  # pylint: disable=protected-access
+            assert template.Template("{{ 'kept' }}", hass).async_render() == "kept"
+            assert template.Template(f"{{{{ {value} }}}}", hass).async_render() == value
+            assert len(list(cache_dir.iterdir())) == 2
+        assert template.bytecode_cache_info(hass)["size"] == 2
+
+        template._COMPILED_CACHE.clear()  # pylint: disable=protected-access
+        with patch(
+            "jinja2.sandbox.ImmutableSandboxedEnvironment.compile"
+        ) as mock_compile:
+            assert template.Template("{{ 'kept' }}", hass).async_render() == "kept"
+        assert not mock_compile.called
+
+
+async def test_bytecode_cache_existing_files(hass, tmp_path):
+    """Test files from a previous run are pruned by their access time."""
+    hass.config.config_dir = str(tmp_path)
+    hass.config.template_bytecode_cache = True
+    cache_dir = tmp_path / template.BYTECODE_CACHE_DIR
+
+    with patch.object(
+        template, "_COMPILED_CACHE", template._CompiledCodeCache(10)
+    ), patch.object(template, "BYTECODE_CACHE_MAX_FILES", 2):
+        for value in range(2):
+            assert template.Template(f"{{{{ {value} }}}}", hass).async_render() == value
+        old, recent = sorted(cache_dir.iterdir(), key=os.path.getmtime)
+        os.utime(old, (old.stat().st_atime, recent.stat().st_mtime + 10))
+
+        # Start over as after a restart
+        hass.data.pop(template._ENVIRONMENT)  # pylint: disable=protected-access
+        hass.data.pop(template._BYTECODE_CACHE)  # pylint: disable=protected-access
+        assert template.Template("{{ 2 }}", hass).async_render() == 2
+        assert len(list(cache_dir.iterdir())) == 2
+        assert old.exists()
+        assert not recent.exists()
 
 
 def test_is_template_string():
@@ -3075,6 +3181,51 @@ async def test_parse_result(hass):
         assert template.Template(tpl, hass).async_render() == result
 
 
+@pytest.mark.parametrize(
+    "render_result,expected",
+    [
+        ("True", True),
+        ("False", False),
+        ("None", None),
+        ("on", "on"),
+        ("not_home", "not_home"),
+        ("Living room", "Living room"),
+        ("Ünïcode wörds", "Ünïcode wörds"),
+        ("True False", "True False"),
+        ("not True", "not True"),
+        ("True, 1", (True, 1)),
+        ("set()", set()),
+        ("b'on'", b"on"),
+        ("42", 42),
+        ("-42", -42),
+        ("+4.2", 4.2),
+        ("-0.0", -0.0),
+        (".", "."),
+        ("+", "+"),
+        ("-.", "-."),
+        ("1" * 5000, "1" * 5000),
+        ("1_000", "1_000"),
+        ("\u0661\u0662", "\u0661\u0662"),
+        ("\u0661.\u0665", "\u0661.\u0665"),
+        ("-\uff11", "-\uff11"),
+        ("on \u0661", "on \u0661"),
+        ("'on'", "'on'"),
+        ("[1, 2]", [1, 2]),
+    ],
+)
+async def test_parse_result_fast_path(hass, render_result, expected):
+    """Test the fast paths return the same results as literal_eval."""
+    tpl = template.Template("{{ value }}", hass)
+    # pylint: disable=protected-access
+    result = tpl._parse_result(render_result)
+    assert result == expected
+    assert type(result) is type(expected) or type(result) in (
+        template.RESULT_WRAPPERS.values()
+    )
+    if isinstance(expected, float):
+        assert math.copysign(1, result) == math.copysign(1, expected)
+
+
 async def test_undefined_variable(hass, caplog):
     """Test a warning is logged on undefined variables."""
     tpl = template.Template("{{ no_such_variable }}", hass)
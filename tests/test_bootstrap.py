@@ -121,6 +121,38 @@ async def test_setting_up_config(hass):
     assert "group" in hass.config.components
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_stores_startup_report(hass, hass_storage):
+    """Test the import and setup times are stored after setup."""
+    await bootstrap._async_set_up_integrations(
+        hass, {"group hello": {}, "homeassistant": {}}
+    )
+
+    report = hass_storage[bootstrap.STARTUP_REPORT_STORAGE_KEY]["data"]
+    assert report["integrations"]["group"]["setup"] is not None
+    assert report["integrations"]["group"]["import"] >= 0
+    assert report["integrations"]["group"]["platforms"] == {}
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_preloads_integrations(hass):
+    """Test the integrations are preloaded before setup when enabled."""
+    hass.config.preload_integrations = True
+
+    with patch(
+        "homeassistant.loader.async_preload_integrations", return_value=mock_coro()
+    ) as mock_preload:
+        await bootstrap._async_set_up_integrations(
+            hass, {"group hello": {}, "homeassistant": {}}
+        )
+
+    assert len(mock_preload.mock_calls) == 1
+    assert "group" in {
+        integration.domain for integration in mock_preload.mock_calls[0][1][1]
+    }
+    assert "group" in hass.config.components
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_all_present(hass):
     """Test after_dependencies when all present."""
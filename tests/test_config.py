@@ -504,6 +504,9 @@ async def test_loading_configuration(hass):
             "internal_url": "http://example.local",
             "media_dirs": {"mymedia": "/usr"},
             "legacy_templates": True,
+            "template_bytecode_cache": True,
+            "adaptive_polling": True,
+            "preload_integrations": True,
             "currency": "EUR",
         },
     )
@@ -522,6 +525,9 @@ async def test_loading_configuration(hass):
     assert hass.config.media_dirs == {"mymedia": "/usr"}
     assert hass.config.config_source == config_util.SOURCE_YAML
     assert hass.config.legacy_templates is True
+    assert hass.config.template_bytecode_cache is True
+    assert hass.config.adaptive_polling is True
+    assert hass.config.preload_integrations is True
     assert hass.config.currency == "EUR"
 
 
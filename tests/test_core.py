@@ -3,6 +3,7 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
@@ -38,6 +39,7 @@ from homeassistant.exceptions import (
     MaxLengthExceeded,
     ServiceNotFound,
 )
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -383,6 +385,28 @@ def test_state_as_dict():
     assert state.as_dict() is state.as_dict()
 
 
+def test_state_as_dict_json():
+    """Test a State as JSON is serialized once."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0)
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        last_updated=last_time,
+        last_changed=last_time,
+    )
+    as_dict_json = state.as_dict_json()
+    assert json.loads(as_dict_json) == state.as_dict()
+    assert state.as_dict_json() is as_dict_json
+
+
+def test_state_as_dict_json_not_serializable():
+    """Test a State with attributes which can't be serialized to JSON."""
+    state = ha.State("happy.happy", "on", {"pig": float("nan")})
+    with pytest.raises(ValueError):
+        state.as_dict_json()
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -431,6 +455,101 @@ async def test_eventbus_filtered_listener(hass):
     unsub()
 
 
+async def test_eventbus_match_all_listener_added_and_removed(hass):
+    """Test MATCH_ALL listeners are dispatched to after the first fire."""
+    calls = []
+    match_all_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def match_all_listener(event):
+        """Mock MATCH_ALL listener."""
+        match_all_calls.append(event)
+
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    unsub = hass.bus.async_listen("test", listener)
+    unsub_match_all = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+
+    hass.bus.async_fire("test")
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert [event.event_type for event in match_all_calls] == ["test"]
+
+    unsub_match_all()
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+    assert len(match_all_calls) == 1
+
+    unsub()
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+
+
+async def test_eventbus_listener_profiling(hass):
+    """Test measuring the time spent in listeners."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    async def async_listener(event):
+        """Mock coroutine listener."""
+        calls.append(event)
+
+    def thread_listener(event):
+        """Mock thread listener."""
+        calls.append(event)
+
+    hass.bus.async_listen("test", listener)
+    hass.bus.async_listen("test", async_listener)
+    hass.bus.async_listen(MATCH_ALL, thread_listener)
+    assert hass.bus.async_listener_stats() is None
+
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+    hass.bus.async_set_listener_profiling(True)
+    assert hass.bus.async_listener_stats() == []
+
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert len(calls) == 9
+
+    stats = {stat.listener: stat for stat in hass.bus.async_listener_stats()}
+    assert stats.keys() == {
+        f"{__name__}.test_eventbus_listener_profiling.<locals>.listener",
+        f"{__name__}.test_eventbus_listener_profiling.<locals>.async_listener",
+        f"{__name__}.test_eventbus_listener_profiling.<locals>.thread_listener",
+    }
+    for stat in stats.values():
+        assert stat.calls == 2
+        assert stat.total_time >= stat.max_time >= 0
+    assert {stat.event_type for stat in stats.values()} == {"test", MATCH_ALL}
+
+    hass.bus.async_set_listener_profiling(False)
+    assert hass.bus.async_listener_stats() is None
+
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert len(calls) == 12
+
+
 async def test_eventbus_unsubscribe_listener(hass):
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -665,6 +784,37 @@ async def test_statemachine_entity_ids(hass):
     assert states == ["light.bowl", "switch.ac"]
 
 
+async def test_statemachine_domain_filter(hass):
+    """Test domain filtered queries follow sets and removals."""
+    hass.states.async_set("light.bowl", "on", {})
+    hass.states.async_set("switch.ac", "off", {})
+    hass.states.async_set("light.frog", "on", {})
+    hass.states.async_set("sensor.power", "10", {})
+
+    assert hass.states.async_entity_ids("light") == ["light.bowl", "light.frog"]
+    assert hass.states.async_entity_ids("Light") == ["light.bowl", "light.frog"]
+    assert hass.states.async_entity_ids(["light", "switch", "light"]) == [
+        "light.bowl",
+        "light.frog",
+        "switch.ac",
+    ]
+    assert hass.states.async_entity_ids("cover") == []
+
+    hass.states.async_set("light.bowl", "off", {})
+    assert [state.state for state in hass.states.async_all("light")] == ["off", "on"]
+    assert hass.states.async_all("light")[0] is hass.states.get("light.bowl")
+    assert [
+        state.entity_id for state in hass.states.async_all({"sensor", "switch"})
+    ] in (["sensor.power", "switch.ac"], ["switch.ac", "sensor.power"])
+
+    hass.states.async_remove("switch.ac")
+    assert hass.states.async_entity_ids("switch") == []
+    assert hass.states.async_all("switch") == []
+
+    hass.states.async_set("switch.ac", "on", {})
+    assert hass.states.async_entity_ids("switch") == ["switch.ac"]
+
+
 async def test_statemachine_remove(hass):
     """Test remove method."""
     hass.states.async_set("light.bowl", "on", {})
@@ -728,6 +878,57 @@ async def test_statemachine_force_update(hass):
     assert len(events) == 1
 
 
+async def test_statemachine_reuses_unchanged_attributes(hass):
+    """Test unchanged attributes are shared with the previous state."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    old_state = hass.states.get("light.bowl")
+    old_json = old_state.as_dict_json()
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    state = hass.states.get("light.bowl")
+    assert state.attributes is old_state.attributes
+    assert json.loads(state.as_dict_json()) == state.as_dict()
+    assert state.as_dict_json() != old_json
+
+    # The dict representations are not shared
+    state.as_dict()["attributes"]["brightness"] = 0
+    assert old_state.as_dict()["attributes"] == {"brightness": 100}
+
+    hass.states.async_set("light.bowl", "on", state.attributes)
+    assert hass.states.get("light.bowl").attributes is old_state.attributes
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 50})
+    state = hass.states.get("light.bowl")
+    assert state.attributes == {"brightness": 50}
+    assert json.loads(state.as_dict_json())["attributes"] == {"brightness": 50}
+
+
+@pytest.mark.parametrize(
+    "old_value,new_value",
+    [
+        (1, 1.0),
+        (1, True),
+        (0.0, -0.0),
+        ([1, 2], [1, 2.0]),
+        ({"x": 1}, {"x": True}),
+        ({1}, {True}),
+        ({1, 2.0}, {1.0, 2}),
+    ],
+)
+async def test_statemachine_equal_attributes_of_other_type(hass, old_value, new_value):
+    """Test equal attribute values of another type are not replaced."""
+    hass.states.async_set("sensor.value", "1", {"x": old_value})
+    old_state = hass.states.get("sensor.value")
+
+    hass.states.async_set("sensor.value", "2", {"x": new_value})
+    state = hass.states.get("sensor.value")
+    assert state.attributes is not old_state.attributes
+    assert repr(state.attributes["x"]) == repr(new_value)
+    assert json.loads(state.as_dict_json())["attributes"] == json.loads(
+        json.dumps({"x": new_value}, cls=JSONEncoder)
+    )
+
+
 def test_service_call_repr():
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -912,6 +1113,9 @@ def test_config_defaults():
     assert config.media_dirs == {}
     assert config.safe_mode is False
     assert config.legacy_templates is False
+    assert config.template_bytecode_cache is False
+    assert config.adaptive_polling is False
+    assert config.preload_integrations is False
     assert config.currency == "EUR"
 
 
@@ -1545,6 +1749,16 @@ async def test_async_entity_ids_count(hass):
 
     assert hass.states.async_entity_ids_count() == 5
     assert hass.states.async_entity_ids_count("light") == 3
+    assert hass.states.async_entity_ids_count(["light", "vacuum", "light"]) == 4
+    assert hass.states.async_entity_ids_count("LIGHT") == 3
+    assert hass.states.async_entity_ids_count("cover") == 0
+
+    hass.states.async_remove("vacuum.floor")
+    hass.states.async_remove("light.bowl")
+
+    assert hass.states.async_entity_ids_count() == 3
+    assert hass.states.async_entity_ids_count("light") == 2
+    assert hass.states.async_entity_ids_count("vacuum") == 0
 
 
 async def test_hassjob_forbid_coroutine():
@@ -1,4 +1,7 @@
 """Test to verify that we can load components."""
+from datetime import timedelta
+import pathlib
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -6,8 +9,10 @@ import pytest
 from homeassistant import core, loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import __version__
+import homeassistant.util.dt as dt_util
 
-from tests.common import MockModule, mock_integration
+from tests.common import MockModule, async_fire_time_changed, mock_integration
 
 
 async def test_component_dependencies(hass):
@@ -540,3 +545,123 @@ async def test_custom_integration_missing(hass, caplog):
 
         with pytest.raises(loader.IntegrationNotFound):
             await loader.async_get_integration(hass, "test1")
+
+
+async def test_get_component_records_import_time(hass):
+    """Test the import time of components and platforms is recorded."""
+    integration = await loader.async_get_integration(hass, "hue")
+    integration.get_component()
+    integration.get_platform("light")
+
+    import_time = hass.data[loader.DATA_IMPORT_TIME]
+    assert set(import_time) == {"hue", "hue.light"}
+
+
+async def test_preload_integrations(hass):
+    """Test preloading imports the components in the executor."""
+    integration = await loader.async_get_integration(hass, "zodiac")
+
+    with patch.dict(sys.modules):
+        sys.modules.pop(integration.pkg_path, None)
+        await loader.async_preload_integrations(hass, [integration])
+        assert integration.pkg_path in sys.modules
+
+    assert "zodiac" in hass.data[loader.DATA_IMPORT_TIME]
+    assert "zodiac" not in hass.data.get(loader.DATA_COMPONENTS, {})
+
+
+async def test_preload_integrations_import_error(hass):
+    """Test a failing preload is left to the setup of the integration."""
+    integration = await loader.async_get_integration(hass, "zodiac")
+
+    with patch.dict(sys.modules), patch(
+        "homeassistant.loader.importlib.import_module", side_effect=ImportError
+    ):
+        sys.modules.pop(integration.pkg_path, None)
+        await loader.async_preload_integrations(hass, [integration])
+
+    assert "zodiac" not in hass.data.get(loader.DATA_IMPORT_TIME, {})
+
+
+async def test_manifest_cache_stored(hass, hass_storage, enable_custom_integrations):
+    """Test parsed manifests and custom component directories are stored."""
+    await loader.async_get_integration(hass, "zone")
+    await loader.async_get_integration(hass, "test_package")
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    data = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    assert data["ha_version"] == __version__
+    manifests = {
+        entry["manifest"]["domain"]: entry for entry in data["manifests"].values()
+    }
+    assert manifests["zone"]["manifest"]["name"] == "Zone"
+    assert "test_package" in manifests
+    assert any(
+        "test_package" in entry["names"] for entry in data["directories"].values()
+    )
+
+
+@pytest.mark.parametrize(
+    "version,mtime_offset,name",
+    [
+        (__version__, 0, "Cached Zone"),
+        (__version__, 1, "Zone"),
+        ("0.1", 0, "Zone"),
+    ],
+)
+async def test_manifest_cache_used(
+    hass, hass_storage, enable_custom_integrations, version, mtime_offset, name
+):
+    """Test cached manifests are only used when they are still valid."""
+    manifest_path = (
+        pathlib.Path(loader.__file__).parent / "components" / "zone" / "manifest.json"
+    )
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": loader.MANIFEST_CACHE_STORAGE_VERSION,
+        "data": {
+            "ha_version": version,
+            "manifests": {
+                str(manifest_path): {
+                    "mtime": manifest_path.stat().st_mtime_ns + mtime_offset,
+                    "manifest": {"domain": "zone", "name": "Cached Zone"},
+                }
+            },
+            "directories": {},
+        },
+    }
+
+    integration = await loader.async_get_integration(hass, "zone")
+    assert integration.name == name
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [],
+        {"manifests": {}, "directories": {}},
+        {"ha_version": __version__},
+        {"ha_version": __version__, "manifests": [], "directories": {}},
+        {
+            "ha_version": __version__,
+            "manifests": {"invalid": {"mtime": 1}, "other": None},
+            "directories": {"invalid": {"names": None}},
+        },
+    ],
+)
+async def test_manifest_cache_invalid(
+    hass, hass_storage, enable_custom_integrations, data
+):
+    """Test an invalid manifest cache is treated as an empty cache."""
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": loader.MANIFEST_CACHE_STORAGE_VERSION,
+        "data": data,
+    }
+
+    integration = await loader.async_get_integration(hass, "zone")
+    assert integration.name == "Zone"
+    integration = await loader.async_get_integration(hass, "test_package")
+    assert integration.domain == "test_package"
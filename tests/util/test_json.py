@@ -76,6 +76,24 @@ def test_overwrite_and_reload():
     assert data == TEST_JSON_B
 
 
+def test_save_and_load_non_finite():
+    """Test NaN and Infinity survive saving and loading back."""
+    fname = _path_for("test4")
+    save_json(fname, {"nan": math.nan, "inf": [-math.inf], "none": None})
+    data = load_json(fname)
+    assert math.isnan(data["nan"])
+    assert data["inf"] == [-math.inf]
+    assert data["none"] is None
+
+
+def test_save_indented():
+    """Test files are indented with four spaces like the json module does."""
+    fname = _path_for("test5")
+    save_json(fname, TEST_JSON_A)
+    with open(fname, encoding="utf-8") as fil:
+        assert fil.read() == dumps(TEST_JSON_A, indent=4)
+
+
 def test_save_bad_data():
     """Test error from trying to save unserialisable data."""
     with pytest.raises(SerializationError) as excinfo: